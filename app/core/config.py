@@ -3,7 +3,14 @@ from dotenv import load_dotenv
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-print("BASE_DIR", BASE_DIR)
+def to_async_database_url(url: str) -> str:
+    """
+    동기 DB URL(postgresql:// 또는 postgresql+psycopg2://)을 asyncpg 드라이버 URL로 변환
+    """
+    if not url:
+        return url
+    scheme, sep, rest = url.partition("://")
+    return f"postgresql+asyncpg{sep}{rest}" if scheme.startswith("postgres") else url
 
 class Config:
     """
@@ -12,14 +19,106 @@ class Config:
     def __init__(self):
         # DB 환경변수
         self.DATABASE_URL: str = os.getenv("DATABASE_URL")
+        # 비동기(asyncpg) DB URL, 미설정 시 DATABASE_URL 에서 변환
+        self.ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL") or to_async_database_url(self.DATABASE_URL)
+
+        # DB 커넥션 풀 설정 (동기/비동기 엔진 각각에 적용)
+        self.DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        self.DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+        # 커넥션별 statement_timeout (ms, 0 이면 미설정)
+        self.DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+        # 워커 기동 시 미리 생성할 커넥션 수 (DB_POOL_SIZE 이하로 적용, 0 이면 미사용)
+        self.DB_POOL_WARMUP: int = int(os.getenv("DB_POOL_WARMUP", "5"))
+
+        # 읽기 전용 복제본 DB URL 목록 (콤마 구분, 미설정 시 모든 요청을 primary 로 처리)
+        self.DATABASE_REPLICA_URLS: list = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+        # 복제본 연결 실패 시 제외 시간 (초) / 연결 타임아웃 (초)
+        self.DB_REPLICA_COOLDOWN: float = float(os.getenv("DB_REPLICA_COOLDOWN", "30"))
+        self.DB_REPLICA_CONNECT_TIMEOUT: float = float(os.getenv("DB_REPLICA_CONNECT_TIMEOUT", "2"))
+        # 쓰기 요청 후 해당 사용자의 읽기를 primary 로 고정하는 시간 (초, read-your-writes)
+        self.DB_PRIMARY_PIN_SECONDS: int = int(os.getenv("DB_PRIMARY_PIN_SECONDS", "5"))
         self.SECRET_KEY: str = os.getenv("SECRET_KEY")
         self.ALGORITHM: str = 'HS256'
+        # /internal/* 운영 지표 조회용 공유 비밀값 (X-Internal-Token 헤더, 미설정 시 /internal/* 비활성화)
+        self.INTERNAL_API_TOKEN: str = os.getenv("INTERNAL_API_TOKEN", "")
         self.ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+        # 리프레시 토큰 유효기간 (일) / 만료 토큰 삭제 주기 (초) 및 한번에 삭제할 행 수
+        self.REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
+        self.TOKEN_SWEEP_INTERVAL: int = int(os.getenv("TOKEN_SWEEP_INTERVAL", "3600"))
+        self.TOKEN_SWEEP_BATCH_SIZE: int = int(os.getenv("TOKEN_SWEEP_BATCH_SIZE", "1000"))
+        # 비밀번호 해시(argon2id) 비용 / 워커별 해시 스레드 수, 최대 대기 요청 수, 대기 시간 제한 (초과 시 503)
+        self.ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", "2"))
+        self.ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", "19456"))  # KiB
+        self.PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+        self.PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+        self.PASSWORD_HASH_QUEUE_TIMEOUT: float = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "5"))
+        # 닉네임 외부 API 미리 받아 두기 (URL 미설정 시 번들 단어 목록으로만 생성) / 가입 시 중복 확인 후보 수
+        self.NICKNAME_PREFETCH_URL: str = os.getenv("NICKNAME_PREFETCH_URL", "")
+        self.NICKNAME_PREFETCH_SIZE: int = int(os.getenv("NICKNAME_PREFETCH_SIZE", "20"))
+        self.NICKNAME_PREFETCH_TIMEOUT: float = float(os.getenv("NICKNAME_PREFETCH_TIMEOUT", "3"))
+        self.NICKNAME_PREFETCH_INTERVAL: int = int(os.getenv("NICKNAME_PREFETCH_INTERVAL", "10"))
+        self.NICKNAME_CANDIDATES: int = int(os.getenv("NICKNAME_CANDIDATES", "8"))
+        # 후보가 모두 사용 중일 때 재시도 횟수 (재시도마다 닉네임 숫자 자리수를 1씩 늘림, 모두 실패하면 503)
+        self.NICKNAME_PICK_ATTEMPTS: int = int(os.getenv("NICKNAME_PICK_ATTEMPTS", "5"))
+        # 검증된 액세스 토큰 캐시 최대 항목 수 (워커별, 0 이면 미사용)
+        self.JWT_CACHE_MAX_SIZE: int = int(os.getenv("JWT_CACHE_MAX_SIZE", "10000"))
 
         self.aws_access_key_id: str = os.getenv("AWS_ACCESS_KEY_ID")
         self.aws_secret_access_key: str = os.getenv("AWS_SECRET_ACCESS_KEY")
         self.aws_region: str = os.getenv("AWS_REGION")
         self.aws_bucket_name: str = os.getenv("AWS_BUCKET_NAME")
+        # 로컬 S3 호환 서버 주소 (테스트용, 미설정 시 AWS)
+        self.aws_s3_endpoint_url: str = os.getenv("AWS_S3_ENDPOINT_URL", "")
+        # 업로드 스레드 수 (워커별) / S3 커넥션 풀 크기 (업로드 스레드 x 동시 파트 수 이상)
+        self.S3_UPLOAD_WORKERS: int = int(os.getenv("S3_UPLOAD_WORKERS", "4"))
+        self.S3_MAX_POOL_CONNECTIONS: int = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "20"))
+        # multipart 업로드 기준 크기, 파트 크기 (최소 5MB), 업로드당 동시 전송 파트 수
+        self.S3_MULTIPART_THRESHOLD: int = int(os.getenv("S3_MULTIPART_THRESHOLD", str(8 * 1024 * 1024)))
+        self.S3_MULTIPART_CHUNKSIZE: int = int(os.getenv("S3_MULTIPART_CHUNKSIZE", str(8 * 1024 * 1024)))
+        self.S3_MAX_CONCURRENCY: int = int(os.getenv("S3_MAX_CONCURRENCY", "4"))
+        # 스트리밍 업로드 시 업로드 스레드로 넘기기 전 대기시킬 수 있는 요청 본문 청크 수
+        self.S3_STREAM_MAX_CHUNKS: int = int(os.getenv("S3_STREAM_MAX_CHUNKS", "16"))
+        # 업로드 파일 최대 크기 (bytes)
+        self.FILE_MAX_UPLOAD_BYTES: int = int(os.getenv("FILE_MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)))
+        # presigned 업로드 허용 파일 종류 / presigned URL 유효 시간 (초)
+        self.FILE_ALLOWED_CONTENT_TYPES: list = [
+            content_type.strip()
+            for content_type in os.getenv("FILE_ALLOWED_CONTENT_TYPES", "image/jpeg,image/png,image/gif,image/webp,image/heic").split(",")
+            if content_type.strip()
+        ]
+        self.S3_PRESIGNED_EXPIRES: int = int(os.getenv("S3_PRESIGNED_EXPIRES", "600"))
+
+        # 커뮤니티 상위 게시물 뷰 갱신 주기 (초)
+        self.COMMUNITY_TOP_POSTS_REFRESH_INTERVAL: int = int(os.getenv("COMMUNITY_TOP_POSTS_REFRESH_INTERVAL", "60"))
+
+        # 인기(trending) 게시물 점수 가중치 / 후보 재적재 주기 (초)
+        self.TRENDING_LIKE_WEIGHT: float = float(os.getenv("TRENDING_LIKE_WEIGHT", "1.0"))
+        self.TRENDING_COMMENT_WEIGHT: float = float(os.getenv("TRENDING_COMMENT_WEIGHT", "2.0"))
+        self.TRENDING_RELOAD_INTERVAL: int = int(os.getenv("TRENDING_RELOAD_INTERVAL", "60"))
+
+        # 사용자 프로필/게시물/반려동물 상세 프로세스 내 캐시 (TTL 초, 캐시별 최대 항목 수, 0 이면 미사용)
+        self.ENTITY_CACHE_TTL: int = int(os.getenv("ENTITY_CACHE_TTL", "300"))
+        self.ENTITY_CACHE_MAX_SIZE: int = int(os.getenv("ENTITY_CACHE_MAX_SIZE", "10000"))
+        # 좋아요 수처럼 자주 바뀌는 키의 다른 워커 캐시 무효화 알림을 모아서 보내는 주기 (밀리초)
+        self.CACHE_INVALIDATION_FLUSH_MS: int = int(os.getenv("CACHE_INVALIDATION_FLUSH_MS", "500"))
+
+        # 피드(getAllPosts) 페이지 캐시 (TTL 초, 최대 페이지 수, 0 이면 미사용)
+        self.FEED_CACHE_TTL: int = int(os.getenv("FEED_CACHE_TTL", "60"))
+        self.FEED_CACHE_MAX_PAGES: int = int(os.getenv("FEED_CACHE_MAX_PAGES", "2000"))
+
+        # 좋아요 수 write-behind 모드 (증감값을 모아서 일괄 반영)
+        self.LIKE_WRITE_BEHIND: bool = os.getenv("LIKE_WRITE_BEHIND", "false").lower() in ("1", "true", "yes")
+        self.LIKE_FLUSH_INTERVAL_MS: int = int(os.getenv("LIKE_FLUSH_INTERVAL_MS", "200"))
+        self.LIKE_FLUSH_MAX_EVENTS: int = int(os.getenv("LIKE_FLUSH_MAX_EVENTS", "500"))
+        # write-behind 모드에서 보정 작업이 건너뛸 최근 좋아요 구간 (초, 다른 워커에 반영 대기 중인 증감값과 중복 보정 방지)
+        self.LIKE_RECONCILE_GRACE_SECONDS: int = int(os.getenv("LIKE_RECONCILE_GRACE_SECONDS", "10"))
+
+        # 댓글 수 카운터 보정 작업
+        self.COMMENT_CNT_RECONCILE_INTERVAL: int = int(os.getenv("COMMENT_CNT_RECONCILE_INTERVAL", "3600"))
+        self.COMMENT_CNT_RECONCILE_BATCH_SIZE: int = int(os.getenv("COMMENT_CNT_RECONCILE_BATCH_SIZE", "1000"))
 
 
 class LocalConfig(Config):
@@ -42,6 +141,7 @@ class DevConfig(Config):
         self.PROJECT_RELOAD: bool = True
         self.DATABASE_ECHO: bool = True
         self.LOG_LEVEL: str = "INFO"
+        self.DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "10000"))
 
 
 class ProdConfig(Config):
@@ -53,6 +153,10 @@ class ProdConfig(Config):
         self.PROJECT_RELOAD: bool = False
         self.DATABASE_ECHO: bool = False
         self.LOG_LEVEL: str = "WARNING"
+        self.DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+        self.DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "5"))
+        self.DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
 
 
 def get_config(env):
@@ -73,6 +177,4 @@ def get_config(env):
 
 # 실행 환경 체크 후 config setting
 env = os.getenv("ENV", "LOCAL")
-
-print("env", env)
 settings = get_config(env)
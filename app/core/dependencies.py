@@ -0,0 +1,57 @@
+# core/dependencies.py
+
+import hmac
+from typing import Optional
+from fastapi import Depends, Header, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.config import settings
+from db.replica import get_async_read_db
+from schemas.user_schema import UserResponseWithFile
+from services.user_service import get_user_and_file_info_async
+from utils.error_code import ErrorCode, raise_error
+from utils.jwt import verify_access_token
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+
+async def get_current_uid(token: str = Depends(oauth2_scheme)) -> str:
+    """
+    * method:   get_current_uid
+    * purpose:  Authorization: Bearer 토큰을 검증하고 uid 반환 (검증된 토큰은 워커별로 캐시되어 DB 조회 없음)
+    """
+    return verify_access_token(token)
+
+def ensure_current_user(uid: Optional[str], current_uid: str):
+    """
+    * method:   ensure_current_user
+    * purpose:  요청에 담긴 uid (경로, 본문, 리소스 소유자) 가 액세스 토큰의 사용자와 다르면 403
+    """
+    if uid != current_uid:
+        raise_error(ErrorCode.FORBIDDEN_USER)
+
+async def get_current_user(
+    uid: str = Depends(get_current_uid),
+    db: AsyncSession = Depends(get_async_read_db)
+) -> UserResponseWithFile:
+    """
+    * method:   get_current_user
+    * purpose:  인증된 사용자 정보 (사용자 프로필 캐시 사용), 탈퇴 등으로 사용자가 없으면 401
+    """
+    user = await get_user_and_file_info_async(db, uid)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+async def verify_internal_token(x_internal_token: Optional[str] = Header(None)):
+    """
+    * method:   verify_internal_token
+    * purpose:  /internal/* 요청의 X-Internal-Token 헤더를 INTERNAL_API_TOKEN 과 비교 (미설정 시 404, 불일치 시 401)
+    """
+    if not settings.INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_internal_token is None or not hmac.compare_digest(x_internal_token.encode(), settings.INTERNAL_API_TOKEN.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid internal token")
@@ -0,0 +1,50 @@
+# db/migrate.py
+# 사용법 (app 디렉토리에서 실행): python -m db.migrate
+
+import os
+import logging
+from sqlalchemy import text
+from db.session import engine
+from models import Base
+from models import user, pets, tokens, posts, postComments, postLikes, images, file  # noqa: F401 (테이블 등록)
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+def get_migration_files():
+    return sorted(f for f in os.listdir(MIGRATIONS_DIR) if f.endswith(".sql"))
+
+def migrate():
+    """
+    * method:   migrate
+    * purpose:  기본 스키마 생성 후 migrations/*.sql 을 버전 순서대로 한번씩 적용
+    """
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            " version VARCHAR(200) PRIMARY KEY,"
+            " applied_at TIMESTAMP NOT NULL DEFAULT now())"
+        ))
+        applied = {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+    for filename in get_migration_files():
+        version = filename[:-len(".sql")]
+        if version in applied:
+            continue
+
+        with open(os.path.join(MIGRATIONS_DIR, filename), encoding="utf-8") as f:
+            sql = f.read()
+
+        # 파일 단위로 하나의 트랜잭션에서 적용
+        with engine.begin() as conn:
+            conn.connection.cursor().execute(sql)
+            conn.execute(text("INSERT INTO schema_migrations (version) VALUES (:version)"), {"version": version})
+
+        logger.info(f"Applied migration: {version}")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    migrate()
@@ -0,0 +1,23 @@
+-- 게시물 댓글 수 / 댓글 답글 수 비정규화 컬럼
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS comment_cnt INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE "postComments" ADD COLUMN IF NOT EXISTS reply_cnt INTEGER NOT NULL DEFAULT 0;
+
+-- 기존 데이터 백필
+UPDATE posts p
+SET comment_cnt = c.cnt
+FROM (
+    SELECT post_id, count(*) AS cnt
+    FROM "postComments"
+    GROUP BY post_id
+) c
+WHERE p.post_id = c.post_id;
+
+UPDATE "postComments" p
+SET reply_cnt = c.cnt
+FROM (
+    SELECT parent_id, count(*) AS cnt
+    FROM "postComments"
+    WHERE parent_id IS NOT NULL
+    GROUP BY parent_id
+) c
+WHERE p.comment_id = c.parent_id;
@@ -0,0 +1,2 @@
+-- 사용자별 기간 조회 (journey / 캘린더)
+CREATE INDEX IF NOT EXISTS ix_posts_uid_created_at ON posts (uid, created_at);
@@ -0,0 +1,28 @@
+-- 커뮤니티 탭 상위 게시물 (이미지가 있는 최신 게시물 10개)
+-- 백그라운드 작업에서 REFRESH MATERIALIZED VIEW CONCURRENTLY 로 갱신
+CREATE MATERIALIZED VIEW IF NOT EXISTS community_top_posts AS
+SELECT
+    p.post_id,
+    p.uid,
+    u.user_name,
+    pf.file_url AS profile_image_url,
+    p.title,
+    p.content,
+    f.file_name,
+    f.file_url,
+    p.created_at
+FROM posts p
+JOIN users u ON u.uid = p.uid
+LEFT JOIN file pf ON pf.file_id = u.profile_image
+JOIN LATERAL (
+    SELECT min(i.file_id) AS first_file_id
+    FROM images i
+    WHERE i.image_id = p.post_id
+) fi ON fi.first_file_id IS NOT NULL
+JOIN file f ON f.file_id::text = fi.first_file_id::text
+ORDER BY p.created_at DESC
+LIMIT 10
+WITH DATA;
+
+-- CONCURRENTLY 갱신을 위한 유니크 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS ux_community_top_posts_post_id ON community_top_posts (post_id);
@@ -0,0 +1,20 @@
+-- 중복 좋아요 제거 후 (post_id, uid) 유니크 인덱스 추가
+DELETE FROM "postLikes" a
+USING "postLikes" b
+WHERE a.post_id = b.post_id
+  AND a.uid = b.uid
+  AND a.id > b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_postlikes_post_id_uid ON "postLikes" (post_id, uid);
+
+-- 좋아요 취소 시 카운터가 증가하던 문제로 어긋난 값 재계산
+UPDATE posts p
+SET post_likes = l.cnt
+FROM (
+    SELECT p2.post_id, count(l2.id) AS cnt
+    FROM posts p2
+    LEFT JOIN "postLikes" l2 ON l2.post_id = p2.post_id
+    GROUP BY p2.post_id
+) l
+WHERE p.post_id = l.post_id
+  AND p.post_likes <> l.cnt;
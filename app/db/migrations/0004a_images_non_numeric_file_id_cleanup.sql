@@ -0,0 +1,22 @@
+-- 0005 에서 images.file_id 를 정수형으로 바꾸기 전에 숫자가 아닌 file_id 행을 정리
+-- (파일과 연결될 수 없어 조회되지 않던 행). 삭제 전에 images_non_numeric_file_id_backup 테이블로 백업
+-- 0005 가 이미 적용된 DB 에서는 정리할 행이 없으므로 빈 백업 테이블만 생성됨
+CREATE TABLE IF NOT EXISTS images_non_numeric_file_id_backup (
+    LIKE images,
+    backed_up_at TIMESTAMP NOT NULL DEFAULT now()
+);
+
+DO $$
+DECLARE
+    moved INTEGER;
+BEGIN
+    INSERT INTO images_non_numeric_file_id_backup
+    SELECT i.* FROM images i WHERE i.file_id::text !~ '^[0-9]+$';
+    GET DIAGNOSTICS moved = ROW_COUNT;
+
+    DELETE FROM images WHERE file_id::text !~ '^[0-9]+$';
+
+    IF moved > 0 THEN
+        RAISE NOTICE 'moved % images rows with non-numeric file_id to images_non_numeric_file_id_backup', moved;
+    END IF;
+END $$;
@@ -0,0 +1,55 @@
+-- images.file_id 를 file.file_id 와 같은 정수형으로 변경 (조인 시 캐스팅 제거)
+-- community_top_posts 뷰가 images.file_id 를 참조하므로 먼저 삭제 후 재생성
+DROP MATERIALIZED VIEW IF EXISTS community_top_posts;
+
+-- 숫자가 아닌 file_id 행은 0004a 에서 백업 후 정리됨 (남아 있으면 아래 변환이 실패하고 마이그레이션 중단)
+
+ALTER TABLE images ALTER COLUMN file_id TYPE INTEGER USING file_id::integer;
+
+CREATE MATERIALIZED VIEW community_top_posts AS
+SELECT
+    p.post_id,
+    p.uid,
+    u.user_name,
+    pf.file_url AS profile_image_url,
+    p.title,
+    p.content,
+    f.file_name,
+    f.file_url,
+    p.created_at
+FROM posts p
+JOIN users u ON u.uid = p.uid
+LEFT JOIN file pf ON pf.file_id = u.profile_image
+JOIN LATERAL (
+    SELECT min(i.file_id) AS first_file_id
+    FROM images i
+    WHERE i.image_id = p.post_id
+) fi ON fi.first_file_id IS NOT NULL
+JOIN file f ON f.file_id = fi.first_file_id
+ORDER BY p.created_at DESC
+LIMIT 10
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_community_top_posts_post_id ON community_top_posts (post_id);
+
+-- 게시물: 사용자별 피드 / journey (uid, created_at, post_id) — 기존 (uid, created_at) 인덱스 대체
+CREATE INDEX IF NOT EXISTS ix_posts_uid_created_at_post_id ON posts (uid, created_at, post_id);
+DROP INDEX IF EXISTS ix_posts_uid_created_at;
+
+-- 게시물: 기간 조회 (trending 후보 적재, 상위 게시물 뷰)
+CREATE INDEX IF NOT EXISTS ix_posts_created_at ON posts (created_at);
+
+-- 댓글: 게시물별 댓글 목록 / 답글 목록 (키셋 정렬 키 포함)
+CREATE INDEX IF NOT EXISTS ix_postcomments_post_id_created_at ON "postComments" (post_id, created_at, comment_id);
+CREATE INDEX IF NOT EXISTS ix_postcomments_parent_id_created_at ON "postComments" (parent_id, created_at, comment_id);
+
+-- 토큰: 사용자별 토큰 삭제 (리프레시 토큰 조회 인덱스는 0006 의 refresh_token_hash unique 인덱스로 대체)
+CREATE INDEX IF NOT EXISTS ix_tokens_uid ON tokens (uid);
+
+-- 반려동물: 사용자별 반려동물 목록
+CREATE INDEX IF NOT EXISTS ix_pets_uid ON pets (uid);
+
+-- 다음 인덱스는 이미 존재하므로 추가하지 않음
+--   images (image_id, file_id) 기본키      → image_id 조회
+--   "postLikes" (post_id, uid) 유니크 인덱스 → 좋아요 여부 / 게시물별 좋아요 수
+--   users (email) 유니크 제약             → 이메일 조회
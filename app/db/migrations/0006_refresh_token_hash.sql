@@ -0,0 +1,36 @@
+-- 리프레시 토큰을 원문 대신 sha256 해시(hex 64자)로 저장하고 만료 시각 추가
+-- 조회/교체는 refresh_token_hash unique 인덱스, 만료 토큰 삭제는 expires_at 인덱스 사용
+ALTER TABLE tokens ADD COLUMN IF NOT EXISTS refresh_token_hash VARCHAR(64);
+ALTER TABLE tokens ADD COLUMN IF NOT EXISTS expires_at TIMESTAMP;
+
+-- 기존 행 백필 (신규 DB 는 모델 기준으로 refresh_token 컬럼 없이 생성되므로 건너뜀)
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'tokens' AND column_name = 'refresh_token'
+    ) THEN
+        UPDATE tokens
+        SET refresh_token_hash = encode(sha256(convert_to(refresh_token, 'UTF8')), 'hex')
+        WHERE refresh_token_hash IS NULL;
+
+        DROP INDEX IF EXISTS ix_tokens_refresh_token;
+        ALTER TABLE tokens DROP COLUMN refresh_token;
+    END IF;
+END $$;
+
+-- 기존 리프레시 토큰 유효기간 (7일) 기준
+UPDATE tokens
+SET expires_at = COALESCE(updated_at, created_at, timezone('UTC', now())) + interval '7 days'
+WHERE expires_at IS NULL;
+
+-- 같은 초에 발급되어 동일했던 토큰은 마지막 세션만 유지
+DELETE FROM tokens t
+USING tokens d
+WHERE t.refresh_token_hash = d.refresh_token_hash AND t.session_id < d.session_id;
+
+ALTER TABLE tokens ALTER COLUMN refresh_token_hash SET NOT NULL;
+ALTER TABLE tokens ALTER COLUMN expires_at SET NOT NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ix_tokens_refresh_token_hash ON tokens (refresh_token_hash);
+CREATE INDEX IF NOT EXISTS ix_tokens_expires_at ON tokens (expires_at);
@@ -0,0 +1,3 @@
+-- argon2id 해시(약 100자) 저장을 위해 비밀번호 컬럼 확장 (varchar 길이 확장은 테이블 재작성 없음)
+-- 기존 SHA-256 hex 해시는 그대로 두고 로그인 성공 시 argon2id 로 교체
+ALTER TABLE users ALTER COLUMN password TYPE VARCHAR(255);
@@ -0,0 +1,2 @@
+-- 사용자: 가입 시 닉네임 후보 중복 확인 (user_name IN (...))
+CREATE INDEX IF NOT EXISTS ix_users_user_name ON users (user_name);
@@ -0,0 +1,5 @@
+-- presigned 업로드: 업로드 URL 발급 시 대기(0) 상태로 생성하고, 업로드 확인(HEAD) 후 완료(1)로 변경
+-- 기존 파일은 모두 API 서버를 통해 업로드가 끝난 파일이므로 완료(1)
+ALTER TABLE file ADD COLUMN IF NOT EXISTS status INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE file ADD COLUMN IF NOT EXISTS size BIGINT;
+ALTER TABLE file ADD COLUMN IF NOT EXISTS content_type VARCHAR(100);
@@ -0,0 +1,3 @@
+-- 게시물 ID 생성기 워커ID 발급용 시퀀스 (프로세스마다 기동 후 1회 nextval, 0~99999 순환)
+-- pid 하위 자리 기반 워커ID 는 같은 호스트의 프로세스끼리 겹칠 수 있어 대체
+CREATE SEQUENCE IF NOT EXISTS id_worker_seq MINVALUE 0 MAXVALUE 99999 START WITH 0 CYCLE;
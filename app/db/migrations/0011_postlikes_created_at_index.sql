@@ -0,0 +1,2 @@
+-- 최근 좋아요 조회용 인덱스 (write-behind 모드의 좋아요 수 보정 작업이 반영 대기 중일 수 있는 게시물을 건너뛸 때 사용)
+CREATE INDEX IF NOT EXISTS ix_postlikes_created_at ON "postLikes" (created_at);
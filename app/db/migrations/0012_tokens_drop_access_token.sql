@@ -0,0 +1,2 @@
+-- 액세스 토큰 원문은 저장하지 않음 (서명/만료로만 검증하며 조회하는 곳이 없음, 유출 시 그대로 사용 가능)
+ALTER TABLE tokens DROP COLUMN IF EXISTS access_token;
@@ -0,0 +1,16 @@
+-- 사용자: 닉네임(user_name) 중복 방지 (가입 시 중복 확인과 저장 사이의 경합은 unique 인덱스로 막고 새 후보로 재시도)
+-- 이미 중복된 닉네임이 있으면 임의로 바꾸지 않고 마이그레이션을 중단 (중복 정리 후 다시 실행)
+DO $$
+DECLARE
+    duplicates INTEGER;
+BEGIN
+    SELECT count(*) INTO duplicates FROM (
+        SELECT user_name FROM users GROUP BY user_name HAVING count(*) > 1
+    ) d;
+    IF duplicates > 0 THEN
+        RAISE EXCEPTION '% duplicated users.user_name values, resolve them before creating the unique index', duplicates;
+    END IF;
+END $$;
+
+DROP INDEX IF EXISTS ix_users_user_name;
+CREATE UNIQUE INDEX ix_users_user_name ON users (user_name);
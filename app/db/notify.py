@@ -0,0 +1,211 @@
+# db/notify.py
+# Postgres LISTEN/NOTIFY 기반 캐시 무효화
+# - 쓰기 트랜잭션 안에서 pg_notify 로 변경된 키를 알림 (커밋된 경우에만 전달, 롤백 시 전달되지 않음)
+# - 워커마다 전용 커넥션으로 LISTEN 하는 스레드가 알림을 받아 utils/cache.py 의 캐시에서 해당 키 제거
+# - 알림을 보낸 워커는 커밋 직후 자기 캐시를 바로 비워서 알림 수신 전에도 변경 내용을 조회하도록 함
+# - 좋아요 수처럼 자주 바뀌는 키는 publish_invalidation_coalesced 로 모아서 주기적으로 한 번에 알림
+
+import logging
+import select
+import threading
+from typing import Dict, Iterable, List, Set
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from db.session import engine
+from utils.cache import caches, get_cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_INVALIDATE_CHANNEL = "entity_cache_invalidate"
+MAX_PAYLOAD_BYTES = 7900  # NOTIFY payload 최대 8000 bytes
+_PENDING_KEY = "cache_invalidations"
+_COALESCED_KEY = "cache_invalidations_coalesced"
+
+def _payloads(cache_name: str, keys: List[str]) -> List[str]:
+    # "cache_name:key1,key2,..." 형식, payload 크기 제한에 맞춰 분할
+    payloads = []
+    chunk = []
+    length = len(cache_name) + 1
+    for key in keys:
+        if chunk and length + len(key.encode()) + 1 > MAX_PAYLOAD_BYTES:
+            payloads.append(f"{cache_name}:{','.join(chunk)}")
+            chunk = []
+            length = len(cache_name) + 1
+        chunk.append(key)
+        length += len(key.encode()) + 1
+    if chunk:
+        payloads.append(f"{cache_name}:{','.join(chunk)}")
+    return payloads
+
+def publish_invalidation(db: Session, cache_name: str, keys: Iterable):
+    """
+    * method:   publish_invalidation
+    * purpose:  현재 트랜잭션이 커밋되면 모든 워커/호스트의 cache_name 캐시에서 keys 를 제거하도록 알림
+                (커밋은 호출하는 쪽에서)
+    """
+    cache = get_cache(cache_name)
+    if cache is None or not cache.enabled:
+        return
+    keys = [str(key) for key in keys]
+    for payload in _payloads(cache_name, keys):
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CACHE_INVALIDATE_CHANNEL, "payload": payload})
+    db.info.setdefault(_PENDING_KEY, []).append((cache, keys))
+
+def publish_invalidation_coalesced(db: Session, cache_name: str, keys: Iterable):
+    """
+    * method:   publish_invalidation_coalesced
+    * purpose:  publish_invalidation 과 같지만 트랜잭션마다 NOTIFY 하지 않음
+                커밋되면 자기 워커 캐시는 바로 비우고, 다른 워커 알림은 invalidation_batcher 가 모아서 한 번에 발행
+                (다른 워커의 캐시는 최대 CACHE_INVALIDATION_FLUSH_MS 만큼 늦게 갱신됨)
+    """
+    cache = get_cache(cache_name)
+    if cache is None or not cache.enabled:
+        return
+    db.info.setdefault(_COALESCED_KEY, []).append((cache, [str(key) for key in keys]))
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_local(session: Session):
+    for cache, keys in session.info.pop(_PENDING_KEY, []):
+        for key in keys:
+            cache.invalidate(key)
+    for cache, keys in session.info.pop(_COALESCED_KEY, []):
+        for key in keys:
+            cache.invalidate(key)
+        invalidation_batcher.add(cache.name, keys)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_COALESCED_KEY, None)
+
+class InvalidationBatcher:
+    """
+    다른 워커로 보낼 캐시 무효화 키를 모아 두었다가 flush 때 캐시별로 한 번에 NOTIFY (워커마다 1개)
+    - 같은 키가 여러 번 바뀌어도 알림은 1번 (좋아요가 몰려도 NOTIFY 수는 flush 주기로 제한)
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys: Dict[str, Set[str]] = {}
+        self.published = 0
+
+    def add(self, cache_name: str, keys: Iterable[str]):
+        with self._lock:
+            self._keys.setdefault(cache_name, set()).update(keys)
+
+    def flush(self, db: Session) -> int:
+        """
+        * method:   flush
+        * purpose:  모아 둔 키의 무효화 알림을 발행하고 발행한 키 수를 반환
+        """
+        with self._lock:
+            batch = self._keys
+            self._keys = {}
+        if not batch:
+            return 0
+
+        try:
+            for cache_name, keys in batch.items():
+                publish_invalidation(db, cache_name, sorted(keys))
+            db.commit()
+        except Exception:
+            db.rollback()
+            # 실패한 키는 다음 flush 때 다시 발행
+            for cache_name, keys in batch.items():
+                self.add(cache_name, keys)
+            raise
+        published = sum(len(keys) for keys in batch.values())
+        self.published += published
+        return published
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"pending": sum(len(keys) for keys in self._keys.values()), "published": self.published}
+
+invalidation_batcher = InvalidationBatcher()
+
+class InvalidationListener:
+    """
+    캐시 무효화 알림 수신 스레드 (워커마다 1개)
+    - 연결이 끊기면 reconnect_delay 후 재연결하고, 연결되지 않은 동안의 알림은 유실되므로 연결 시마다 전체 캐시를 비움
+    """
+    def __init__(self, channel: str, reconnect_delay: float = 5.0, poll_interval: float = 1.0):
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.poll_interval = poll_interval
+        self.received = 0
+        self.connects = 0
+        self.connected = False
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def _connect(self):
+        # 풀에서 분리한 커넥션을 LISTEN 전용으로 사용 (풀 크기에 영향 없음)
+        connection = engine.raw_connection()
+        connection.detach()
+        dbapi_connection = connection.dbapi_connection
+        dbapi_connection.autocommit = True
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self.channel}"')
+        return dbapi_connection
+
+    def handle(self, payload: str):
+        cache_name, _, keys = payload.partition(":")
+        cache = get_cache(cache_name)
+        if cache is None:
+            return
+        for key in keys.split(","):
+            cache.invalidate(key)
+
+    def _listen(self, connection):
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([connection], [], [], self.poll_interval)
+            if not readable:
+                continue
+            connection.poll()
+            while connection.notifies:
+                notify = connection.notifies.pop(0)
+                self.received += 1
+                self.handle(notify.payload)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            connection = None
+            try:
+                connection = self._connect()
+                for cache in caches.values():
+                    cache.clear()
+                self.connects += 1
+                self.connected = True
+                self._listen(connection)
+            except Exception:
+                logger.exception("Cache invalidation listener disconnected")
+            finally:
+                self.connected = False
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            self._stopped.wait(self.reconnect_delay)
+
+    def start(self):
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="cache-invalidation-listener", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            "channel": self.channel,
+            "connected": self.connected,
+            "received": self.received,
+            "connects": self.connects,
+        }
+
+cache_invalidation_listener = InvalidationListener(CACHE_INVALIDATE_CHANNEL)
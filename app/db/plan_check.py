@@ -0,0 +1,236 @@
+# db/plan_check.py
+# 사용법 (app 디렉토리에서 실행, 마이그레이션 적용된 DB 필요): python -m db.plan_check [--scale 1.0]
+#
+# 대량 데이터를 트랜잭션 안에서 생성/ANALYZE 한 뒤 services/ 의 주요 조회 함수를 실제로 실행하고,
+# 실행된 SQL 을 EXPLAIN 하여 주요 테이블을 Seq Scan 하는 쿼리가 있으면 실패(exit 1) 처리
+# 모든 작업은 마지막에 롤백되므로 기존 데이터와 통계에는 영향 없음 (CI 의 임시 DB 에서 실행 권장)
+# CI 에서는 같은 검사를 pytest 로 실행 (tests/test_plan_check.py)
+
+import argparse
+import json
+import logging
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, List, Optional, Tuple
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from core.config import settings
+from db.session import engine
+from models import user, pets, tokens, posts, postComments, postLikes, images, file  # noqa: F401 (테이블 등록)
+from services.auth_service import get_token_by_refresh_token, rotate_refresh_token, delete_expired_tokens
+from services.pet_service import get_pet_by_id_with_file
+from services.post_service import get_paginated_posts, get_paginated_posts2, get_journey, get_journey_calendar, get_post_by_id
+from services.postComment_service import get_paging_postcomment, reconcile_comment_counters
+from services.postLike_service import reconcile_like_counters
+from services.trending_service import TrendingEngine
+from services.user_service import get_user_by_email, get_user_and_file_info, get_pets_by_user_id, pick_available_nickname
+from utils.cache import caches
+from utils.dataloader import clear_loaders
+
+logger = logging.getLogger(__name__)
+
+# Seq Scan 이 허용되지 않는 테이블
+CHECKED_TABLES = {"posts", "postComments", "postLikes", "images", "file", "users", "tokens", "pets"}
+
+SEED_SQL = """
+INSERT INTO users (uid, user_name, email, password, status, created_at, updated_at)
+SELECT 'plan_u' || n, 'user' || n, 'plan_u' || n || '@plan.check', repeat('x', 64), 1, now(), now()
+FROM generate_series(1, :users) n;
+
+INSERT INTO file (file_name, file_url, uid, created_at)
+SELECT 'plan/' || n || '.jpg', 'https://plan.check/' || n || '.jpg', 'plan_u' || (n % :users + 1), now()
+FROM generate_series(1, :posts) n;
+
+UPDATE users u SET profile_image = f.file_id
+FROM file f
+WHERE f.file_name = 'plan/' || substr(u.uid, 7) || '.jpg' AND u.uid LIKE 'plan_u%';
+
+INSERT INTO posts (post_id, uid, created_at, is_deleted, last_updated, post_likes, post_shares, comment_cnt, visibility, title, content)
+SELECT to_char(now() - n * interval '5 minutes', 'YYYYMMDDHH24MISSMS') || lpad(n::text, 8, '0'),
+       'plan_u' || (n % :users + 1),
+       timezone('UTC', now()) - n * interval '5 minutes',
+       0, now(), 0, 0, 0,
+       (CASE WHEN n % 10 = 0 THEN 'private' ELSE 'public' END)::visibility_enum,
+       'title ' || n, 'content ' || n
+FROM generate_series(1, :posts) n;
+
+INSERT INTO images (image_id, file_id, file_url, model)
+SELECT p.post_id, f.file_id, '', 'post'
+FROM (SELECT post_id, row_number() OVER (ORDER BY post_id) rn FROM posts WHERE uid LIKE 'plan_u%') p
+JOIN file f ON f.file_name = 'plan/' || p.rn || '.jpg';
+
+INSERT INTO "postComments" (message, post_id, uid, parent_id, reply_cnt, created_at)
+SELECT 'comment ' || n, p.post_id, 'plan_u' || (n % :users + 1), NULL, 0, p.created_at + n * interval '1 second'
+FROM (SELECT post_id, created_at, row_number() OVER (ORDER BY post_id) rn FROM posts WHERE uid LIKE 'plan_u%') p
+JOIN generate_series(1, :comments_per_post) n ON true;
+
+INSERT INTO "postComments" (message, post_id, uid, parent_id, reply_cnt, created_at)
+SELECT 'reply', c.post_id, c.uid, c.comment_id, 0, c.created_at + interval '1 minute'
+FROM "postComments" c
+WHERE c.uid LIKE 'plan_u%' AND c.comment_id % 4 = 0;
+
+INSERT INTO "postLikes" (post_id, uid, created_at)
+SELECT p.post_id, 'plan_u' || ((p.rn + n) % :users + 1), now() - (p.rn + n) * interval '1 minute'
+FROM (SELECT post_id, row_number() OVER (ORDER BY post_id) rn FROM posts WHERE uid LIKE 'plan_u%') p
+JOIN generate_series(1, :likes_per_post) n ON true
+ON CONFLICT DO NOTHING;
+
+-- 주기적으로 정리되므로 만료된 토큰은 일부만 남아 있음
+INSERT INTO tokens (uid, refresh_token_hash, expires_at, provider, created_at, updated_at)
+SELECT 'plan_u' || n, encode(sha256(convert_to('refresh' || n, 'UTF8')), 'hex'),
+       timezone('UTC', now()) + (CASE WHEN n % 100 = 0 THEN -1 ELSE n % 7 + 1 END) * interval '1 day', 'local', now(), now()
+FROM generate_series(1, :users) n;
+
+INSERT INTO pets (uid, name, pet_img_id)
+SELECT 'plan_u' || n, 'pet' || n, NULL
+FROM generate_series(1, :users) n;
+
+ANALYZE users, file, posts, images, "postComments", "postLikes", tokens, pets;
+"""
+
+def seed(conn, scale: float):
+    params = {
+        "users": max(int(20000 * scale), 10),
+        "posts": max(int(100000 * scale), 100),
+        "comments_per_post": 3,
+        "likes_per_post": 3,
+    }
+    for statement in SEED_SQL.split(";\n"):
+        if statement.strip():
+            conn.execute(text(statement), params)
+
+def get_check_params(db: Session) -> dict:
+    # 시드 데이터 중 조회 기준값
+    uid = "plan_u1"
+    post_id, created_at = db.execute(text(
+        "SELECT post_id, created_at FROM posts WHERE uid = :uid ORDER BY created_at DESC LIMIT 1"
+    ), {"uid": uid}).one()
+    comment_id = db.execute(text(
+        'SELECT comment_id FROM "postComments" WHERE post_id = :post_id AND parent_id IS NULL ORDER BY comment_id LIMIT 1'
+    ), {"post_id": post_id}).scalar()
+    pet_id = db.execute(text("SELECT pet_id FROM pets WHERE uid = :uid"), {"uid": uid}).scalar()
+    kst_date = (created_at + timedelta(hours=9)).strftime('%Y%m%d')
+    return {"uid": uid, "post_id": post_id, "comment_id": comment_id, "pet_id": pet_id, "kst_date": kst_date}
+
+def _feed_second_page(db: Session, p: dict):
+    first = get_paginated_posts2(db, viewer_id=p["uid"])
+    return get_paginated_posts2(db, viewer_id=p["uid"], cursor=first.next_cursor)
+
+# (이름, 실행 함수(db, 기준값)) - 순서대로 같은 트랜잭션 안에서 실행
+CHECKS: List[Tuple[str, Callable[[Session, dict], object]]] = [
+    ("post_service.get_paginated_posts2", lambda db, p: get_paginated_posts2(db, viewer_id=p["uid"])),
+    ("post_service.get_paginated_posts2 (cursor)", _feed_second_page),
+    ("post_service.get_paginated_posts", lambda db, p: get_paginated_posts(db, uid=p["uid"], viewer_id="plan_u2")),
+    ("post_service.get_post_by_id", lambda db, p: get_post_by_id(db, p["post_id"])),
+    ("post_service.get_journey", lambda db, p: get_journey(db, viewer_id=p["uid"], inqr_date=p["kst_date"])),
+    ("post_service.get_journey_calendar", lambda db, p: get_journey_calendar(db, viewer_id=p["uid"], yyyymm=p["kst_date"][:6])),
+    ("postComment_service.get_paging_postcomment", lambda db, p: get_paging_postcomment(db, post_id=p["post_id"], viewer_id=p["uid"], replies=3)),
+    ("postComment_service.get_paging_postcomment (replies)", lambda db, p: get_paging_postcomment(db, comment_id=p["comment_id"], viewer_id=p["uid"])),
+    ("postComment_service.reconcile_comment_counters", lambda db, p: reconcile_comment_counters(db, batch_size=1000)),
+    ("postLike_service.reconcile_like_counters", lambda db, p: reconcile_like_counters(db, batch_size=1000)),
+    ("trending_service.TrendingEngine.load", lambda db, p: TrendingEngine(settings.TRENDING_LIKE_WEIGHT, settings.TRENDING_COMMENT_WEIGHT).load(db)),
+    ("user_service.get_user_by_email", lambda db, p: get_user_by_email(db, "plan_u1@plan.check")),
+    ("user_service.pick_available_nickname", lambda db, p: pick_available_nickname(db, ["user1", "user2", "포근한고양이123"])),
+    ("user_service.get_user_and_file_info", lambda db, p: get_user_and_file_info(db, p["uid"])),
+    ("user_service.get_pets_by_user_id", lambda db, p: get_pets_by_user_id(db, p["uid"])),
+    ("pet_service.get_pet_by_id_with_file", lambda db, p: get_pet_by_id_with_file(db, p["pet_id"])),
+    ("auth_service.get_token_by_refresh_token", lambda db, p: get_token_by_refresh_token(db, "refresh1")),
+    ("auth_service.rotate_refresh_token", lambda db, p: rotate_refresh_token(db, "plan_u10", "refresh10", "refresh10-rotated")),
+    ("auth_service.delete_expired_tokens", lambda db, p: delete_expired_tokens(db, batch_size=1000)),
+]
+
+def find_seq_scans(plan: dict) -> List[str]:
+    tables = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in CHECKED_TABLES:
+        tables.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        tables.extend(find_seq_scans(child))
+    return tables
+
+@contextmanager
+def seeded_session(scale: float = 1.0) -> Iterator[Session]:
+    """
+    * method:   seeded_session
+    * purpose:  시드 데이터를 만든 트랜잭션에 묶인 Session (서비스 함수의 commit/rollback 은 savepoint 단위, 종료 시 전체 롤백)
+    """
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            seed(conn, scale)
+            yield Session(bind=conn, join_transaction_mode="create_savepoint")
+        finally:
+            transaction.rollback()
+
+def run_check(db: Session, run: Callable[[], object]) -> Tuple[int, List[Tuple[str, List[str]]], Optional[Exception]]:
+    """
+    * method:   run_check
+    * purpose:  run 이 실행한 SQL 을 EXPLAIN 하여 (실행한 쿼리 수, Seq Scan 쿼리 목록, 실행 중 예외) 반환
+    """
+    conn = db.bind
+    statements = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH", "UPDATE", "DELETE")):
+            statements.append((statement, parameters))
+
+    # 이전 검사에서 메모이즈/캐시된 조회도 다시 실행되도록
+    clear_loaders(db)
+    for cache in caches.values():
+        cache.clear()
+    error = None
+    event.listen(conn, "before_cursor_execute", capture)
+    try:
+        run()
+    except Exception as e:
+        # 인덱스가 없어 statement_timeout 에 걸린 경우 등 (savepoint 롤백 후 수집된 쿼리는 계속 검사)
+        db.rollback()
+        error = e
+    finally:
+        event.remove(conn, "before_cursor_execute", capture)
+
+    cursor = conn.connection.cursor()
+    failures = []
+    for statement, parameters in statements:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+        plan = cursor.fetchone()[0]
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        seq_scans = find_seq_scans(plan[0]["Plan"])
+        if seq_scans:
+            failures.append((statement, seq_scans))
+    return len(statements), failures, error
+
+def format_failure(statement: str, seq_scans: List[str]) -> str:
+    return f"Seq Scan on {', '.join(sorted(set(seq_scans)))}: " + " ".join(statement.split())[:300]
+
+def check_plans(scale: float = 1.0) -> bool:
+    """
+    * method:   check_plans
+    * purpose:  서비스 조회 함수가 실행하는 SQL 의 실행 계획에 주요 테이블 Seq Scan 이 없는지 검사
+    """
+    ok = True
+    with seeded_session(scale) as db:
+        params = get_check_params(db)
+        for name, run in CHECKS:
+            count, failures, error = run_check(db, lambda: run(db, params))
+            if failures or error:
+                ok = False
+                print(f"FAIL  {name}")
+                if error:
+                    print(f"      {type(error).__name__}: {str(error).splitlines()[0]}")
+                for statement, seq_scans in failures:
+                    print("      " + format_failure(statement, seq_scans))
+            else:
+                print(f"ok    {name} ({count} queries)")
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that service queries use index scans")
+    parser.add_argument("--scale", type=float, default=1.0, help="seed data size multiplier (1.0 = 100k posts)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    started = datetime.now()
+    passed = check_plans(args.scale)
+    print(f"{'passed' if passed else 'failed'} in {(datetime.now() - started).total_seconds():.1f}s")
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,68 @@
+# db/pool.py
+
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from utils.metrics import Histogram
+
+_CHECKOUT_AT = "_metrics_checkout_at"
+
+class PoolMetrics:
+    """
+    커넥션 풀 지표
+    - wait: 풀에서 커넥션을 얻기까지 대기한 시간 (신규 연결 생성 포함)
+    - hold: checkout 부터 checkin 까지 커넥션을 점유한 시간
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.wait = Histogram()
+        self.hold = Histogram()
+        self.timeouts = 0
+
+    def snapshot(self, pool: QueuePool) -> dict:
+        return {
+            "name": self.name,
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout_sec": pool.timeout(),
+            "timeouts": self.timeouts,
+            "wait": self.wait.snapshot(),
+            "hold": self.hold.snapshot(),
+        }
+
+class _InstrumentedPoolMixin:
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            self.metrics.wait.observe((time.perf_counter() - start) * 1000)
+            raise
+        now = time.perf_counter()
+        self.metrics.wait.observe((now - start) * 1000)
+        record.info[_CHECKOUT_AT] = now
+        return record
+
+    def _do_return_conn(self, record):
+        checkout_at = record.info.pop(_CHECKOUT_AT, None)
+        if checkout_at is not None:
+            self.metrics.hold.observe((time.perf_counter() - checkout_at) * 1000)
+        super()._do_return_conn(record)
+
+    def recreate(self):
+        # engine.dispose() 등으로 풀이 재생성되어도 같은 지표 객체를 유지
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
@@ -0,0 +1,176 @@
+# db/replica.py
+
+import asyncio
+import hashlib
+import hmac
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from fastapi import Request
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
+from core.config import settings, to_async_database_url
+from db.pool import PoolMetrics
+from db.session import AsyncSessionLocal, async_engine, engine_options
+
+logger = logging.getLogger(__name__)
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+REPLICA_SESSION_KEY = "replica"  # 복제본 세션 표시 (Session.info)
+PRIMARY_PIN_COOKIE = "db_primary_until"  # 다른 워커/서버로 요청이 가도 primary 고정이 유지되도록 쿠키로도 전달
+
+class ReplicaSet:
+    """
+    읽기 전용 복제본 엔진 묶음
+    - 라운드로빈으로 복제본 순서를 정하고, 연결에 실패한 복제본은 cooldown 동안 제외
+    """
+    def __init__(self, urls: List[str], cooldown: float):
+        self.cooldown = cooldown
+        self.engines: List[AsyncEngine] = []
+        for index, url in enumerate(urls):
+            options = engine_options(async_driver=True)
+            options["connect_args"]["timeout"] = settings.DB_REPLICA_CONNECT_TIMEOUT
+            engine = create_async_engine(to_async_database_url(url), **options)
+            engine.sync_engine.pool.metrics = PoolMetrics(f"replica-{index}")
+            self.engines.append(engine)
+        self._down_until = [0.0] * len(self.engines)
+        self._counter = itertools.count()
+
+    def candidates(self) -> List[AsyncEngine]:
+        # 라운드로빈 시작 위치부터 정상 상태인 복제본 순서대로 반환
+        start = next(self._counter) % len(self.engines)
+        now = time.monotonic()
+        order = [(start + offset) % len(self.engines) for offset in range(len(self.engines))]
+        return [self.engines[index] for index in order if self._down_until[index] <= now]
+
+    def mark_down(self, engine: AsyncEngine):
+        index = self.engines.index(engine)
+        self._down_until[index] = time.monotonic() + self.cooldown
+        logger.warning(f"DB replica-{index} marked down for {self.cooldown}s")
+
+    def dispose_after_fork(self):
+        for engine in self.engines:
+            engine.sync_engine.dispose(close=False)
+
+    def get_pool_stats(self) -> List[dict]:
+        now = time.monotonic()
+        stats = []
+        for index, engine in enumerate(self.engines):
+            pool = engine.sync_engine.pool
+            snapshot = pool.metrics.snapshot(pool)
+            snapshot["healthy"] = self._down_until[index] <= now
+            stats.append(snapshot)
+        return stats
+
+class PrimaryPins:
+    """
+    쓰기 요청을 보낸 사용자(actor)를 일정 시간 primary 로 고정 (프로세스 내)
+    """
+    def __init__(self, ttl: float, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def pin(self, actor: str):
+        now = time.monotonic()
+        with self._lock:
+            if len(self._expires) >= self.max_size:
+                self._expires = {key: until for key, until in self._expires.items() if until > now}
+            self._expires[actor] = now + self.ttl
+
+    def is_pinned(self, actor: str) -> bool:
+        until = self._expires.get(actor)
+        return until is not None and until > time.monotonic()
+
+replica_set: Optional[ReplicaSet] = (
+    ReplicaSet(settings.DATABASE_REPLICA_URLS, settings.DB_REPLICA_COOLDOWN)
+    if settings.DATABASE_REPLICA_URLS else None
+)
+primary_pins = PrimaryPins(ttl=settings.DB_PRIMARY_PIN_SECONDS)
+
+def actor_key(request: Request) -> str:
+    # 인증 토큰이 있으면 토큰 해시, 없으면 클라이언트 IP 기준
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return "t:" + hashlib.sha256(authorization.encode()).hexdigest()[:32]
+    return "ip:" + (request.client.host if request.client else "")
+
+def _sign_pin(until: str) -> str:
+    return hmac.new(settings.SECRET_KEY.encode(), f"{PRIMARY_PIN_COOKIE}:{until}".encode(), hashlib.sha256).hexdigest()
+
+def make_pin_cookie(now: float) -> str:
+    # "만료시각.서명" 형식 (클라이언트가 만료시각을 임의로 늘릴 수 없도록 SECRET_KEY 로 서명)
+    until = str(int(now) + settings.DB_PRIMARY_PIN_SECONDS)
+    return f"{until}.{_sign_pin(until)}"
+
+def read_pin_cookie(value: Optional[str], now: float) -> bool:
+    # 서명이 맞고 아직 만료되지 않았으면 True. 고정 시간 설정이 줄어든 경우에도 그 이상 고정되지 않도록 만료시각을 한 번 더 제한
+    if not value or not settings.SECRET_KEY:
+        return False
+    until, _, signature = value.partition(".")
+    if not until.isdigit() or not hmac.compare_digest(signature, _sign_pin(until)):
+        return False
+    return now < int(until) <= now + settings.DB_PRIMARY_PIN_SECONDS
+
+def is_pinned_to_primary(request: Request) -> bool:
+    if read_pin_cookie(request.cookies.get(PRIMARY_PIN_COOKIE), time.time()):
+        return True
+    return primary_pins.is_pinned(actor_key(request))
+
+async def get_async_read_db(request: Request):
+    """
+    * method:   get_async_read_db
+    * purpose:  읽기 전용 라우트용 AsyncSession. 복제본이 설정되어 있으면 라운드로빈으로 복제본에 연결하고
+                연결 실패 시 다음 복제본 → primary 순으로 전환. 최근 쓰기를 한 사용자는 primary 로 조회
+    """
+    if replica_set is not None and not is_pinned_to_primary(request):
+        for engine in replica_set.candidates():
+            db = AsyncSessionLocal(bind=engine)
+            try:
+                await db.connection()
+            except (OSError, asyncio.TimeoutError, exc.DBAPIError):
+                await db.close()
+                replica_set.mark_down(engine)
+                continue
+            db.info[REPLICA_SESSION_KEY] = True
+            async with db:
+                yield db
+            return
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+@contextmanager
+def primary_session(db: Session) -> Iterator[Session]:
+    """
+    * method:   primary_session
+    * purpose:  복제 지연된 값을 저장하면 안 되는 조회(캐시 채우기)용 세션
+                db 가 복제본 세션이면 같은 run_sync 안에서 primary 비동기 엔진으로 세션을 따로 열고, 아니면 db 를 그대로 사용
+    """
+    if not db.info.get(REPLICA_SESSION_KEY):
+        yield db
+        return
+    primary = Session(bind=async_engine.sync_engine)
+    try:
+        yield primary
+    finally:
+        primary.close()
+
+async def pin_primary_after_write(request: Request, call_next):
+    # 쓰기 요청이 성공하면 해당 사용자의 이후 읽기를 잠시 primary 로 고정 (read-your-writes)
+    response = await call_next(request)
+    if replica_set is not None and request.method not in READ_METHODS and response.status_code < 400:
+        primary_pins.pin(actor_key(request))
+        if settings.SECRET_KEY:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                make_pin_cookie(time.time()),
+                max_age=settings.DB_PRIMARY_PIN_SECONDS,
+                httponly=True,
+            )
+    return response
@@ -1,15 +1,124 @@
+import asyncio
+import functools
+import inspect
+import logging
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
 from core.config import settings
+from db.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, PoolMetrics
 
-print(settings.DATABASE_URL)
+logger = logging.getLogger(__name__)
 
-engine = create_engine(settings.DATABASE_URL)
+def engine_options(async_driver: bool) -> dict:
+    """
+    * method:   engine_options
+    * purpose:  Config 기반 커넥션 풀 설정 및 커넥션별 statement_timeout (psycopg2: options / asyncpg: server_settings)
+    """
+    connect_args = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        if async_driver:
+            connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+    return {
+        "poolclass": InstrumentedAsyncAdaptedQueuePool if async_driver else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
+
+# 동기 엔진 (스크립트, 마이그레이션, 백그라운드 작업용)
+engine = create_engine(settings.DATABASE_URL, **engine_options(async_driver=False))
+engine.pool.metrics = PoolMetrics("sync")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (asyncpg, API 요청 처리용)
+async_engine = create_async_engine(settings.ASYNC_DATABASE_URL, **engine_options(async_driver=True))
+async_engine.sync_engine.pool.metrics = PoolMetrics("async")
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 async def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def warm_up_pool(size: int):
+    """
+    * method:   warm_up_pool
+    * purpose:  워커 기동 시 비동기 엔진 풀에 커넥션을 미리 생성 (첫 요청들의 연결 수립 지연 제거)
+                DB 에 연결할 수 없어도 기동은 계속 진행
+    """
+    if size <= 0:
+        return
+    connections = await asyncio.gather(*[async_engine.connect() for _ in range(size)], return_exceptions=True)
+    opened = 0
+    for connection in connections:
+        if isinstance(connection, Exception):
+            logger.warning(f"DB pool warm-up failed: {connection}")
+            continue
+        opened += 1
+        await connection.close()
+    logger.info(f"DB pool warmed up with {opened} connections")
+
+def dispose_engines_after_fork():
+    # fork 이전(preload)에 만들어진 커넥션을 자식 프로세스에서 재사용하지 않도록 풀만 교체 (부모 커넥션은 닫지 않음)
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+
+def get_pool_stats() -> dict:
+    """
+    * method:   get_pool_stats
+    * purpose:  동기/비동기 엔진 커넥션 풀 상태 및 대기/점유 시간 히스토그램 반환
+    """
+    sync_pool = engine.pool
+    async_pool = async_engine.sync_engine.pool
+    return {
+        "sync": sync_pool.metrics.snapshot(sync_pool),
+        "async": async_pool.metrics.snapshot(async_pool),
+    }
+
+
+# 스크립트/백그라운드 작업용 세션
+@contextmanager
+def session_scope():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def async_service(func):
+    """
+    * method:   async_service
+    * purpose:  동기 서비스 함수(db: Session)를 AsyncSession 을 받는 비동기 함수로 변환
+                AsyncSession.run_sync 로 실행되므로 쿼리 I/O 는 asyncpg 로 처리되어 이벤트 루프를 막지 않음
+                (예: get_post_by_id_async = async_service(get_post_by_id) → await get_post_by_id_async(db, post_id))
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        async_db: AsyncSession = bound.arguments["db"]
+
+        def call(sync_db):
+            bound.arguments["db"] = sync_db
+            return func(*bound.args, **bound.kwargs)
+
+        return await async_db.run_sync(call)
+
+    return wrapper
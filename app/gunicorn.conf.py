@@ -0,0 +1,64 @@
+# gunicorn.conf.py
+# 운영 실행 (app 디렉토리에서): gunicorn main:app -c gunicorn.conf.py
+#
+# - 워커 수: WEB_CONCURRENCY 미설정 시 사용 가능한 CPU 코어 수 (cgroup CPU 제한 반영)
+# - preload_app: 마스터에서 앱을 한 번 import 한 뒤 fork 하여 워커 간 메모리(copy-on-write) 공유
+# - gc.freeze: fork 전에 import 된 객체를 GC 대상에서 제외하여 워커에서 공유 페이지가 복사되지 않도록 함
+# - SIGTERM: 새 연결 수신을 중단하고 처리 중인 요청은 graceful_timeout 안에서 완료 후 종료
+
+import gc
+import math
+import os
+
+def available_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    # 컨테이너 CPU 제한 (cgroup v2: cpu.max / v1: cfs_quota_us, cfs_period_us)
+    quota = period = None
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            max_value, period_value = f.read().split()
+            if max_value != "max":
+                quota, period = int(max_value), int(period_value)
+    except (OSError, ValueError):
+        try:
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                quota = int(f.read())
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period = int(f.read())
+        except (OSError, ValueError):
+            pass
+    if quota and period and quota > 0:
+        cpus = min(cpus, max(math.ceil(quota / period), 1))
+    return max(cpus, 1)
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", str(available_cpus())))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+
+def when_ready(server):
+    # preload 로 import 가 끝난 마스터에서 fork 전에 1회 실행
+    gc.collect()
+    gc.freeze()
+    server.log.info(f"Preloaded app, froze {gc.get_freeze_count()} objects, starting {workers} workers")
+
+def post_fork(server, worker):
+    # 마스터에서 만들어진 엔진 풀을 워커별로 새로 사용
+    from db.session import dispose_engines_after_fork
+    from db.replica import replica_set
+
+    dispose_engines_after_fork()
+    if replica_set is not None:
+        replica_set.dispose_after_fork()
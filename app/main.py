@@ -1,16 +1,72 @@
+import asyncio
 import uvicorn
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
-from db.session import engine
-from models import Base
+from core.config import settings
+from core.dependencies import verify_internal_token
+from db.session import session_scope, warm_up_pool
+from db.replica import pin_primary_after_write
+from db.notify import cache_invalidation_listener, invalidation_batcher
+from services.postComment_service import reconcile_comment_counters
+from services.postLike_service import reconcile_like_counters
+from services.likeCounter_service import like_counter_buffer
+from services.community_service import refresh_top_posts_job
+from services.trending_service import reload_trending_job
+from services.auth_service import delete_expired_tokens
+from services.s3_service import shutdown_upload_executor
+from utils.hashing import password_hasher
+from utils.nickname import nickname_pool
+from utils.scheduler import register_periodic, start_periodic_tasks, stop_periodic_tasks
 
-from routes import auth_routes, user_routes, pet_routes, post_routes, postComment_routes, postLike_routes, file_routes, community_routes
+from routes import auth_routes, user_routes, pet_routes, post_routes, postComment_routes, postLike_routes, file_routes, community_routes, internal_routes
+
+def reconcile_counters_job():
+    with session_scope() as db:
+        if settings.LIKE_WRITE_BEHIND:
+            like_counter_buffer.flush(db)
+        reconcile_comment_counters(db, batch_size=settings.COMMENT_CNT_RECONCILE_BATCH_SIZE)
+        reconcile_like_counters(db, batch_size=settings.COMMENT_CNT_RECONCILE_BATCH_SIZE)
+
+def flush_invalidations_job():
+    with session_scope() as db:
+        invalidation_batcher.flush(db)
+
+def sweep_expired_tokens_job():
+    with session_scope() as db:
+        delete_expired_tokens(db, batch_size=settings.TOKEN_SWEEP_BATCH_SIZE)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_up_pool(min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE))
+    cache_invalidation_listener.start()
+    if settings.LIKE_WRITE_BEHIND:
+        like_counter_buffer.start()
+    start_periodic_tasks()
+    yield
+    await stop_periodic_tasks()
+    # 종료 시 남은 반영 작업은 DB 를 사용하는 동기 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    loop = asyncio.get_running_loop()
+    if settings.LIKE_WRITE_BEHIND:
+        await loop.run_in_executor(None, like_counter_buffer.stop)
+    await loop.run_in_executor(None, flush_invalidations_job)
+    cache_invalidation_listener.stop()
+    password_hasher.shutdown()
+    shutdown_upload_executor()
+    await nickname_pool.close()
 
 def create_app():
-    Base.metadata.create_all(bind=engine)
+    # 스키마 생성/변경은 기동 시점이 아닌 별도 명령으로 1회 실행 (python -m db.migrate)
+    register_periodic("counter_reconcile", settings.COMMENT_CNT_RECONCILE_INTERVAL, reconcile_counters_job)
+    register_periodic("community_top_posts_refresh", settings.COMMUNITY_TOP_POSTS_REFRESH_INTERVAL, refresh_top_posts_job)
+    register_periodic("trending_reload", settings.TRENDING_RELOAD_INTERVAL, reload_trending_job)
+    register_periodic("cache_invalidation_flush", settings.CACHE_INVALIDATION_FLUSH_MS / 1000, flush_invalidations_job)
+    register_periodic("token_sweep", settings.TOKEN_SWEEP_INTERVAL, sweep_expired_tokens_job)
+    if nickname_pool.enabled:
+        register_periodic("nickname_prefetch", settings.NICKNAME_PREFETCH_INTERVAL, nickname_pool.refill)
 
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     origins = [
         "*"
@@ -24,6 +80,9 @@ def create_app():
         allow_headers=["*"],
     )
 
+    # 쓰기 직후 읽기는 primary 로 (read-your-writes)
+    app.middleware("http")(pin_primary_after_write)
+
     app.include_router(auth_routes.router, prefix="/auth", tags=["Auth"])
     app.include_router(user_routes.router, prefix="/users", tags=["Users"])
     app.include_router(community_routes.router, prefix="/community", tags=["Community"])
@@ -35,6 +94,11 @@ def create_app():
 
     app.include_router(file_routes.router, prefix="/file", tags=["File"])
 
+    app.include_router(
+        internal_routes.router, prefix="/internal", tags=["Internal"], include_in_schema=False,
+        dependencies=[Depends(verify_internal_token)],
+    )
+
 
     @app.get("/health")
     async def health_check():
@@ -49,4 +113,4 @@ def create_app():
 app = create_app()
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=settings.PROJECT_RELOAD)
\ No newline at end of file
@@ -1,5 +1,5 @@
 
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, TIMESTAMP
+from sqlalchemy import Column, String, Integer, BigInteger, Text, ForeignKey, TIMESTAMP
 from sqlalchemy.orm import relationship
 from . import Base
 from datetime import datetime
@@ -12,6 +12,9 @@ class File(Base):
     file_url = Column(Text, nullable=False)
     uid = Column(String(50), ForeignKey("users.uid"), nullable=False)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)
+    status = Column(Integer, nullable=False, default=1)  # 업로드 상태 (1: 완료, 0: 대기 - presigned 업로드 후 완료 처리 전)
+    size = Column(BigInteger, nullable=True)  # 파일 크기 (bytes)
+    content_type = Column(String(100), nullable=True)  # 파일 MIME 타입
 
     # Relationship with User model
     users = relationship("User", back_populates="files")
\ No newline at end of file
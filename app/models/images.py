@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, Integer, String, Text
 
 from . import Base
 
@@ -6,6 +6,6 @@ class Images(Base):
     __tablename__ = "images"
 
     image_id = Column(String(200), primary_key=True)
-    file_id = Column(String(200), primary_key=True)
+    file_id = Column(Integer, primary_key=True)  # file.file_id
     file_url = Column(Text, nullable=False)
     model = Column(String(30))
\ No newline at end of file
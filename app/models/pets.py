@@ -6,7 +6,7 @@ class Pet(Base):
     __tablename__ = "pets"
 
     pet_id = Column(Integer, primary_key=True, autoincrement=True)  # 반려동물 ID (pk)
-    uid = Column(String(50), ForeignKey("users.uid"))  # 사용자 ID (fk)
+    uid = Column(String(50), ForeignKey("users.uid"), index=True)  # 사용자 ID (fk)
     name = Column(String(50), nullable=False)  # 반려동물 이름
     birthday = Column(Date)  # 반려동물 생일
     breed = Column(String(50))  # 반려동물 품종
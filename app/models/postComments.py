@@ -1,13 +1,18 @@
-from sqlalchemy import Column, String, Integer, TIMESTAMP
+from sqlalchemy import Column, String, Integer, TIMESTAMP, Index
 from . import Base
 from datetime import datetime
 
 class PostComment(Base):
     __tablename__ = "postComments"
+    __table_args__ = (
+        Index("ix_postcomments_post_id_created_at", "post_id", "created_at", "comment_id"),  # 게시물별 댓글 목록
+        Index("ix_postcomments_parent_id_created_at", "parent_id", "created_at", "comment_id"),  # 답글 목록
+    )
 
     comment_id = Column(Integer, primary_key=True, autoincrement=True) 
     message = Column(String(3000), nullable=False)  
     post_id = Column(String(100), nullable=False)  
     uid = Column(String(50), nullable=False)  # 사용자 ID
     parent_id = Column(Integer)
+    reply_cnt = Column(Integer, nullable=False, default=0, server_default="0")  # 답글 수
     created_at = Column(TIMESTAMP, default=datetime.utcnow)  # 생성 시간
\ No newline at end of file
@@ -1,9 +1,12 @@
-from sqlalchemy import Column, String, Integer, TIMESTAMP
+from sqlalchemy import Column, String, Integer, TIMESTAMP, UniqueConstraint
 from . import Base
 from datetime import datetime
 
 class PostLike(Base):
     __tablename__ = "postLikes"
+    __table_args__ = (
+        UniqueConstraint("post_id", "uid", name="ux_postlikes_post_id_uid"),  # 사용자당 게시물 좋아요 1회
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True) 
     post_id = Column(String(100), nullable=False) 
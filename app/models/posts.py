@@ -1,10 +1,14 @@
-from sqlalchemy import Column, String, Integer, TIMESTAMP, Enum, Boolean, ForeignKey
+from sqlalchemy import Column, String, Integer, TIMESTAMP, Enum, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from . import Base
 
 class Posts(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_uid_created_at_post_id", "uid", "created_at", "post_id"),  # 사용자별 피드 / 기간 조회 (journey)
+        Index("ix_posts_created_at", "created_at"),  # 기간 조회 (trending, 상위 게시물)
+    )
 
     post_id = Column(String(100), primary_key=True)  # 사용자가 입력한 uid
     uid = Column(String(50), ForeignKey('users.uid'), nullable=False)  # 사용자 ID
@@ -13,6 +17,7 @@ class Posts(Base):
     last_updated = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)  # 업데이트 시간
     post_likes = Column(Integer, nullable=False, default=0)  # 좋아요 수
     post_shares = Column(Integer, nullable=False, default=0)  # 공유 수
+    comment_cnt = Column(Integer, nullable=False, default=0, server_default="0")  # 댓글 수 (답글 포함)
     visibility = Column(
         Enum('public', 'private', 'friends', name='visibility_enum'),
         default='public'
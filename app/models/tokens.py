@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Text, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, Integer, TIMESTAMP, ForeignKey
 from datetime import datetime
 from sqlalchemy.orm import relationship
 from . import Base
@@ -7,9 +7,9 @@ class Token(Base):
     __tablename__ = "tokens"
 
     session_id = Column(Integer, primary_key=True, autoincrement=True)  # 세션 ID (pk)
-    uid = Column(String(50), ForeignKey("users.uid"), nullable=False)  # 사용자 ID (fk)
-    access_token = Column(Text, nullable=False)  # 액세스 토큰
-    refresh_token = Column(Text, nullable=False)  # 리프레시 토큰
+    uid = Column(String(50), ForeignKey("users.uid"), nullable=False, index=True)  # 사용자 ID (fk)
+    refresh_token_hash = Column(String(64), nullable=False, unique=True, index=True)  # 리프레시 토큰 sha256 (hex)
+    expires_at = Column(TIMESTAMP, nullable=False, index=True)  # 리프레시 토큰 만료 일자 (UTC)
     provider = Column(String(50))  # 제공자 정보 (예: 자체 로그인, 구글, 페이스북 등)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)  # 생성 일자 (기본값: 현재 시간)
     updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)  # 수정 일자 (기본값: 현재 시간)
@@ -7,9 +7,9 @@ class User(Base):
     __tablename__ = "users"
 
     uid = Column(String(50), primary_key=True)  # 사용자가 입력한 uid
-    user_name = Column(String(50), nullable=False)  # 사용자 이름
+    user_name = Column(String(50), nullable=False, index=True, unique=True)  # 사용자 이름 (닉네임, 중복 불가)
     email = Column(String(100), unique=True, nullable=False)  # 이메일 주소
-    password = Column(String(64), nullable=False)  # SHA256 해시된 비밀번호
+    password = Column(String(255), nullable=False)  # argon2id 해시 (기존 SHA256 해시는 로그인 시 재해시)
     created_at = Column(TIMESTAMP, default=datetime.utcnow)  # 생성 시간
     updated_at = Column(TIMESTAMP, default=datetime.utcnow, onupdate=datetime.utcnow)  # 업데이트 시간
     status = Column(Integer, nullable=False, default=1)  # 사용자 상태 (2: 차단, 1: 활성, 0: 비활성)
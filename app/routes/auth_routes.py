@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_async_db
 from schemas.user_schema import UserCreate, UserResponse, UserIdExistsResponse, CheckUserId
 from schemas.token_schema import TokenResponse, RefreshTokenResponse
-from services.user_service import create_user, get_user_by_uid, get_user_by_email, get_user_exists_by_uid
-from services.auth_service import create_tokens, get_token_by_refresh_token, delete_tokens_by_user_id
-from utils.hashing import Hash
-from utils.jwt import create_access_token, create_refresh_token
+from services.user_service import create_user_async, get_user_by_uid_async, get_user_by_email_async, get_user_exists_by_uid_async, update_password_hash_async
+from services.auth_service import create_tokens_async, rotate_refresh_token_async, delete_tokens_by_user_id_async
+from utils.hashing import password_hasher
+from utils.jwt import create_access_token, create_refresh_token, verify_refresh_token
 from core.config import settings
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import timedelta, datetime
@@ -15,36 +15,47 @@ from utils.error_code import ErrorCode, raise_error
 router = APIRouter()
 
 @router.post("/signup", response_model=UserResponse)
-async def register_user(user: UserCreate, db: Session = Depends(get_db)):
-    existing_user_uid = get_user_by_uid(db, user.uid)
-    existing_user_email = get_user_by_email(db, user.email)
+async def register_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    existing_user_uid = await get_user_by_uid_async(db, user.uid)
+    existing_user_email = await get_user_by_email_async(db, user.email)
 
     if existing_user_uid or existing_user_email:
         raise_error(ErrorCode.ALREADY_EXISTS)
-    
-    return await create_user(db=db, user=user)
+
+    # 비밀번호 해시 동안 DB 커넥션을 점유하지 않도록 조회 트랜잭션 종료
+    await db.commit()
+    return await create_user_async(db=db, user=user)
 
 @router.post("/login", response_model=TokenResponse)
-def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = get_user_by_uid(db, form_data.username)
-    if not user or not Hash.verify_password(form_data.password, user.password):
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    user = await get_user_by_uid_async(db, form_data.username)
+    # 비밀번호 검증 동안 DB 커넥션을 점유하지 않도록 조회 트랜잭션 종료
+    await db.commit()
+    if user:
+        verified, new_hash = await password_hasher.verify_and_update(form_data.password, user.password)
+    else:
+        verified, new_hash = await password_hasher.verify_dummy(form_data.password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        # 이전 방식(SHA-256) 해시는 로그인 성공 시 argon2id 로 교체
+        await update_password_hash_async(db, user.uid, new_hash)
+
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user.uid}, expires_delta=access_token_expires
     )
-    refresh_token_expires = timedelta(days=7)
+    refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     refresh_token = create_refresh_token(
         data={"sub": user.uid}, expires_delta=refresh_token_expires
     )
 
-    create_tokens(db, token_data={
+    await create_tokens_async(db, token_data={
         "uid": user.uid,
-        "access_token": access_token,
         "refresh_token": refresh_token,
         "provider": "local"
     })
@@ -52,32 +63,32 @@ def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db:
     return {"access_token": access_token, "refresh_token": refresh_token, "token_type": "bearer"}
 
 @router.post("/refresh-token", response_model=RefreshTokenResponse)
-def refresh_access_token(refresh_token: str, db: Session = Depends(get_db)):
-    # 리프레시 토큰을 데이터베이스에서 확인
-    token_entry = get_token_by_refresh_token(db, refresh_token)
-    if not token_entry:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid refresh token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+async def refresh_access_token(refresh_token: str, db: AsyncSession = Depends(get_async_db)):
+    # 서명/만료 검증 (위조된 토큰은 DB 조회 없이 거절)
+    uid = verify_refresh_token(refresh_token)
 
-    uid = token_entry.uid
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": uid}, expires_delta=access_token_expires
     )
+    new_refresh_token = create_refresh_token(
+        data={"sub": uid}, expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    )
 
-    # 기존 토큰 정보를 업데이트
-    token_entry.access_token = access_token
-    token_entry.updated_at = datetime.utcnow()
-    db.commit()
+    # 저장된 리프레시 토큰을 새 토큰으로 교체 (이미 교체/만료된 토큰이면 거절)
+    rotated = await rotate_refresh_token_async(db, uid, refresh_token, new_refresh_token)
+    if not rotated:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    return {"access_token": access_token, "token_type": "bearer"}
+    return {"access_token": access_token, "refresh_token": new_refresh_token, "token_type": "bearer"}
 
 @router.post("/check-id", response_model=UserIdExistsResponse)
-def check_id_exists(UserId: CheckUserId, db: Session = Depends(get_db)):
-    user_exists = get_user_exists_by_uid(db, UserId.uid)
+async def check_id_exists(UserId: CheckUserId, db: AsyncSession = Depends(get_async_db)):
+    user_exists = await get_user_exists_by_uid_async(db, UserId.uid)
 
     if len(UserId.uid) > 50:
         raise_error(ErrorCode.INVALID_LENGTH)
@@ -1,35 +1,30 @@
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from db.session import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.replica import get_async_read_db
 from typing import List
-from services.post_service import get_post_top
-from schemas.community_schema import CommunityResponse
+from typing_extensions import Literal
+from services.community_service import get_top_posts_async, get_trending_posts_async
+from schemas.community_schema import CommunityResponse, TrendingPostResponse
 
 router = APIRouter()
 
 @router.get("/top-posts", response_model=List[CommunityResponse])
-def read_top_posts(db: Session = Depends(get_db)):
-    posts = get_post_top(db)
+async def read_top_posts(db: AsyncSession = Depends(get_async_read_db)):
+    # 주기적으로 갱신되는 스냅샷에서 반환 (요청마다 조인 쿼리를 실행하지 않음)
+    posts = await get_top_posts_async(db)
     if not posts:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No posts found"
         )
 
-    # 결과 데이터 가공
-    response = [
-        CommunityResponse(
-            post_id=post.post_id,
-            uid=post.uid,
-            user_name=user_name,
-            profile_image_url=profile_image_url,
-            title=post.title,
-            content=post.content,
-            file_name=file_name,
-            file_url=file_url
-        )
-        for post, user_name, profile_image_url, file_name, file_url in posts
-    ]
+    return posts
 
-    return response
\ No newline at end of file
+@router.get("/trending", response_model=List[TrendingPostResponse])
+async def read_trending_posts(
+    window: Literal["1h", "24h", "7d"] = "24h",
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    return await get_trending_posts_async(db, window=window, limit=limit)
\ No newline at end of file
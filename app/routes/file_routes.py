@@ -3,12 +3,16 @@
 import hashlib
 import random
 import string
-from fastapi import APIRouter, UploadFile, File as FastAPIFile, HTTPException, Depends
-from sqlalchemy.orm import Session
-from services.s3_service import upload_file_to_s3
-from db.session import get_db
+from fastapi import APIRouter, UploadFile, File as FastAPIFile, HTTPException, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.config import settings
+from services.s3_service import upload_file_to_s3_async, stream_to_s3, create_presigned_upload_async, head_s3_object_async, get_file_url
+from services.file_service import FILE_STATUS_COMPLETED, create_pending_file_async, get_file_by_id_async, complete_file_async
+from db.session import get_async_db
+from core.dependencies import ensure_current_user, get_current_uid
 from models.file import File  # 올바른 File 모델 임포트
-from schemas.file_schema import FileCreate
+from schemas.file_schema import FileCreate, FileUploadUrlRequest, FileUploadUrlResponse, FileCompleteRequest
+from utils.error_code import ErrorCode, raise_error
 
 router = APIRouter()
 
@@ -20,12 +24,29 @@ def generate_hashed_filename(original_filename: str) -> str:
     hash_object = hashlib.sha256(f"{original_filename}_{random_suffix}".encode())
     return hash_object.hexdigest()
 
+async def save_file_record(db: AsyncSession, file_name: str, file_url: str, uid: str) -> dict:
+    # 데이터베이스에 파일 정보 저장 (업로드가 끝난 뒤에 커넥션 사용)
+    file_record = FileCreate(
+        file_name=file_name,
+        file_url=file_url,
+        uid=uid
+    )
+    new_file = File(**file_record.dict())
+    db.add(new_file)
+    await db.commit()
+    await db.refresh(new_file)
+
+    return {"file_id": new_file.file_id, "file_url": file_url}
+
 @router.post("/upload")
-async def upload_file(uid: str, file: UploadFile = FastAPIFile(...), db: Session = Depends(get_db)):
+async def upload_file(uid: str, file: UploadFile = FastAPIFile(...), db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
     # try:
+        ensure_current_user(uid, current_uid)
         # 파일 유효성 체크
         if not file or not file.filename:
             raise HTTPException(status_code=400, detail="File must have a valid filename")
+        if file.size is not None and file.size > settings.FILE_MAX_UPLOAD_BYTES:
+            raise_error(ErrorCode.FILE_TOO_LARGE)
 
         # 파일 폴더 해시화
         hashed_dir = generate_hashed_filename(file.filename)
@@ -34,22 +55,90 @@ async def upload_file(uid: str, file: UploadFile = FastAPIFile(...), db: Session
 
         s3_filename = f"uploads/{hashed_dir}/{file.filename}"
 
-        # S3에 파일 업로드
-        file_url = upload_file_to_s3(file, s3_filename)
-
-        # 데이터베이스에 파일 정보 저장
-        file_record = FileCreate(
-            file_name=file.filename,
-            file_url=file_url,
-            uid=uid
-        )
-        new_file = File(**file_record.dict())
-        db.add(new_file)
-        db.commit()
-        db.refresh(new_file)
-
-        return {"file_id": new_file.file_id, "file_url": file_url}
+        # S3에 파일 업로드 (업로드 스레드에서 실행, 이벤트 루프를 막지 않음)
+        file_url = await upload_file_to_s3_async(file, s3_filename)
+
+        return await save_file_record(db, file.filename, file_url, uid)
     # except ValueError as ve:
     #     raise HTTPException(status_code=400, detail=str(ve))
     # except Exception as e:
-    #     raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    #     raise HTTPException(status_code=500, detail=str(e))
+
+@router.put("/upload/stream")
+async def upload_file_stream(uid: str, filename: str, request: Request, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    """
+    * method:   upload_file_stream
+    * purpose:  요청 본문(파일 원본 바이트)을 받는 대로 S3 에 업로드 (multipart/form-data 와 달리 임시 파일을 만들지 않음)
+                파일 종류는 Content-Type 헤더로 전달
+    """
+    ensure_current_user(uid, current_uid)
+    if not filename:
+        raise HTTPException(status_code=400, detail="File must have a valid filename")
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > settings.FILE_MAX_UPLOAD_BYTES:
+        raise_error(ErrorCode.FILE_TOO_LARGE)
+
+    hashed_dir = generate_hashed_filename(filename)
+    s3_filename = f"uploads/{hashed_dir}/{filename}"
+
+    file_url = await stream_to_s3(request.stream(), s3_filename, request.headers.get("content-type"), settings.FILE_MAX_UPLOAD_BYTES)
+    if file_url is None:
+        raise_error(ErrorCode.FILE_TOO_LARGE)
+
+    return await save_file_record(db, filename, file_url, uid)
+
+@router.post("/upload-url", response_model=FileUploadUrlResponse)
+async def create_upload_url(upload: FileUploadUrlRequest, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    """
+    * method:   create_upload_url
+    * purpose:  클라이언트가 S3 에 직접 업로드할 presigned POST 와 업로드 대기 상태의 파일 정보 생성
+                (파일 바이트는 API 서버를 거치지 않음, 업로드 후 /file/complete 호출)
+    """
+    ensure_current_user(upload.uid, current_uid)
+    if upload.content_type not in settings.FILE_ALLOWED_CONTENT_TYPES:
+        raise_error(ErrorCode.INVALID_CONTENT_TYPE)
+    if upload.size > settings.FILE_MAX_UPLOAD_BYTES:
+        raise_error(ErrorCode.FILE_TOO_LARGE)
+
+    hashed_dir = generate_hashed_filename(upload.file_name)
+    s3_filename = f"uploads/{hashed_dir}/{upload.file_name}"
+
+    # 신고한 크기를 넘는 파일과 다른 Content-Type 은 S3 가 거절
+    presigned = await create_presigned_upload_async(s3_filename, upload.content_type, upload.size)
+    file_url = get_file_url(s3_filename)
+    new_file = await create_pending_file_async(db, upload.uid, s3_filename, file_url, upload.content_type, upload.size)
+
+    return {
+        "file_id": new_file.file_id,
+        "upload_url": presigned["url"],
+        "fields": presigned["fields"],
+        "file_url": file_url,
+        "expires_in": settings.S3_PRESIGNED_EXPIRES,
+    }
+
+@router.post("/complete")
+async def complete_upload(complete: FileCompleteRequest, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    """
+    * method:   complete_upload
+    * purpose:  S3 에 업로드된 객체를 HEAD 로 확인하고 파일 정보를 완료 상태로 변경
+    """
+    ensure_current_user(complete.uid, current_uid)
+    file = await get_file_by_id_async(db, complete.file_id)
+    if file is None or file.uid != complete.uid:
+        raise_error(ErrorCode.FILE_NOT_FOUND)
+    if file.status == FILE_STATUS_COMPLETED:
+        return {"file_id": file.file_id, "file_url": file.file_url}
+
+    # S3 확인 동안 DB 커넥션을 점유하지 않도록 조회 트랜잭션 종료
+    await db.commit()
+    head = await head_s3_object_async(file.file_name)
+    if head is None:
+        raise_error(ErrorCode.UPLOAD_NOT_COMPLETED)
+    # presigned POST 조건을 검증하지 않는 S3 호환 서버 대비 (AWS S3 는 업로드 시 거절)
+    if head["ContentLength"] > file.size:
+        raise_error(ErrorCode.FILE_TOO_LARGE)
+    if head.get("ContentType") != file.content_type:
+        raise_error(ErrorCode.INVALID_CONTENT_TYPE)
+
+    file = await complete_file_async(db, file, head["ContentLength"], head["ContentType"])
+    return {"file_id": file.file_id, "file_url": file.file_url}
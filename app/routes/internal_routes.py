@@ -0,0 +1,35 @@
+from fastapi import APIRouter
+from db.session import get_pool_stats
+from db.replica import replica_set
+from db.notify import cache_invalidation_listener, invalidation_batcher
+from utils.cache import caches
+from utils.hashing import password_hasher
+from utils.nickname import nickname_pool
+
+router = APIRouter()
+
+# DB 커넥션 풀 지표 (풀 크기 산정용)
+@router.get("/db-pool")
+async def read_db_pool_stats():
+    stats = get_pool_stats()
+    stats["replicas"] = replica_set.get_pool_stats() if replica_set is not None else []
+    return stats
+
+# 엔티티 캐시 지표 (적중률, 메모리 사용량, eviction 수)
+@router.get("/cache")
+async def read_cache_stats():
+    return {
+        "caches": [cache.stats() for cache in caches.values()],
+        "invalidation_listener": cache_invalidation_listener.stats(),
+        "invalidation_batcher": invalidation_batcher.stats(),
+    }
+
+# 비밀번호 해시 스레드 풀 지표 (대기 시간, 실행 시간, 거절 수)
+@router.get("/password-hashing")
+async def read_password_hashing_stats():
+    return password_hasher.stats()
+
+# 닉네임 미리 받아 두기 풀 상태 (외부 API 실패 수, 로컬 생성으로 대체된 수)
+@router.get("/nickname-pool")
+async def read_nickname_pool_stats():
+    return nickname_pool.stats()
@@ -1,19 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_async_db
+from db.replica import get_async_read_db
+from core.dependencies import ensure_current_user, get_current_uid
 from schemas.pet_schema import PetCreate, PetResponse, PetUpdate, PetResponseWithFile
-from services.pet_service import create_pet, get_pet_by_id, update_pet_by_id, delete_pet_by_id, get_pet_by_id_with_file
+from services.pet_service import create_pet_async, get_pet_by_id_async, update_pet_by_id_async, delete_pet_by_id_async, get_pet_by_id_with_file_async
 from typing import List
 
 router = APIRouter()
 
 @router.post("/", response_model=PetResponse)
-def create_pet_endpoint(pet: PetCreate, db: Session = Depends(get_db)):
-    return create_pet(db=db, pet=pet)
+async def create_pet_endpoint(pet: PetCreate, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    ensure_current_user(pet.uid, current_uid)
+    return await create_pet_async(db=db, pet=pet)
 
 @router.get("/{pet_id}", response_model=PetResponseWithFile)
-def get_pet_endpoint(pet_id: int, db: Session = Depends(get_db)):
-    pet = get_pet_by_id_with_file(db, pet_id)
+async def get_pet_endpoint(pet_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    pet = await get_pet_by_id_with_file_async(db, pet_id)
     if not pet:
         raise HTTPException( 
             status_code=status.HTTP_404_NOT_FOUND,
@@ -22,26 +25,26 @@ def get_pet_endpoint(pet_id: int, db: Session = Depends(get_db)):
     return pet 
 
 @router.patch("/{pet_id}", response_model=PetResponse)
-def update_pet_endpoint(pet_id: int, pet_update: PetUpdate, db: Session = Depends(get_db)):
-    pet = get_pet_by_id(db, pet_id)
+async def update_pet_endpoint(pet_id: int, pet_update: PetUpdate, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    pet = await get_pet_by_id_async(db, pet_id)
     if not pet:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Pet not found"
         )
-    updated_pet = update_pet_by_id(db, pet, pet_update, pet_id)
-
-    print(updated_pet)
+    ensure_current_user(pet.uid, current_uid)
+    updated_pet = await update_pet_by_id_async(db, pet, pet_update, pet_id)
 
     return updated_pet
 
 @router.delete("/{pet_id}", response_model=dict)
-def delete_pet_endpoint(pet_id: int, db: Session = Depends(get_db)):
-    pet = get_pet_by_id(db, pet_id)
+async def delete_pet_endpoint(pet_id: int, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    pet = await get_pet_by_id_async(db, pet_id)
     if not pet:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Pet not found"
         )
-    delete_pet_by_id(db, pet)
+    ensure_current_user(pet.uid, current_uid)
+    await delete_pet_by_id_async(db, pet)
     return {"detail": "Pet deleted successfully"}
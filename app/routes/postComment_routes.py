@@ -1,50 +1,68 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from db.session import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_async_db
+from db.replica import get_async_read_db
+from core.dependencies import ensure_current_user, get_current_uid
 from schemas.postComment_schema import PostCommentCreate, PostCommentUpdate, PaginatedPostCommentResponse, PostCommentResponse, PaginatedPostCommentResponseItems
-from services.postComment_service import create_postComment, get_paging_postcomment, get_postComment_by_id, delete_postComment_by_id
+from services.postComment_service import create_postComment_async, get_paging_postcomment_async, get_postComment_by_id_async, delete_postComment_by_id_async
 from typing import List, Optional
 
 router = APIRouter()
 
 @router.post("/{post_id}", response_model=PostCommentResponse)
-def create_postComment_endpoint(
+async def create_postComment_endpoint(
     post_id: str, 
     postComment: PostCommentCreate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    current_uid: str = Depends(get_current_uid)
 ):
+    ensure_current_user(postComment.uid, current_uid)
     parent_id = postComment.parent_id
-    return create_postComment(post_id=post_id, parent_id=parent_id, db=db, postComment=postComment)
+    return await create_postComment_async(post_id=post_id, parent_id=parent_id, db=db, postComment=postComment)
 
 # 댓글 페이징 
 @router.get("/{post_id}", response_model=PaginatedPostCommentResponse)
-def get_paging_postComment_endpoint(
+async def get_paging_postComment_endpoint(
     post_id: str,
     viewer_id: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    direction: str = "after",
+    limit: int = Query(20, ge=1, le=100),
+    replies: int = Query(0, ge=0, le=10),  # 댓글마다 함께 내려줄 답글 수
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     
-    result = get_paging_postcomment(post_id=post_id, viewer_id=viewer_id, comment_id=None, db=db)
+    result = await get_paging_postcomment_async(
+        post_id=post_id, viewer_id=viewer_id, comment_id=None, db=db,
+        cursor=cursor, limit=limit, direction=direction, replies=replies
+    )
     return result
 
 # 답글 조회
 @router.get("/subComment/{comment_id}", response_model=PaginatedPostCommentResponse)
-def get_paging_postComment_endpoint(
+async def get_paging_postComment_endpoint(
     comment_id: int,
     viewer_id: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    direction: str = "after",
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     
-    result = get_paging_postcomment(post_id=None, viewer_id=viewer_id, comment_id=comment_id, db=db)
+    result = await get_paging_postcomment_async(
+        post_id=None, viewer_id=viewer_id, comment_id=comment_id, db=db,
+        cursor=cursor, limit=limit, direction=direction
+    )
     return result
 
 @router.delete("/{comment_id}", response_model=dict)
-def delete_postComment_endpoint(comment_id: int, db: Session = Depends(get_db)):
-    postComment = get_postComment_by_id(db, comment_id)
+async def delete_postComment_endpoint(comment_id: int, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    postComment = await get_postComment_by_id_async(db, comment_id)
     if not postComment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="comment not found"
         )
-    delete_postComment_by_id(db, postComment)
+    ensure_current_user(postComment.uid, current_uid)
+    await delete_postComment_by_id_async(db, postComment)
     return {"detail": "comment deleted successfully"}
@@ -1,23 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_async_db
+from core.dependencies import ensure_current_user, get_current_uid
 from schemas.postLike_schema import PostLikeResponse, PostLikeCreate
-from services.postLike_service import create_postLikes, delete_postlikes_by_id, get_like_reaction
+from services.postLike_service import create_postLikes_async, delete_postlikes_by_id_async
 from datetime import timedelta, datetime
 
 router = APIRouter()
 
 @router.post("/", response_model=PostLikeResponse)
-def create_postLikes_endpoint(postLike: PostLikeCreate, db: Session = Depends(get_db)):
-    return create_postLikes(db=db, postLike=postLike)
+async def create_postLikes_endpoint(postLike: PostLikeCreate, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    ensure_current_user(postLike.uid, current_uid)
+    return await create_postLikes_async(db=db, postLike=postLike)
 
 @router.delete("/{post_id}/{uid}", response_model=dict)
-def delete_postLikes_endpoint(post_id: str, uid:str, db: Session = Depends(get_db)):
-    reaction = get_like_reaction(db, post_id, uid )
-    if not reaction:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Postlikes not found"
-        )
-    delete_postlikes_by_id(db, reaction)
-    return {"detail": "likes deleted successfully"}
+async def delete_postLikes_endpoint(post_id: str, uid:str, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    ensure_current_user(uid, current_uid)
+    result = await delete_postlikes_by_id_async(db, post_id, uid)
+    return {
+        "detail": "likes deleted successfully",
+        "post_id": result.post_id,
+        "post_likes": result.post_likes,
+        "liked": result.liked
+    }
@@ -1,20 +1,23 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from db.session import get_db
-from schemas.post_schema import get_journey_response,PostCreate, PostUpdate, PostResponse, PaginatedPostResponse, PaginatedPostResponseItems, PaginatedPostResponse2
-from services.post_service import get_post_by_id2, delete_post_by_id, get_journey, create_post, get_post_by_id, update_post_by_id, get_paginated_posts, get_paginated_posts2
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_async_db
+from db.replica import get_async_read_db
+from core.dependencies import ensure_current_user, get_current_uid
+from schemas.post_schema import get_journey_response, get_journey_calendar_response,PostCreate, PostUpdate, PostResponse, PaginatedPostResponse, PaginatedPostResponseItems, PaginatedPostResponse2
+from services.post_service import get_post_by_id2_async, delete_post_by_id_async, get_journey_async, get_journey_calendar_async, create_post_async, get_post_by_id_async, update_post_by_id_async, get_paginated_posts_async, get_paginated_posts2_async
 from typing import List, Optional #11.02 Optional 추가
 import logging
 
 router = APIRouter()
 
 @router.post("/", response_model=PostResponse)
-def create_post_endpoint(post: PostCreate, db: Session = Depends(get_db)):
-    return create_post(db=db, post=post)
+async def create_post_endpoint(post: PostCreate, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    ensure_current_user(post.uid, current_uid)
+    return await create_post_async(db=db, post=post)
 
 @router.get("/{post_id}", response_model=PostResponse)
-def get_post_endpoint(post_id: str, db: Session = Depends(get_db)):
-    post = get_post_by_id(db, post_id)
+async def get_post_endpoint(post_id: str, db: AsyncSession = Depends(get_async_read_db)):
+    post = await get_post_by_id_async(db, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -23,60 +26,88 @@ def get_post_endpoint(post_id: str, db: Session = Depends(get_db)):
     return post
 
 @router.patch("/{post_id}", response_model=PostResponse)
-def update_post_endpoint(post_id: str, post_update: PostUpdate, db: Session = Depends(get_db)):
-    post = get_post_by_id2(db, post_id)
+async def update_post_endpoint(post_id: str, post_update: PostUpdate, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    post = await get_post_by_id2_async(db, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
-    updated_post = update_post_by_id(db, post, post_update)
+    ensure_current_user(post.uid, current_uid)
+    updated_post = await update_post_by_id_async(db, post, post_update)
     return updated_post
 
 # 무한 스크롤 게시물 조회를 위한 페이지네이션 엔드포인트
 @router.get("/userPosts/{inqr_id}/{viewer_id}", response_model=PaginatedPostResponse)
-def get_posts_endpoint(
+async def get_posts_endpoint(
     inqr_id: str,
     viewer_id : str,
     cursor: Optional[str] = None,
-    db: Session = Depends(get_db)
+    direction: str = "after",
+    db: AsyncSession = Depends(get_async_read_db),
+    current_uid: str = Depends(get_current_uid)
 ):
+    ensure_current_user(viewer_id, current_uid)
     limit: int = 10  # 페이지당 게시물 수
-    result = get_paginated_posts(
+    result = await get_paginated_posts_async(
              db=db, 
              uid=inqr_id, 
              viewer_id=viewer_id,
              cursor=cursor,
              #is_friend = null,
-             limit=limit)
+             limit=limit,
+             direction=direction)
     return result
 
 # 전체 조회 페이징
 @router.get("/getAllPosts/{viewer_id}", response_model=PaginatedPostResponse2)
-def get_posts_endpoint(
+async def get_posts_endpoint(
     viewer_id : str,
     cursor: Optional[str] = None,
-    db: Session = Depends(get_db)
+    direction: str = "after",
+    db: AsyncSession = Depends(get_async_read_db),
+    current_uid: str = Depends(get_current_uid)
 ):
+    ensure_current_user(viewer_id, current_uid)
     logging.info(f"Received request for viewer_id: {viewer_id} with cursor: {cursor}")
                  
     limit: int = 10  # 페이지당 게시물 수
-    result = get_paginated_posts2(
+    result = await get_paginated_posts2_async(
              db=db, 
              viewer_id=viewer_id,
              cursor=cursor,
-             limit=limit)
+             limit=limit,
+             direction=direction)
+    return result
+
+# 월간 journey 캘린더 (일자별 게시물 수 / 썸네일)
+@router.get("/{viewer_id}/calendar/{yyyymm}", response_model=get_journey_calendar_response)
+async def get_journey_calendar_endpoint(
+    viewer_id : str,
+    yyyymm : str,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_uid: str = Depends(get_current_uid)
+):
+    ensure_current_user(viewer_id, current_uid)
+
+    result = await get_journey_calendar_async(
+             db=db, 
+             viewer_id=viewer_id,
+             yyyymm=yyyymm)
+
     return result
 
 # 전체 조회 페이징
 @router.get("/{viewer_id}/{inqr_date}", response_model=get_journey_response)
-def get_journey_endpoint(
+async def get_journey_endpoint(
     viewer_id : str,
     inqr_date : str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db),
+    current_uid: str = Depends(get_current_uid)
 ):
+    ensure_current_user(viewer_id, current_uid)
 
-    result = get_journey(
+    result = await get_journey_async(
              db=db, 
              viewer_id=viewer_id,
              inqr_date=inqr_date)
@@ -84,12 +115,13 @@ def get_journey_endpoint(
     return result
 
 @router.delete("/{post_id}", response_model=dict)
-def delete_post_endpoint(post_id: str, db: Session = Depends(get_db)):
-    post = get_post_by_id2(db, post_id)
+async def delete_post_endpoint(post_id: str, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    post = await get_post_by_id2_async(db, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
-    delete_post_by_id(db, post)
+    ensure_current_user(post.uid, current_uid)
+    await delete_post_by_id_async(db, post)
     return {"detail": "Post deleted successfully"}
\ No newline at end of file
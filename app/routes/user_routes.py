@@ -1,15 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from db.session import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.session import get_async_db
+from db.replica import get_async_read_db
 from typing import List 
 from schemas.user_schema import UserResponse, UserProfileUpdate, UserResponseWithFile
 from schemas.pet_schema import PetResponse, PetResponseWithFile
-from services.user_service import get_user_by_uid, update_user_profile_by_uid, get_pets_by_user_id, get_user_and_file_info
+from services.user_service import get_user_by_uid_async, update_user_profile_by_uid_async, get_pets_by_user_id_async, get_user_and_file_info_async
+from core.dependencies import ensure_current_user, get_current_uid, get_current_user
 router = APIRouter()
 
+# 액세스 토큰의 사용자 정보 (/{uid} 보다 먼저 등록)
+@router.get("/me", response_model=UserResponseWithFile)
+async def get_my_profile(user: UserResponseWithFile = Depends(get_current_user)):
+    return user
+
 @router.get("/{uid}", response_model=UserResponseWithFile)
-def get_user_profile(uid: str, db: Session = Depends(get_db)):
-    user = get_user_and_file_info(db, uid)
+async def get_user_profile(uid: str, db: AsyncSession = Depends(get_async_read_db)):
+    user = await get_user_and_file_info_async(db, uid)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -18,8 +25,8 @@ def get_user_profile(uid: str, db: Session = Depends(get_db)):
     return user
 
 @router.get("/{uid}/pets", response_model=List[PetResponseWithFile])
-def get_pets_by_user_id_endpoint(uid: str, db: Session = Depends(get_db)):
-    pets = get_pets_by_user_id(db, uid)
+async def get_pets_by_user_id_endpoint(uid: str, db: AsyncSession = Depends(get_async_read_db)):
+    pets = await get_pets_by_user_id_async(db, uid)
     if not pets:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -28,12 +35,13 @@ def get_pets_by_user_id_endpoint(uid: str, db: Session = Depends(get_db)):
     return pets
 
 @router.patch("/profile/{uid}", response_model=UserResponse)
-def update_user_profile(uid: str, profile_update: UserProfileUpdate, db: Session = Depends(get_db)):
-    user = get_user_by_uid(db, uid)
+async def update_user_profile(uid: str, profile_update: UserProfileUpdate, db: AsyncSession = Depends(get_async_db), current_uid: str = Depends(get_current_uid)):
+    ensure_current_user(uid, current_uid)
+    user = await get_user_by_uid_async(db, uid)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
-    updated_user = update_user_profile_by_uid(db, user, profile_update)
+    updated_user = await update_user_profile_by_uid_async(db, user, profile_update)
     return updated_user
\ No newline at end of file
@@ -23,4 +23,10 @@ class CommunityResponse(BaseModel):
     file_url: Optional[str] = None
 
     class Config:
-        orm = True
\ No newline at end of file
+        orm = True
+
+class TrendingPostResponse(CommunityResponse):
+    score: float  # 시간 감쇠가 적용된 인기 점수
+    post_likes: int = 0
+    comment_cnt: int = 0
+    created_at: Optional[datetime] = None
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 class FileBase(BaseModel):
     file_name: str = Field(..., description="Hashed file name")
@@ -16,3 +16,21 @@ class FileResponse(FileBase):
 
     class Config:
         orm_mode = True
+
+
+class FileUploadUrlRequest(BaseModel):
+    uid: str = Field(..., description="ID of the user who uploads the file")
+    file_name: str = Field(..., min_length=1, max_length=255, description="Original file name")
+    content_type: str = Field(..., description="MIME type of the file")
+    size: int = Field(..., gt=0, description="File size in bytes")
+
+class FileUploadUrlResponse(BaseModel):
+    file_id: int = Field(..., description="ID of the pending file record")
+    upload_url: str = Field(..., description="Presigned POST URL")
+    fields: Dict[str, str] = Field(..., description="Form fields to send with the file in the POST request")
+    file_url: str = Field(..., description="URL of the file on S3 after upload")
+    expires_in: int = Field(..., description="Seconds until the presigned URL expires")
+
+class FileCompleteRequest(BaseModel):
+    uid: str = Field(..., description="ID of the user who uploaded the file")
+    file_id: int = Field(..., description="ID of the pending file record")
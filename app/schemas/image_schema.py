@@ -3,18 +3,18 @@ from typing import Optional
 
 class ImageBase(BaseModel):
     image_id: str
-    file_id: str
+    file_id: int
     file_url: str = Field(..., description="URL of the file on S3")
 
 class ImageCreate(BaseModel):
     image_id: str
-    file_id: str
+    file_id: int
     file_url: Optional[str]
     model: Optional[str]
 
 class ImageResponse(BaseModel):
     image_id: str
-    file_id: str
+    file_id: int
     file_url: str = Field(..., description="URL of the file on S3")
     model: Optional[str]
 
@@ -35,6 +35,10 @@ class PaginatedPostCommentResponseItems(BaseModel):
        
     child_comment_cnt : Optional[int] = 0
 
+    # 답글 펼치기 (replies > 0 으로 조회한 경우)
+    replies: Optional[List["PaginatedPostCommentResponseItems"]] = None
+    replies_next_cursor: Optional[str] = None  # 나머지 답글 조회용 커서
+
     class Config:
         orm_mode = True
         from_attributes = True  # ORM 객체에서 속성 매핑 가능하게 설정
@@ -43,6 +47,7 @@ class PaginatedPostCommentResponse(BaseModel):
     items: List[PaginatedPostCommentResponseItems]  # 페이지네이션 결과로 포함된 게시물 리스트
     has_more: Optional[bool] = None  # 다음 페이지 존재 여부
     next_cursor: Optional[str] = None  # 다음 페이지를 조회하기 위한 커서 값 (없으면 None)
+    prev_cursor: Optional[str] = None  # 이전 페이지를 조회하기 위한 커서 값 (없으면 None)
 
     class Config:
         from_attributes = True  # ORM 객체에서 속성 매핑
@@ -7,6 +7,8 @@ class PostLikeResponse(BaseModel):
     post_id: Optional[str] = None
     uid: Optional[str] = None
     created_at: Optional[datetime] = None
+    post_likes: Optional[int] = None  # 처리 후 게시물 좋아요 수
+    liked: Optional[bool] = None  # 처리 후 좋아요 상태
 
 class PostLikeCreate(BaseModel):
     post_id: str
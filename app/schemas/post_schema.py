@@ -68,6 +68,7 @@ class PaginatedPostResponse(BaseModel):
     items: List[PaginatedPostResponseItems]  # 페이지네이션 결과로 포함된 게시물 리스트
     has_more: bool  # 다음 페이지 존재 여부
     next_cursor: Optional[str]  # 다음 페이지를 조회하기 위한 커서 값 (없으면 None)
+    prev_cursor: Optional[str] = None  # 이전 페이지를 조회하기 위한 커서 값 (없으면 None)
     class Config:
         from_attributes = True  # ORM 객체에서 속성 매핑
 
@@ -76,6 +77,7 @@ class PaginatedPostResponse2(BaseModel):
     items: List[PaginatedPostResponseItems]  # 페이지네이션 결과로 포함된 게시물 리스트
     has_more: bool  # 다음 페이지 존재 여부
     next_cursor: Optional[str] = None  # 다음 페이지를 조회하기 위한 커서 값 (없으면 None)
+    prev_cursor: Optional[str] = None  # 이전 페이지를 조회하기 위한 커서 값 (없으면 None)
     class Config:
         from_attributes = True  # ORM 객체에서 속성 매핑
 
@@ -100,3 +102,11 @@ class get_journey_response(BaseModel):
     class Config:
         from_attributes = True  # ORM 객체에서 속성 매핑
 
+class get_journey_calendar_response_items(BaseModel):
+    date: str  # 일자 (YYYYMMDD, KST)
+    post_cnt: int  # 해당 일자 게시물 수
+    thumbnail_url: Optional[str] = None  # 해당 일자 첫 게시물의 첫 이미지
+
+class get_journey_calendar_response(BaseModel):
+    yyyymm: str
+    items: List[get_journey_calendar_response_items]  # 게시물이 있는 일자만 포함
@@ -4,12 +4,10 @@ from datetime import datetime
 
 class TokenCreate(BaseModel):
     uid: str
-    access_token: str
     refresh_token: str
     provider: str
 
 class TokenUpdate(BaseModel):
-    access_token: Optional[str] = None
     refresh_token: Optional[str] = None
 
 class TokenResponse(BaseModel):
@@ -22,6 +20,7 @@ class TokenResponse(BaseModel):
 
 class RefreshTokenResponse(BaseModel):
     access_token: str
+    refresh_token: str  # 교체된 새 리프레시 토큰 (기존 토큰은 더 이상 사용할 수 없음)
     token_type: str
 
     class Config:
@@ -1,16 +1,29 @@
+import hashlib
+import logging
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
+from core.config import settings
+from db.session import async_service
 from models.tokens import Token
 from schemas.token_schema import TokenCreate, TokenUpdate
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
 
-def create_tokens(db: Session, token_data: TokenCreate) -> Token:
+logger = logging.getLogger(__name__)
+
+def hash_refresh_token(refresh_token: str) -> str:
+    # 리프레시 토큰은 원문 대신 고정 길이 해시로 저장/조회
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
 
-    print(token_data)
+def refresh_token_expires_at() -> datetime:
+    return datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
+def create_tokens(db: Session, token_data: TokenCreate) -> Token:
+    # 액세스 토큰은 저장하지 않음 (서명/만료로만 검증), 리프레시 토큰은 해시만 저장
     new_token = Token(
         uid=token_data["uid"],
-        access_token=token_data["access_token"],
-        refresh_token=token_data["refresh_token"],
+        refresh_token_hash=hash_refresh_token(token_data["refresh_token"]),
+        expires_at=refresh_token_expires_at(),
         provider=token_data["provider"],
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow()
@@ -26,8 +39,8 @@ def get_tokens_by_user_id(db: Session, user_id: str) -> Token:
 def update_tokens(db: Session, user_id: str, token_data: TokenUpdate) -> Token:
     token = db.query(Token).filter(Token.user_id == user_id).first()
     if token:
-        token.access_token = token_data.access_token
-        token.refresh_token = token_data.refresh_token
+        token.refresh_token_hash = hash_refresh_token(token_data.refresh_token)
+        token.expires_at = refresh_token_expires_at()
         token.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(token)
@@ -40,4 +53,71 @@ def delete_tokens_by_user_id(db: Session, user_id: str) -> None:
         db.commit()
 
 def get_token_by_refresh_token(db: Session, refresh_token: str) -> Token:
-    return db.query(Token).filter(Token.refresh_token == refresh_token).first()
+    return (
+        db.query(Token)
+        .filter(Token.refresh_token_hash == hash_refresh_token(refresh_token))
+        .filter(Token.expires_at > datetime.utcnow())
+        .first()
+    )
+
+def rotate_refresh_token(db: Session, uid: str, refresh_token: str, new_refresh_token: str) -> bool:
+    """
+    * method:   rotate_refresh_token
+    * purpose:  만료되지 않은 리프레시 토큰을 새 토큰으로 교체 (unique 인덱스 조회 + 갱신을 UPDATE 한 문장으로)
+                이미 교체되었거나 만료/삭제된 토큰이면 False
+    """
+    now = datetime.utcnow()
+    session_id = db.execute(
+        update(Token)
+        .where(
+            Token.refresh_token_hash == hash_refresh_token(refresh_token),
+            Token.uid == uid,
+            Token.expires_at > now,
+        )
+        .values(
+            refresh_token_hash=hash_refresh_token(new_refresh_token),
+            expires_at=refresh_token_expires_at(),
+            updated_at=now,
+        )
+        .returning(Token.session_id)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+    db.commit()
+    return session_id is not None
+
+def delete_expired_tokens(db: Session, batch_size: int = 1000) -> int:
+    """
+    * method:   delete_expired_tokens
+    * purpose:  만료된 토큰을 batch_size 개씩 나누어 삭제 (배치마다 커밋하여 잠금 시간을 짧게 유지)
+    """
+    deleted = 0
+    while True:
+        # 다른 워커가 정리 중인 행은 건너뛰고 잠근 뒤, 같은 트랜잭션에서 PK 로 삭제
+        session_ids = db.scalars(
+            select(Token.session_id)
+            .where(Token.expires_at <= datetime.utcnow())
+            .order_by(Token.expires_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if session_ids:
+            db.execute(
+                delete(Token).where(Token.session_id.in_(session_ids)).execution_options(synchronize_session=False)
+            )
+        db.commit()
+        deleted += len(session_ids)
+        if len(session_ids) < batch_size:
+            break
+
+    if deleted:
+        logger.info(f"Deleted {deleted} expired tokens")
+    return deleted
+
+
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+create_tokens_async = async_service(create_tokens)
+get_tokens_by_user_id_async = async_service(get_tokens_by_user_id)
+update_tokens_async = async_service(update_tokens)
+delete_tokens_by_user_id_async = async_service(delete_tokens_by_user_id)
+get_token_by_refresh_token_async = async_service(get_token_by_refresh_token)
+rotate_refresh_token_async = async_service(rotate_refresh_token)
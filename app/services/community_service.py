@@ -0,0 +1,152 @@
+# services/community_service.py
+
+import logging
+import threading
+import time
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from core.config import settings
+from db.session import session_scope, async_service
+from models.posts import Posts
+from schemas.community_schema import CommunityResponse, TrendingPostResponse
+from services.post_service import get_post_top
+from services.image_service import load_images
+from services.trending_service import trending_engine
+from services.user_service import get_users_with_profile_by_uids
+
+logger = logging.getLogger(__name__)
+
+# 여러 워커가 동시에 뷰를 갱신하지 않도록 사용하는 advisory lock 키
+TOP_POSTS_REFRESH_LOCK_KEY = 7_200_001
+
+def refresh_top_posts_view(db: Session) -> bool:
+    """
+    * method:   refresh_top_posts_view
+    * purpose:  community_top_posts 뷰 갱신 (다른 워커가 갱신 중이면 건너뜀)
+    """
+    locked = db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": TOP_POSTS_REFRESH_LOCK_KEY}).scalar()
+    if locked:
+        db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY community_top_posts"))
+    db.commit()
+    return bool(locked)
+
+def load_top_posts(db: Session) -> List[CommunityResponse]:
+    posts = get_post_top(db) or []
+    return [
+        CommunityResponse(
+            post_id=post.post_id,
+            uid=post.uid,
+            user_name=post.user_name,
+            profile_image_url=post.profile_image_url,
+            title=post.title,
+            content=post.content,
+            file_name=post.file_name,
+            file_url=post.file_url
+        )
+        for post in posts
+    ]
+
+class TopPostsSnapshot:
+    """
+    상위 게시물 프로세스 내 스냅샷 (stale-while-revalidate)
+    - 스냅샷이 없을 때만 요청 스레드에서 동기 조회
+    - ttl 이 지나면 기존 스냅샷을 그대로 반환하고 백그라운드 스레드에서 다시 조회
+    """
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._items: Optional[List[CommunityResponse]] = None
+        self._loaded_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> List[CommunityResponse]:
+        if self._items is None:
+            self.set(load_top_posts(db))
+        elif time.monotonic() - self._loaded_at > self.ttl:
+            self._revalidate_in_background()
+        return self._items
+
+    def set(self, items: List[CommunityResponse]):
+        self._items = items
+        self._loaded_at = time.monotonic()
+
+    def reload(self):
+        with session_scope() as db:
+            self.set(load_top_posts(db))
+
+    def _revalidate_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.reload()
+            except Exception:
+                logger.exception("Failed to reload top posts snapshot")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="top-posts-revalidate", daemon=True).start()
+
+top_posts_snapshot = TopPostsSnapshot(ttl=settings.COMMUNITY_TOP_POSTS_REFRESH_INTERVAL)
+
+def get_top_posts(db: Session) -> List[CommunityResponse]:
+    return top_posts_snapshot.get(db)
+
+def refresh_top_posts_job():
+    with session_scope() as db:
+        refresh_top_posts_view(db)
+    top_posts_snapshot.reload()
+
+def get_trending_posts(db: Session, window: str, limit: int) -> List[TrendingPostResponse]:
+    """
+    * method:   get_trending_posts
+    * purpose:  인기 점수 상위 게시물을 조회하고 작성자/이미지 정보를 일괄 조회하여 반환
+    """
+    if not trending_engine.is_loaded:
+        trending_engine.load(db)
+
+    ranked = trending_engine.top(window, limit)
+    post_ids = [post_id for post_id, _ in ranked]
+    if not post_ids:
+        return []
+
+    posts_by_id = {post.post_id: post for post in db.query(Posts).filter(Posts.post_id.in_(post_ids)).all()}
+    # 이미지를 먼저 예약해 두면 작성자 조회 시 같은 tick 에서 File 을 한번에 조회
+    images_by_post = {post_id: load_images(db, post_id) for post_id in post_ids}
+    users_by_uid = get_users_with_profile_by_uids(db, [post.uid for post in posts_by_id.values()])
+
+    response = []
+    for post_id, score in ranked:
+        post = posts_by_id.get(post_id)
+        if post is None:
+            continue
+
+        user, profile_image_url = users_by_uid.get(post.uid, (None, None))
+        images = images_by_post[post_id].get()
+        first_image = images[0] if images else {}
+
+        response.append(TrendingPostResponse(
+            post_id=post.post_id,
+            uid=post.uid,
+            user_name=user.user_name if user else "",
+            profile_image_url=profile_image_url,
+            title=post.title,
+            content=post.content,
+            file_name=first_image.get("file_name"),
+            file_url=first_image.get("file_url"),
+            score=score,
+            post_likes=post.post_likes,
+            comment_cnt=post.comment_cnt,
+            created_at=post.created_at
+        ))
+
+    return response
+
+
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+get_top_posts_async = async_service(get_top_posts)
+get_trending_posts_async = async_service(get_trending_posts)
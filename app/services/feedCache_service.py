@@ -0,0 +1,100 @@
+# services/feedCache_service.py
+
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Set
+from sqlalchemy.orm import Session
+from core.config import settings
+from db.notify import publish_invalidation, publish_invalidation_coalesced
+from utils.cache import TTLCache, register_cache
+
+HEAD_TAG = "head"  # 최신 게시물 쪽이 열려 있는 페이지 (새 게시물이 추가되면 내용이 바뀜)
+MAX_TRACKED_DEPTH = 10  # 이 깊이 이상은 하나로 묶어서 집계
+
+def post_tag(post_id: str) -> str:
+    return f"p:{post_id}"
+
+def user_tag(uid: str) -> str:
+    return f"u:{uid}"
+
+class FeedPageCache(TTLCache):
+    """
+    피드 페이지 캐시 (커서 구간별, 뷰어와 무관한 게시물 정보만 저장)
+    - 페이지마다 태그(head / p:post_id / u:uid)를 붙여 두고, 무효화 알림은 태그 단위로 처리
+      (게시물 수정/삭제/좋아요/댓글 → 해당 게시물이 포함된 페이지, 작성자 프로필 변경 → 작성자 게시물이 포함된 페이지,
+       새 게시물 → 첫 페이지 쪽 페이지)
+    - 페이지 깊이별 적중률 집계
+    """
+    def __init__(self, name: str, ttl: float, max_size: int):
+        super().__init__(name, ttl, max_size)
+        self._keys_by_tag: Dict[str, Set[Hashable]] = {}
+        self._tags_by_key: Dict[Hashable, List[str]] = {}
+        self.depth_hits = Counter()
+        self.depth_misses = Counter()
+
+    def get_page(self, key: Hashable, depth: int):
+        page = self.get(key)
+        with self._lock:
+            counter = self.depth_hits if page is not None else self.depth_misses
+            counter[min(depth, MAX_TRACKED_DEPTH)] += 1
+        return page
+
+    def set_page(self, key: Hashable, page: dict, tags: Iterable[str], generation: int):
+        tags = list(tags)
+        with self._lock:
+            if self.invalidated_since(tags, generation):
+                return  # 조회 중 이 페이지의 태그가 무효화되어 저장하지 않음 (다른 태그의 무효화는 무관)
+            self.set(key, page)
+            entry = self._items.get(key)
+            if entry is None or entry[0] is not page:
+                return  # 캐시 미사용
+            self._tags_by_key[key] = tags
+            for tag in self._tags_by_key[key]:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    def invalidate(self, tag: Hashable):
+        with self._lock:
+            self._mark_invalidated(tag)
+            for key in list(self._keys_by_tag.get(tag, ())):
+                if key in self._items:
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._keys_by_tag.clear()
+            self._tags_by_key.clear()
+
+    def _remove(self, key: Hashable):
+        super()._remove(key)
+        for tag in self._tags_by_key.pop(key, []):
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            depths = {}
+            for depth in sorted(set(self.depth_hits) | set(self.depth_misses)):
+                hits, misses = self.depth_hits[depth], self.depth_misses[depth]
+                label = f"{depth}+" if depth == MAX_TRACKED_DEPTH else str(depth)
+                depths[label] = {"hits": hits, "misses": misses, "hit_ratio": round(hits / (hits + misses), 4)}
+            stats["depth"] = depths
+        return stats
+
+feed_page_cache = register_cache("feed", settings.FEED_CACHE_TTL, settings.FEED_CACHE_MAX_PAGES, FeedPageCache)
+
+# 아래 함수들은 쓰기 트랜잭션 안에서 호출 (커밋 시 모든 워커의 피드 캐시에서 제거)
+def invalidate_feed_head(db: Session):
+    publish_invalidation(db, "feed", [HEAD_TAG])
+
+def invalidate_feed_posts(db: Session, post_ids: Iterable[str], coalesced: bool = False):
+    # coalesced: 좋아요 수 변경처럼 잦은 변경은 다른 워커 알림을 모아서 발행
+    publish = publish_invalidation_coalesced if coalesced else publish_invalidation
+    publish(db, "feed", [post_tag(post_id) for post_id in post_ids])
+
+def invalidate_feed_user(db: Session, uid: str):
+    publish_invalidation(db, "feed", [user_tag(uid)])
@@ -0,0 +1,64 @@
+# services/file_service.py
+
+from typing import Iterable, Optional
+from sqlalchemy.orm import Session
+from db.session import async_service
+from models.file import File
+from utils.error_code import ErrorCode, raise_error
+
+FILE_STATUS_PENDING = 0
+FILE_STATUS_COMPLETED = 1
+
+def create_pending_file(db: Session, uid: str, file_name: str, file_url: str, content_type: str, size: int) -> File:
+    """
+    * method:   create_pending_file
+    * purpose:  presigned 업로드 URL 발급 시 업로드 대기 상태의 파일 정보 생성 (file_name 은 S3 객체 키)
+    """
+    db_file = File(
+        file_name=file_name,
+        file_url=file_url,
+        uid=uid,
+        status=FILE_STATUS_PENDING,
+        size=size,
+        content_type=content_type
+    )
+    db.add(db_file)
+    db.commit()
+    db.refresh(db_file)
+    return db_file
+
+def get_file_by_id(db: Session, file_id: int):
+    return db.query(File).filter(File.file_id == file_id).first()
+
+def ensure_files_completed(db: Session, file_ids: Iterable[Optional[int]]):
+    """
+    * method:   ensure_files_completed
+    * purpose:  게시물/프로필/반려동물에 연결할 파일이 모두 업로드 완료 상태인지 확인
+                (없는 파일이면 FILE_NOT_FOUND, presigned 업로드 후 완료 처리 전이면 UPLOAD_NOT_COMPLETED)
+    """
+    file_ids = {int(file_id) for file_id in file_ids if file_id is not None}
+    if not file_ids:
+        return
+    statuses = dict(db.query(File.file_id, File.status).filter(File.file_id.in_(file_ids)).all())
+    if len(statuses) != len(file_ids):
+        raise_error(ErrorCode.FILE_NOT_FOUND)
+    if any(status != FILE_STATUS_COMPLETED for status in statuses.values()):
+        raise_error(ErrorCode.UPLOAD_NOT_COMPLETED)
+
+def complete_file(db: Session, file: File, size: int, content_type: str) -> File:
+    """
+    * method:   complete_file
+    * purpose:  S3 에서 확인한 크기/타입으로 파일 정보를 갱신하고 업로드 완료 처리
+    """
+    file.status = FILE_STATUS_COMPLETED
+    file.size = size
+    file.content_type = content_type
+    db.commit()
+    db.refresh(file)
+    return file
+
+
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+create_pending_file_async = async_service(create_pending_file)
+get_file_by_id_async = async_service(get_file_by_id)
+complete_file_async = async_service(complete_file)
@@ -1,9 +1,14 @@
 from sqlalchemy.orm import Session
+from db.session import async_service
 from models.images import Images
 from models.file import File
+from services.file_service import FILE_STATUS_COMPLETED, ensure_files_completed
 from schemas.image_schema import ImageCreate, ImageResponse
+from typing import Dict, List
+from utils.dataloader import Deferred, get_loader
 
 def create_image(db: Session, image:ImageCreate):
+    ensure_files_completed(db, [image.file_id])
     db_image = Images(
         image_id=image.image_id,
         file_id=image.file_id,
@@ -16,15 +21,28 @@ def create_image(db: Session, image:ImageCreate):
     db.refresh(db_image)
     return db_image
 
-def get_images(db: Session, image_id: str):
+def batch_load_files(db: Session, file_ids: List[int]) -> Dict[int, File]:
+    """
+    * method:   batch_load_files
+    * purpose:  DataLoader 배치 함수. 업로드 완료된 파일 정보를 한번에 조회 (업로드 대기 중인 파일은 없는 것으로 처리)
+    """
+    files = db.query(File).filter(File.file_id.in_(file_ids), File.status == FILE_STATUS_COMPLETED).all()
+    return {file.file_id: file for file in files}
+
+def load_file(db: Session, file_id: int) -> Deferred:
+    return get_loader(db, batch_load_files).load(file_id)
 
-    image_query = db.query(Images).filter(Images.image_id == image_id).all()
-    
-    response_models = []
+def batch_load_images(db: Session, image_ids: List[str]) -> Dict[str, List[dict]]:
+    """
+    * method:   batch_load_images
+    * purpose:  DataLoader 배치 함수. 여러 image_id의 이미지 목록을 한번에 조회 (Images 1회 + File 1회)
+    """
+    image_query = db.query(Images).filter(Images.image_id.in_(image_ids)).all()
+    files = get_loader(db, batch_load_files).get_many({image.file_id for image in image_query})
 
+    response_models = {image_id: [] for image_id in image_ids}
     for image in image_query:
-        # File 테이블에서 file_id로 파일 정보 필터링
-        file_query = db.query(File).filter(File.file_id == image.file_id).first()
+        file_query = files.get(image.file_id)
 
         if file_query:
             response_model = {
@@ -33,8 +51,25 @@ def get_images(db: Session, image_id: str):
                 "file_url":file_query.file_url    # model에 image.name 사용
             }
 
-            response_models.append(response_model)
+            response_models[image.image_id].append(response_model)
 
     return response_models
-    
 
+def load_images(db: Session, image_id: str) -> Deferred:
+    return get_loader(db, batch_load_images, default=[]).load(image_id)
+
+def get_images(db: Session, image_id: str):
+    return load_images(db, image_id).get()
+
+def get_images_by_image_ids(db: Session, image_ids: List[str]) -> Dict[str, List[dict]]:
+    """
+    * method:   get_images_by_image_ids
+    * purpose:  여러 image_id의 이미지 목록을 한번에 조회 (요청 내 이미 조회한 image_id 는 재조회하지 않음)
+    """
+    return get_loader(db, batch_load_images, default=[]).get_many(image_ids)
+
+
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+create_image_async = async_service(create_image)
+get_images_async = async_service(get_images)
+get_images_by_image_ids_async = async_service(get_images_by_image_ids)
@@ -0,0 +1,133 @@
+# services/likeCounter_service.py
+
+import logging
+import threading
+from typing import Dict, List
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from core.config import settings
+from db.notify import publish_invalidation
+from services.feedCache_service import invalidate_feed_posts
+from db.session import session_scope
+
+logger = logging.getLogger(__name__)
+
+class LikeCounterBuffer:
+    """
+    좋아요 수 write-behind 버퍼 (LIKE_WRITE_BEHIND 설정 시 사용)
+    - 좋아요/취소 시 posts 행을 바로 갱신하지 않고 게시물별 증감값만 메모리에 누적
+    - 전용 스레드가 flush_interval 마다, 또는 누적 이벤트가 flush_max_events 에 도달하면
+      UPDATE ... FROM (VALUES ...) 한 문장으로 일괄 반영
+    - 원본은 postLikes 행이므로 프로세스가 비정상 종료되어 유실된 증감값은
+      reconcile_like_counters 보정 작업에서 복구됨 (최근 좋아요가 있는 게시물은 반영 대기 중일 수 있으므로 보정하지 않음)
+    """
+    def __init__(self, flush_interval: float, flush_max_events: int):
+        self.flush_interval = flush_interval
+        self.flush_max_events = flush_max_events
+        self._lock = threading.Lock()
+        self._deltas: Dict[str, int] = {}
+        self._inflight: Dict[str, int] = {}  # 반영 중인 증감값 (커밋 전까지 조회에 포함)
+        self._events = 0
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def add(self, post_id: str, delta: int):
+        with self._lock:
+            self._deltas[post_id] = self._deltas.get(post_id, 0) + delta
+            self._events += 1
+            if self._events >= self.flush_max_events:
+                self._wakeup.set()
+
+    def pending(self, post_id: str) -> int:
+        with self._lock:
+            return self._deltas.get(post_id, 0) + self._inflight.get(post_id, 0)
+
+    def pending_many(self, post_ids: List[str]) -> Dict[str, int]:
+        with self._lock:
+            return {
+                post_id: self._deltas.get(post_id, 0) + self._inflight.get(post_id, 0)
+                for post_id in post_ids
+            }
+
+    def flush(self, db: Session) -> int:
+        """
+        * method:   flush
+        * purpose:  누적된 증감값을 한 번의 UPDATE 로 반영하고 반영한 게시물 수를 반환
+        """
+        with self._lock:
+            batch = {post_id: delta for post_id, delta in self._deltas.items() if delta}
+            self._deltas = {}
+            self._events = 0
+            self._inflight = batch
+
+        if not batch:
+            return 0
+
+        # post_id 순서로 고정하여 여러 워커가 동시에 반영할 때 교착 상태 방지
+        params = {}
+        values = []
+        for index, (post_id, delta) in enumerate(sorted(batch.items())):
+            params[f"p{index}"] = post_id
+            params[f"d{index}"] = delta
+            values.append(f"(CAST(:p{index} AS VARCHAR), CAST(:d{index} AS INTEGER))")
+
+        try:
+            db.execute(text(
+                "UPDATE posts SET post_likes = GREATEST(posts.post_likes + v.delta, 0)"
+                f" FROM (VALUES {', '.join(values)}) AS v(post_id, delta)"
+                " WHERE posts.post_id = v.post_id"
+            ), params)
+            publish_invalidation(db, "post", batch.keys())
+            invalidate_feed_posts(db, batch.keys())
+            # 커밋과 반영 중 증감값 제거를 같은 잠금 안에서 처리 (조회 시 이중 합산 방지)
+            with self._lock:
+                db.commit()
+                self._inflight = {}
+        except Exception:
+            db.rollback()
+            # 실패한 증감값은 다음 반영 때 다시 시도
+            with self._lock:
+                for post_id, delta in batch.items():
+                    self._deltas[post_id] = self._deltas.get(post_id, 0) + delta
+                self._inflight = {}
+            raise
+
+        return len(batch)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                with session_scope() as db:
+                    self.flush(db)
+            except Exception:
+                logger.exception("Failed to flush like counters")
+
+    def start(self):
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="like-counter-flusher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopped.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        # 종료 전 남은 증감값 반영
+        with session_scope() as db:
+            self.flush(db)
+
+like_counter_buffer = LikeCounterBuffer(
+    flush_interval=settings.LIKE_FLUSH_INTERVAL_MS / 1000,
+    flush_max_events=settings.LIKE_FLUSH_MAX_EVENTS
+)
+
+def get_pending_likes(post_ids: List[str]) -> Dict[str, int]:
+    # write-behind 모드가 아니면 항상 0
+    if not settings.LIKE_WRITE_BEHIND:
+        return {}
+    return like_counter_buffer.pending_many(post_ids)
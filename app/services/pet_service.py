@@ -1,9 +1,20 @@
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
+from core.config import settings
+from db.notify import publish_invalidation
+from db.session import async_service
+from db.replica import primary_session
 from models.pets import Pet
 from models.file import File
+from services.file_service import FILE_STATUS_COMPLETED, ensure_files_completed
 from schemas.pet_schema import PetCreate, PetUpdate, PetResponse, PetResponseWithFile
+from utils.cache import register_cache
+
+# 반려동물 상세 캐시 (str(pet_id) -> PetResponseWithFile)
+pet_cache = register_cache("pet", settings.ENTITY_CACHE_TTL, settings.ENTITY_CACHE_MAX_SIZE)
 
 def create_pet(db: Session, pet: PetCreate):
+    ensure_files_completed(db, [pet.pet_img_id])
     db_pet = Pet(
         uid=pet.uid,
         name=pet.name,
@@ -34,9 +45,18 @@ def get_pet_by_id(db: Session, pet_id: int):
     return None
 
 def get_pet_by_id_with_file(db: Session, pet_id: int):
+    # 수정/삭제 시 모든 워커의 캐시를 무효화
+    return pet_cache.get_or_load(str(pet_id), lambda: load_pet_from_primary(db, pet_id))
+
+def load_pet_from_primary(db: Session, pet_id: int):
+    # 캐시에는 복제 지연으로 쓰기 이전 값이 TTL 동안 남지 않도록 primary 에서 조회한 값만 저장
+    with primary_session(db) as primary:
+        return query_pet_by_id_with_file(primary, pet_id)
+
+def query_pet_by_id_with_file(db: Session, pet_id: int):
     result = (
         db.query(Pet, File.file_name, File.file_url)
-        .outerjoin(File, Pet.pet_img_id == File.file_id)
+        .outerjoin(File, and_(Pet.pet_img_id == File.file_id, File.status == FILE_STATUS_COMPLETED))
         .filter(Pet.pet_id == pet_id)
         .first()
     )
@@ -66,16 +86,25 @@ def get_pet_by_id_with_file(db: Session, pet_id: int):
     return None
 
 def update_pet_by_id(db: Session, pet: Pet, pet_update: PetUpdate, pet_id: str):
+    ensure_files_completed(db, [pet_update.pet_img_id])
     for key, value in pet_update.dict(exclude_unset=True).items():
         setattr(pet, key, value)
     
-    print(pet)
-
+    publish_invalidation(db, "pet", [pet.pet_id])
     db.commit()
     db.refresh(pet)
 
     return pet
 
 def delete_pet_by_id(db: Session, pet: Pet):
+    publish_invalidation(db, "pet", [pet.pet_id])
     db.delete(pet)
-    db.commit()
\ No newline at end of file
+    db.commit()
+
+
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+create_pet_async = async_service(create_pet)
+get_pet_by_id_async = async_service(get_pet_by_id)
+get_pet_by_id_with_file_async = async_service(get_pet_by_id_with_file)
+update_pet_by_id_async = async_service(update_pet_by_id)
+delete_pet_by_id_async = async_service(delete_pet_by_id)
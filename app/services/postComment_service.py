@@ -1,12 +1,19 @@
 from sqlalchemy.orm import Session
+from db.session import async_service
 from models.postComments import PostComment
+from models.posts import Posts
 from schemas.postComment_schema import PostCommentCreate, PostCommentUpdate, PaginatedPostCommentResponseItems, PaginatedPostCommentResponse
 from datetime import datetime
 from pytz import timezone
 from pydantic import parse_obj_as
-from sqlalchemy import or_, and_
-from typing import List, Optional 
-from services.post_service import get_user_by_uid
+from sqlalchemy import or_, and_, func, select, update
+from sqlalchemy.orm import aliased
+from typing import Dict, List, Optional, Tuple
+from models.user import User
+from services.user_service import get_user_by_uid, get_users_with_profile_by_uids
+from utils.paginator import KeysetPaginator
+from services.trending_service import trending_engine
+from services.feedCache_service import invalidate_feed_posts
 
 # 댓글생성
 def create_postComment(
@@ -23,79 +30,232 @@ def create_postComment(
         parent_id=parent_id
     )
     db.add(db_postComment)  # 게시물 추가 준비
+
+    # 댓글 수 / 답글 수 카운터를 같은 트랜잭션에서 증가
+    db.query(Posts).filter(Posts.post_id == post_id).update(
+        {Posts.comment_cnt: Posts.comment_cnt + 1}, synchronize_session=False
+    )
+    if parent_id:
+        db.query(PostComment).filter(PostComment.comment_id == parent_id).update(
+            {PostComment.reply_cnt: PostComment.reply_cnt + 1}, synchronize_session=False
+        )
+    invalidate_feed_posts(db, [post_id])
+
     db.commit()  # 데이터베이스에 변경 사항 커밋
     db.refresh(db_postComment)  # 저장된 후 객체를 최신 상태로 갱신
+    trending_engine.record(post_id, comments=1)
     return db_postComment
 
-def convert_posts_to_pydantic(db: Session, items: List[PostComment], viewer_id: Optional[str]):
+# 댓글 정렬 키 (최신순)
+COMMENT_SORTS = ["-created_at", "-comment_id"]
+
+def convert_posts_to_pydantic(
+    items: List[PostComment],
+    viewer_id: Optional[str],
+    users_by_uid: Dict[str, Tuple[User, Optional[str]]]
+):
     response_items = []
     
     for item in items:
         # from_orm을 이용하여 기본 모델 생성
         pydantic_item = PaginatedPostCommentResponseItems.from_orm(item)
-        
-        # 유저정보
-        user_query = get_user_by_uid(db, item.uid)
-        child_comment_cnt = get_child_postComment_cnt(db, item.comment_id)
 
         # 수동으로 각 필드 업데이트
         pydantic_item.can_modify = "y" if (item.uid == viewer_id) else "n"
         pydantic_item.reactions = True
 
-        pydantic_item.user_name = user_query.user_name  
-        pydantic_item.profile_image = user_query.profile_image  
+        # 유저정보 (페이지 단위로 일괄 조회된 값 사용)
+        user, _ = users_by_uid.get(item.uid, (None, None))
+        if user:
+            pydantic_item.user_name = user.user_name  
+            pydantic_item.profile_image = user.profile_image  
 
-        pydantic_item.child_comment_cnt = child_comment_cnt
+        pydantic_item.child_comment_cnt = item.reply_cnt
         
         response_items.append(pydantic_item)
 
     return response_items
 
+def get_first_replies(db: Session, comment_ids: List[int], replies_limit: int) -> Dict[int, List[PostComment]]:
+    """
+    * method:   get_first_replies
+    * purpose:  여러 댓글의 답글을 댓글별 최신 replies_limit 개씩 한번에 조회
+    """
+    if not comment_ids or replies_limit <= 0:
+        return {}
+
+    rn = func.row_number().over(
+        partition_by=PostComment.parent_id,
+        order_by=(PostComment.created_at.desc(), PostComment.comment_id.desc())
+    ).label("rn")
+    subquery = (
+        db.query(PostComment, rn)
+        .filter(PostComment.parent_id.in_(comment_ids))
+        .subquery()
+    )
+    Reply = aliased(PostComment, subquery)
+
+    replies = (
+        db.query(Reply)
+        .filter(subquery.c.rn <= replies_limit)
+        .order_by(Reply.parent_id, subquery.c.rn)
+        .all()
+    )
+
+    replies_by_parent = {}
+    for reply in replies:
+        replies_by_parent.setdefault(reply.parent_id, []).append(reply)
+    return replies_by_parent
+
 def get_postComment_by_id(db: Session, comment_id: int):
     return db.query(PostComment).filter(PostComment.comment_id == comment_id).first()
 
 def delete_postComment_by_id(db: Session, postComment: PostComment):
     db.delete(postComment)
+
+    # 댓글 수 / 답글 수 카운터를 같은 트랜잭션에서 감소
+    db.query(Posts).filter(Posts.post_id == postComment.post_id).update(
+        {Posts.comment_cnt: func.greatest(Posts.comment_cnt - 1, 0)}, synchronize_session=False
+    )
+    if postComment.parent_id:
+        db.query(PostComment).filter(PostComment.comment_id == postComment.parent_id).update(
+            {PostComment.reply_cnt: func.greatest(PostComment.reply_cnt - 1, 0)}, synchronize_session=False
+        )
+    invalidate_feed_posts(db, [postComment.post_id])
+
     db.commit()
+    trending_engine.record(postComment.post_id, comments=-1)
 
 def get_paging_postcomment(
     db: Session,
     post_id : Optional[str] = None,
     viewer_id : Optional[str] = None,
-    comment_id : Optional[int] = None
+    comment_id : Optional[int] = None,
+    cursor : Optional[str] = None,
+    limit: int = 20,
+    direction: str = "after",
+    replies: int = 0
 ):
-    # 메인댓글
+    query = db.query(PostComment)
     if comment_id is None:
-        query = db.query(PostComment)
+        # 메인댓글
         query = query.filter(PostComment.post_id == post_id)  # post_id에 대한 필터 추가
         query = query.filter(PostComment.parent_id.is_(None))  # parent_id가 NULL인 경우 필터 추가
-        query = query.order_by(PostComment.created_at.desc())  # 생성 시간 역순으로 정렬
-        items = query.all()  # 최종 결과 가져오기
-
-
-        response_items_pydantic = convert_posts_to_pydantic(db, items, viewer_id)
-    
-        return PaginatedPostCommentResponse(
-            items=response_items_pydantic, 
-            has_more=None,
-            next_cursor=None
-        )
     else :
-    # 대댓글
-        query = db.query(PostComment)
+        # 대댓글
         query = query.filter(PostComment.parent_id == comment_id)  # comment_id로 필터링
-        query = query.order_by(PostComment.created_at.desc())  # 생성 시간을 기준으로 내림차순 정렬
-        items = query.all()  # 최종 결과 리스트 가져오기
-        response_items_pydantic = convert_posts_to_pydantic(db, items, viewer_id)
-    
-        return PaginatedPostCommentResponse(
-            items=response_items_pydantic, 
-            has_more=None,
-            next_cursor=None
-        )
+
+    # 생성 시간 역순 키셋 페이지네이션
+    paginator = KeysetPaginator(PostComment, query, sorts=COMMENT_SORTS)
+    paginated_result = paginator.get_paginated_result(
+        cursor=cursor,
+        direction=direction,
+        limit=limit
+    )
+    items = paginated_result.items
+
+    # 메인댓글 조회 시 답글 앞부분 펼치기 (옵션)
+    replies_by_parent = {}
+    if comment_id is None and replies > 0:
+        replies_by_parent = get_first_replies(db, [item.comment_id for item in items], replies)
+
+    # 작성자 정보는 댓글 + 답글 전체에 대해 한번에 조회
+    uids = [item.uid for item in items]
+    for parent_replies in replies_by_parent.values():
+        uids.extend(reply.uid for reply in parent_replies)
+    users_by_uid = get_users_with_profile_by_uids(db, uids)
+
+    response_items_pydantic = convert_posts_to_pydantic(items, viewer_id, users_by_uid)
+
+    for item, pydantic_item in zip(items, response_items_pydantic):
+        parent_replies = replies_by_parent.get(item.comment_id)
+        if parent_replies is None:
+            continue
+        pydantic_item.replies = convert_posts_to_pydantic(parent_replies, viewer_id, users_by_uid)
+        # 나머지 답글은 /subComment/{comment_id} 에서 이 커서로 이어서 조회
+        if item.reply_cnt > len(parent_replies):
+            pydantic_item.replies_next_cursor = paginator.cursor_for(parent_replies[-1])
+
+    return PaginatedPostCommentResponse(
+        items=response_items_pydantic, 
+        has_more=paginated_result.has_more,
+        next_cursor=paginated_result.next_cursor,
+        prev_cursor=paginated_result.prev_cursor
+    )
     
 def get_postComment_cnt(db: Session, post_id: str):
     return db.query(PostComment).filter(PostComment.post_id == post_id).count()
 
 def get_child_postComment_cnt(db: Session, comment_id: int):
-    return db.query(PostComment).filter(PostComment.parent_id == comment_id).count()
\ No newline at end of file
+    return db.query(PostComment).filter(PostComment.parent_id == comment_id).count()
+
+def reconcile_comment_counters(db: Session, batch_size: int = 1000) -> int:
+    """
+    * method:   reconcile_comment_counters
+    * purpose:  posts.comment_cnt / postComments.reply_cnt 를 실제 댓글 수와 비교하여
+                어긋난 행만 배치 단위로 보정. 보정된 행 수를 반환
+    """
+    fixed = 0
+
+    # 게시물 댓글 수 보정 (post_id 순서로 배치 진행)
+    comment_cnt = (
+        select(func.count(PostComment.comment_id))
+        .where(PostComment.post_id == Posts.post_id)
+        .scalar_subquery()
+    )
+    last_post_id = None
+    while True:
+        query = db.query(Posts.post_id)
+        if last_post_id is not None:
+            query = query.filter(Posts.post_id > last_post_id)
+        post_ids = [post_id for post_id, in query.order_by(Posts.post_id).limit(batch_size).all()]
+        if not post_ids:
+            break
+
+        result = db.execute(
+            update(Posts)
+            .where(Posts.post_id.in_(post_ids), Posts.comment_cnt != comment_cnt)
+            .values(comment_cnt=comment_cnt)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        fixed += result.rowcount
+        last_post_id = post_ids[-1]
+
+    # 댓글 답글 수 보정 (comment_id 순서로 배치 진행)
+    Reply = aliased(PostComment)
+    reply_cnt = (
+        select(func.count(Reply.comment_id))
+        .where(Reply.parent_id == PostComment.comment_id)
+        .scalar_subquery()
+    )
+    last_comment_id = 0
+    while True:
+        comment_ids = [
+            comment_id for comment_id, in db.query(PostComment.comment_id)
+            .filter(PostComment.comment_id > last_comment_id)
+            .order_by(PostComment.comment_id)
+            .limit(batch_size)
+            .all()
+        ]
+        if not comment_ids:
+            break
+
+        result = db.execute(
+            update(PostComment)
+            .where(PostComment.comment_id.in_(comment_ids), PostComment.reply_cnt != reply_cnt)
+            .values(reply_cnt=reply_cnt)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        fixed += result.rowcount
+        last_comment_id = comment_ids[-1]
+
+    return fixed
+
+
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+create_postComment_async = async_service(create_postComment)
+get_postComment_by_id_async = async_service(get_postComment_by_id)
+delete_postComment_by_id_async = async_service(delete_postComment_by_id)
+get_paging_postcomment_async = async_service(get_paging_postcomment)
@@ -1,56 +1,222 @@
 from sqlalchemy.orm import Session
+from db.notify import publish_invalidation_coalesced
+from services.feedCache_service import invalidate_feed_posts
+from db.session import async_service
 from models.postLikes import PostLike
 from models.posts import Posts
 from schemas.postLike_schema import PostLikeResponse, PostLikeCreate
-from datetime import datetime
+from services.trending_service import trending_engine
+from services.likeCounter_service import like_counter_buffer
+from core.config import settings
+from datetime import datetime, timedelta
 from pytz import timezone
 from pydantic import parse_obj_as
-from sqlalchemy import or_, and_
-from typing import List, Optional 
+from sqlalchemy import or_, and_, delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from typing import Dict, List, Optional, Tuple
+from utils.dataloader import Deferred, get_loader
+from utils.error_code import ErrorCode, raise_error
 
-def postlikes_counting(db: Session, post_id : str, like: bool):
+# 좋아요 수 보정 작업을 한 워커만 실행하도록 사용하는 advisory lock 키
+LIKE_RECONCILE_LOCK_KEY = 7_200_002
 
-    post = db.query(Posts).filter(Posts.post_id == post_id).first()
+def postlikes_counting(db: Session, post_id : str, like: bool) -> Optional[int]:
+    """
+    * method:   postlikes_counting
+    * purpose:  posts.post_likes 를 단일 UPDATE 문으로 증감하고 변경된 값을 반환 (커밋은 호출하는 쪽에서)
+    """
+    new_count = Posts.post_likes + 1 if like else func.greatest(Posts.post_likes - 1, 0)
 
-     # like 인수가 True일 경우 post_likes를 증가, False일 경우 감소시킵니다.
-    if like:
-        post.post_likes += 1
-    else:
-        # post_likes가 음수로 내려가지 않도록 합니다.
-        if post.post_likes > 0:
-            post.post_likes -= 1
+    # 게시물 상세 / 피드 캐시의 좋아요 수도 커밋 시 무효화 (다른 워커 알림은 좋아요마다 보내지 않고 모아서 발행)
+    publish_invalidation_coalesced(db, "post", [post_id])
+    invalidate_feed_posts(db, [post_id], coalesced=True)
+    return db.execute(
+        update(Posts)
+        .where(Posts.post_id == post_id)
+        .values(post_likes=new_count)
+        .returning(Posts.post_likes)
+        .execution_options(synchronize_session=False)
+    ).scalar()
 
-    # 변경사항을 데이터베이스에 커밋합니다.
-    db.commit()
-    db.refresh(post)
+def get_post_likes(db: Session, post_id: str) -> Optional[int]:
+    return db.query(Posts.post_likes).filter(Posts.post_id == post_id).scalar()
 
-    return post
+def merge_pending_likes(post_id: str, post_likes: int) -> int:
+    # write-behind 모드에서 아직 반영되지 않은 증감값을 더해서 반환
+    if not settings.LIKE_WRITE_BEHIND:
+        return post_likes
+    return max(post_likes + like_counter_buffer.pending(post_id), 0)
 
-# 댓글생성
+# 좋아요 (이미 누른 경우 그대로 성공 처리)
 def create_postLikes( 
     postLike : PostLikeCreate,
     db: Session
-):
+) -> PostLikeResponse:
+
+    # (post_id, uid) 유니크 제약으로 중복 행 없이 삽입
+    inserted = db.execute(
+        insert(PostLike)
+        .values(post_id=postLike.post_id, uid=postLike.uid, created_at=datetime.utcnow())
+        .on_conflict_do_nothing(index_elements=[PostLike.post_id, PostLike.uid])
+        .returning(PostLike.id, PostLike.created_at)
+    ).first()
+
+    if inserted and not settings.LIKE_WRITE_BEHIND:
+        # 카운터 UPDATE 는 마지막에 실행하여 posts 행 잠금 시간을 최소화
+        post_likes = postlikes_counting(db, postLike.post_id, True)
+    else:
+        post_likes = get_post_likes(db, postLike.post_id)
 
-    db_postLike = PostLike(
+    if post_likes is None:
+        db.rollback()
+        raise_error(ErrorCode.POST_NOT_FOUND)
+
+    db.commit()  # 삽입 + 카운터 증가를 하나의 트랜잭션으로 커밋
+
+    if inserted and settings.LIKE_WRITE_BEHIND:
+        like_counter_buffer.add(postLike.post_id, 1)
+    post_likes = merge_pending_likes(postLike.post_id, post_likes)
+
+    if inserted:
+        trending_engine.record(postLike.post_id, likes=1)
+        like_id, created_at = inserted
+    else:
+        existing = get_like_reaction(db, postLike.post_id, postLike.uid)
+        like_id, created_at = (existing.id, existing.created_at) if existing else (None, None)
+
+    return PostLikeResponse(
+        id=like_id,
         post_id=postLike.post_id,
         uid=postLike.uid,
+        created_at=created_at,
+        post_likes=post_likes,
+        liked=True
     )
 
-    db.add(db_postLike)  # 게시물 추가 준
-    db.commit()  # 데이터베이스에 변경 사항 커밋
-    db.refresh(db_postLike)  # 저장된 후 객체를 최신 상태로 갱신
-
-    postlikes_counting(db, postLike.post_id, True)
-    
-    return db_postLike
-
 def get_like_reaction(db: Session, post_id: str, viewer_id: str):
     query = db.query(PostLike).filter(PostLike.post_id == post_id)
     return query.filter(PostLike.uid == viewer_id).first()
 
-def delete_postlikes_by_id(db: Session, postlike: PostLike):
-    db.delete(postlike)
-    db.commit()
+def batch_load_like_states(db: Session, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+    """
+    * method:   batch_load_like_states
+    * purpose:  DataLoader 배치 함수. (post_id, viewer_id) 별 좋아요 여부를 viewer 별 1회씩 조회
+    """
+    post_ids_by_viewer = {}
+    for post_id, viewer_id in keys:
+        post_ids_by_viewer.setdefault(viewer_id, []).append(post_id)
+
+    states = {}
+    for viewer_id, post_ids in post_ids_by_viewer.items():
+        results = (
+            db.query(PostLike.post_id)
+            .filter(PostLike.post_id.in_(post_ids))
+            .filter(PostLike.uid == viewer_id)
+            .all()
+        )
+        states.update({(post_id, viewer_id): True for post_id, in results})
+    return states
+
+def load_like_state(db: Session, post_id: str, viewer_id: str) -> Deferred:
+    return get_loader(db, batch_load_like_states, default=False).load((post_id, viewer_id))
+
+# 좋아요 취소 (이미 취소된 경우 그대로 성공 처리)
+def delete_postlikes_by_id(db: Session, post_id: str, uid: str) -> PostLikeResponse:
+    deleted = db.execute(
+        delete(PostLike)
+        .where(PostLike.post_id == post_id, PostLike.uid == uid)
+        .returning(PostLike.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+
+    if deleted and not settings.LIKE_WRITE_BEHIND:
+        post_likes = postlikes_counting(db, post_id, False)
+    else:
+        post_likes = get_post_likes(db, post_id)
+
+    if post_likes is None:
+        db.rollback()
+        raise_error(ErrorCode.POST_NOT_FOUND)
+
+    db.commit()  # 삭제 + 카운터 감소를 하나의 트랜잭션으로 커밋
+
+    if deleted and settings.LIKE_WRITE_BEHIND:
+        like_counter_buffer.add(post_id, -1)
+    post_likes = merge_pending_likes(post_id, post_likes)
+
+    if deleted:
+        trending_engine.record(post_id, likes=-1)
+
+    return PostLikeResponse(
+        post_id=post_id,
+        uid=uid,
+        post_likes=post_likes,
+        liked=False
+    )
+
+
+def reconcile_like_counters(db: Session, batch_size: int = 1000) -> int:
+    """
+    * method:   reconcile_like_counters
+    * purpose:  posts.post_likes 를 postLikes 행 수와 비교하여 어긋난 행만 배치 단위로 보정
+                여러 워커가 동시에 전체 게시물을 훑지 않도록 advisory lock 을 잡은 워커만 실행 (못 잡으면 -1)
+                write-behind 모드에서는 LIKE_RECONCILE_GRACE_SECONDS 안에 좋아요가 있었던 게시물을 건너뜀
+                (다른 워커 메모리에 아직 반영되지 않은 증감값이 보정 후 다시 더해지지 않도록, 다음 실행에서 보정)
+    """
+    # 배치마다 커밋하므로 트랜잭션이 아닌 세션 단위 잠금 사용
+    locked = db.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": LIKE_RECONCILE_LOCK_KEY}).scalar()
+    if not locked:
+        db.rollback()
+        return -1
+    try:
+        return _reconcile_like_counters(db, batch_size)
+    finally:
+        db.rollback()
+        db.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": LIKE_RECONCILE_LOCK_KEY})
+        db.commit()
+
+def _reconcile_like_counters(db: Session, batch_size: int) -> int:
+    fixed = 0
+    like_cnt = (
+        select(func.count(PostLike.id))
+        .where(PostLike.post_id == Posts.post_id)
+        .scalar_subquery()
+    )
+    recently_liked = None
+    if settings.LIKE_WRITE_BEHIND:
+        recently_liked = (
+            select(PostLike.id)
+            .where(
+                PostLike.post_id == Posts.post_id,
+                PostLike.created_at > datetime.utcnow() - timedelta(seconds=settings.LIKE_RECONCILE_GRACE_SECONDS),
+            )
+            .exists()
+        )
+    last_post_id = None
+    while True:
+        query = db.query(Posts.post_id)
+        if last_post_id is not None:
+            query = query.filter(Posts.post_id > last_post_id)
+        post_ids = [post_id for post_id, in query.order_by(Posts.post_id).limit(batch_size).all()]
+        if not post_ids:
+            break
+
+        conditions = [Posts.post_id.in_(post_ids), Posts.post_likes != like_cnt]
+        if recently_liked is not None:
+            conditions.append(~recently_liked)
+        result = db.execute(
+            update(Posts)
+            .where(*conditions)
+            .values(post_likes=like_cnt)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        fixed += result.rowcount
+        last_post_id = post_ids[-1]
+
+    return fixed
+
 
-    postlikes_counting(db, postlike.post_id, True)
\ No newline at end of file
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+create_postLikes_async = async_service(create_postLikes)
+delete_postlikes_by_id_async = async_service(delete_postlikes_by_id)
@@ -1,14 +1,21 @@
 from sqlalchemy.orm import Session
+from core.config import settings
+from db.notify import publish_invalidation
+from db.session import async_service
+from db.replica import primary_session
 from models.posts import Posts
 from models.postLikes import PostLike
 from models.file import File
-from schemas.post_schema import get_journey_response_items, get_journey_response, PostCreate, PostUpdate, PaginatedPostResponse, PostResponse, PaginatedPostResponseItems, PaginatedPostResponse2
-from services.user_service import get_user_by_uid
+from services.file_service import FILE_STATUS_COMPLETED, ensure_files_completed
+from schemas.post_schema import get_journey_response_items, get_journey_response, get_journey_calendar_response_items, get_journey_calendar_response, PostCreate, PostUpdate, PaginatedPostResponse, PostResponse, PaginatedPostResponseItems, PaginatedPostResponse2
+from services.user_service import get_profile_image_url, load_user
 from services.postComment_service import get_postComment_cnt
-from services.postLike_service import get_like_reaction
-from datetime import datetime
-from pytz import timezone
-from services.image_service import create_image, get_images
+from services.postLike_service import load_like_state, merge_pending_likes
+from services.likeCounter_service import get_pending_likes
+from services.feedCache_service import HEAD_TAG, feed_page_cache, invalidate_feed_head, invalidate_feed_posts, post_tag, user_tag
+from datetime import datetime, timedelta
+from pytz import timezone, utc
+from services.image_service import create_image, get_images, get_images_by_image_ids, load_images
 from schemas.image_schema import ImageCreate
 from pydantic import parse_obj_as
 from sqlalchemy import func, asc
@@ -16,27 +23,36 @@ from models.images import Images
 import logging
 from models.user import User
 from models.file import File
-from sqlalchemy import func, cast, Integer, Text
+from sqlalchemy import func, cast, type_coerce, text, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from utils.error_code import ErrorCode, raise_error
+from utils.cache import register_cache
 
 
 # 11.02 Paginator
-from utils.paginator import Paginator  # Paginator 임포트
+from utils.paginator import KeysetPaginator, decode_cursor, page_depth  # 키셋 Paginator 임포트
+from utils.id_generator import next_post_id
 from sqlalchemy import or_, and_
 from typing import List, Optional #11.02 Optional 추가
 
+# 게시물 상세 캐시 (post_id -> 게시물 dict, 좋아요 수는 조회 시 미반영 증감값을 더함)
+post_cache = register_cache("post", settings.ENTITY_CACHE_TTL, settings.ENTITY_CACHE_MAX_SIZE)
+
 # 게시물 생성 함수
 def create_post(db: Session, post: PostCreate):
     logging.info(f"Received request data: {post}")
-    post_index = get_post_index(db)
+    post_index = next_post_id(db)
 
     if post.images:
+        # 업로드가 끝나지 않은(presigned 업로드 대기) 파일은 연결하지 않음
+        ensure_files_completed(db, [int(image) for image in post.images])
         for image in post.images:
             logging.info(f"Received request for images_id: {image}")
             # ImageItem을 ImageCreate로 변환
 
             image_create = ImageCreate(
                 image_id=post_index,  # ImageItem의 id를 image_id로 사용
-                file_id=str(image),   # file_id로 사용 (필요한 경우)
+                file_id=int(image),   # file.file_id
                 file_url=None,      # url은 그대로 사용
                 model='post'         # model에 image.name 사용
             )
@@ -51,24 +67,11 @@ def create_post(db: Session, post: PostCreate):
         visibility=post.visibility,
     )
     db.add(db_post)  # 게시물 추가 준비
+    invalidate_feed_head(db)
     db.commit()  # 데이터베이스에 변경 사항 커밋
     db.refresh(db_post)  # 저장된 후 객체를 최신 상태로 갱신
     return db_post
 
-def get_post_index(db: Session) -> str:
-    str_date = datetime.now(timezone('Asia/Seoul')).strftime('%Y%m%d%H%M%S') #이거바꾸니까 서버 죽음
-    seq = 0
-
-    while True:
-        seq += 1
-        str_seq = str(seq).zfill(4)
-        str_index = str_date + str_seq
-
-        exists = True if db.query(Posts).filter(Posts.post_id == str_index).one_or_none() else False
-
-        if not exists:
-            return str_index
-        
 # 특정 게시물 조회 함수
 def get_post_by_id2(db: Session, post_id: str):
 
@@ -76,8 +79,22 @@ def get_post_by_id2(db: Session, post_id: str):
 
 # 특정 게시물 조회 함수
 def get_post_by_id(db: Session, post_id: str):
+    # 수정/삭제/좋아요 반영 시 모든 워커의 캐시를 무효화
+    post_data = post_cache.get_or_load(post_id, lambda: load_post_from_primary(db, post_id))
+    if post_data is None:
+        return None
+    return dict(post_data, post_likes=merge_pending_likes(post_id, post_data["post_likes"]))
+
+def load_post_from_primary(db: Session, post_id: str):
+    # 캐시에는 복제 지연으로 쓰기 이전 값이 TTL 동안 남지 않도록 primary 에서 조회한 값만 저장
+    with primary_session(db) as primary:
+        return query_post_by_id(primary, post_id)
+
+def query_post_by_id(db: Session, post_id: str):
 
     post_query = db.query(Posts).filter(Posts.post_id == post_id).first()  # 특정 post_id로 필터링
+    if not post_query:
+        return None
 
      # 이미지 정보 조회
     image_items = get_images(db, post_id)  # post_id에 해당하는 이미지들을 가져옴
@@ -92,8 +109,8 @@ def get_post_by_id(db: Session, post_id: str):
         "created_at": post_query.created_at,
         "last_updated": post_query.last_updated,
         "is_deleted": 0,
-        "post_likes": 0,
-        "post_shares": 0
+        "post_likes": post_query.post_likes,
+        "post_shares": post_query.post_shares
     }
 
     # 이미지 정보 추가
@@ -110,6 +127,8 @@ def update_post_by_id(db: Session, post: Posts, post_update: PostUpdate):
     if post_update.visibility is not None:
         post.visibility = post_update.visibility    
 
+    publish_invalidation(db, "post", [post.post_id])
+    invalidate_feed_posts(db, [post.post_id])
     db.commit()  # 수정된 내용을 데이터베이스에 반영
     db.refresh(post)  # 저장된 후 객체를 최신 상태로 갱신
     return post
@@ -119,6 +138,8 @@ def update_post_like_cnt(db: Session, post: Posts, post_likes: Optional[str] = N
     if post_likes is not None:
         post.post_likes = post_likes
 
+    publish_invalidation(db, "post", [post.post_id])
+    invalidate_feed_posts(db, [post.post_id])
     db.commit()  # 수정된 내용을 데이터베이스에 반영
     db.refresh(post)  # 저장된 후 객체를 최신 상태로 갱신
     return post
@@ -130,95 +151,138 @@ def get_paginated_posts(
     viewer_id: str,
     cursor : Optional[str] = None,
     limit: int = 10, 
-    is_friend: Optional[bool] = None
+    is_friend: Optional[bool] = None,
+    direction: str = "after"
 )-> PaginatedPostResponse:
     
-    query = db.query(Posts)
+    query = db.query(Posts).filter(Posts.uid == uid)
 
     # 가시성 필터 설정
     if viewer_id:
-        visibility_filter = or_(
+        visibility_filters = [
             Posts.uid == viewer_id,  # 본인의 게시물은 모두 조회 가능 private 포함
             Posts.visibility == 'public',  # 공개 게시물은 모두 조회 가능
-            (is_friend and Posts.visibility == 'friends')  # 친구일 경우 친구에게만 공개된 게시물도 조회 가능
-        )
-        query = query.filter(visibility_filter)
+        ]
+        if is_friend:
+            visibility_filters.append(Posts.visibility == 'friends')  # 친구일 경우 친구에게만 공개된 게시물도 조회 가능
+        query = query.filter(or_(*visibility_filters))
     else:
         query = query.filter(Posts.visibility == 'public')
 
-    # Paginator 인스턴스 생성 및 페이지네이션 수행
-    paginator = Paginator(Posts, query)
+    # 키셋 페이지네이션 (가장 최근에 작성된 게시물부터 조회)
+    paginator = KeysetPaginator(Posts, query, sorts=["-created_at", "-post_id"])
     paginated_result = paginator.get_paginated_result(
         cursor=cursor,
-        direction = "desc",
-        sorts=["-created_at"],  # 가장 최근에 작성된 게시물부터 조회
+        direction=direction,
         limit=limit
     )
-    print(paginated_result)
-    # PostResponse로 변환
-    response_items = [
-        PaginatedPostResponseItems(
-            post_id=item.post_id,
-            uid=item.uid,
-            title=item.title,
-            content=item.content,
-            # visibility=item.visibility,
-            # postLike_cnt=item.is_deleted,
-            # comment_cnt=item.post_likes,
-        )
-        for item in paginated_result.items
-    ]
 
+    response_items = convert_posts_to_pydantic(db, paginated_result.items, viewer_id)
 
     return PaginatedPostResponse(
+        model_name=Posts.__name__,
         items=response_items,  # 현재 페이지의 게시물 리스트
-        has_more=paginated_result.has_more,  # Paginator에서 이미 계산된 has_more 사용
-        next_cursor=paginated_result.next_cursor
+        has_more=paginated_result.has_more,
+        next_cursor=paginated_result.next_cursor,
+        prev_cursor=paginated_result.prev_cursor
         #is_follow = y
     )
 
 def convert_posts_to_pydantic(db: Session, items: List[Posts], viewer_id: str) -> List[PaginatedPostResponseItems]:
+    """
+    * method:   convert_posts_to_pydantic
+    * purpose:  페이지 단위로 이미지/작성자/좋아요 여부를 일괄 조회하여 응답 모델로 변환
+    """
+    return apply_viewer_overlay(db, build_post_items(db, items), viewer_id)
+
+def build_post_items(db: Session, items: List[Posts]) -> List[dict]:
+    """
+    * method:   build_post_items
+    * purpose:  뷰어와 무관한 게시물 응답 값 (이미지, 작성자, 댓글 수, 저장된 좋아요 수) 생성
+    """
+    # 페이지 전체의 작성자/이미지를 먼저 예약하고, 첫 get() 에서 엔티티별 IN 쿼리 1회로 조회
+    authors = {item.uid: load_user(db, item.uid) for item in items}
+    images = {item.post_id: load_images(db, item.post_id) for item in items}
+
     response_items = []
     
     for item in items:
         # from_orm을 이용하여 기본 모델 생성
         pydantic_item = PaginatedPostResponseItems.from_orm(item)
-        # 수동으로 각 필드 업데이트
-        
-        image_items = get_images(db, item.post_id)
-        pydantic_item.images = image_items  # 하드코딩된 값 설정
 
         # 수동으로 각 필드 업데이트
-        user_query = get_user_by_uid(db, item.uid)
-        comment_cnt = get_postComment_cnt(db, item.post_id)
-        reaction = get_like_reaction(db, item.post_id, item.uid)
-        logging.info(f"Received request for viewer_id: {viewer_id}, item.uid :{item.uid}")
-        
-        pydantic_item.can_modify = "y" if (item.uid == viewer_id) else "n"
-        pydantic_item.reactions = True if reaction else False # 게시글 좋아요 눌렀는지 여부
-        pydantic_item.user_name = user_query.user_name  
-        
-        pydantic_item.comment_cnt = comment_cnt #댓글 수
-
-        #프로필사진
-        result = (
-            db.query(User, File.file_name, File.file_url)
-            .outerjoin(File, User.profile_image == File.file_id)
-            .filter(User.uid == item.uid)
-            .first()
-        )
+        pydantic_item.images = images[item.post_id].get()
+        pydantic_item.comment_cnt = item.comment_cnt #댓글 수 (posts.comment_cnt)
+        pydantic_item.postLike_cnt = item.post_likes #좋아요 수 (미반영 증감값은 apply_viewer_overlay 에서 더함)
 
-        if result:
-            user, file_name, file_url = result
+        #작성자 정보 및 프로필사진
+        user = authors[item.uid].get()
+        if user:
+            pydantic_item.user_name = user.user_name
+            pydantic_item.profile_image = get_profile_image_url(db, user)
 
-            pydantic_item.profile_image = file_url
-            # pydantic_item.file_name = file_name
-            # pydantic_item.file_url = file_url
-
-        response_items.append(pydantic_item)
+        response_items.append(pydantic_item.dict())
         
     return response_items
 
+def apply_viewer_overlay(db: Session, base_items: List[dict], viewer_id: str) -> List[PaginatedPostResponseItems]:
+    """
+    * method:   apply_viewer_overlay
+    * purpose:  뷰어별 값 (수정 가능 여부, 좋아요 여부) 과 미반영 좋아요 증감값을 덧씌워 응답 모델 생성
+    """
+    post_ids = [item["post_id"] for item in base_items]
+    reactions = {post_id: load_like_state(db, post_id, viewer_id) for post_id in post_ids} if viewer_id else {}
+    pending_likes = get_pending_likes(post_ids)
+
+    return [
+        PaginatedPostResponseItems(**dict(
+            item,
+            can_modify="y" if (item["uid"] == viewer_id) else "n",
+            reactions=item["post_id"] in reactions and reactions[item["post_id"]].get(), # 게시글 좋아요 눌렀는지 여부
+            postLike_cnt=max(item["postLike_cnt"] + pending_likes.get(item["post_id"], 0), 0),
+        ))
+        for item in base_items
+    ]
+
+# 전체 피드 정렬 (post_id는 생성 시각 순으로 증가하므로 post_id 역순이 최신순)
+FEED_SORTS = ["-post_id"]
+
+def get_feed_page(db: Session, cursor: Optional[str], limit: int, direction: str) -> dict:
+    """
+    * method:   get_feed_page
+    * purpose:  뷰어와 무관한 피드 페이지를 커서 구간별로 캐시하여 반환
+    """
+    key = (cursor or "", int(limit), direction)
+    depth = page_depth(decode_cursor(cursor, FEED_SORTS) if cursor else None, direction)
+    generation = feed_page_cache.generation
+
+    page = feed_page_cache.get_page(key, depth)
+    if page is not None:
+        return page
+
+    # 캐시할 페이지는 복제 지연이 없는 primary 에서 조회
+    with primary_session(db) as primary:
+        paginator = KeysetPaginator(Posts, primary.query(Posts), sorts=FEED_SORTS)
+        paginated_result = paginator.get_paginated_result(
+            cursor=cursor,
+            direction=direction,
+            limit=limit
+        )
+        page = {
+            "items": build_post_items(primary, paginated_result.items),
+            "has_more": paginated_result.has_more,
+            "next_cursor": paginated_result.next_cursor,
+            "prev_cursor": paginated_result.prev_cursor,
+        }
+
+    tags = [post_tag(item.post_id) for item in paginated_result.items]
+    tags.extend(user_tag(uid) for uid in {item.uid for item in paginated_result.items})
+    # 첫 페이지 또는 최신 쪽 끝에 닿은 이전 페이지는 새 게시물이 생기면 내용이 바뀜
+    if not cursor or (direction == "before" and not paginated_result.has_more):
+        tags.append(HEAD_TAG)
+    feed_page_cache.set_page(key, page, tags, generation)
+    return page
+
 # 11.06 게시물 페이지네이션 조회 함수
 def get_paginated_posts2(
     db: Session, 
@@ -228,32 +292,25 @@ def get_paginated_posts2(
     direction: str = "after"
 )-> PaginatedPostResponse2: 
     
-    query = db.query(Posts)
-
-    if cursor is not None:
-        query = query.filter(Posts.post_id < cursor)
-
-    query = query.order_by(Posts.post_id.desc())
-
-    items = query.limit(limit + 1).all()
-    has_more = len(items) > limit
-    response_items = items[:limit]
-    next_cursor = response_items[-1].post_id if has_more and response_items else None
-
     logging.info(f"Received request for viewer_id: {viewer_id}")
 
-    response_items_pydantic = convert_posts_to_pydantic(db, response_items, viewer_id)
+    page = get_feed_page(db, cursor, limit, direction)
+    response_items_pydantic = apply_viewer_overlay(db, page["items"], viewer_id)
 
     return PaginatedPostResponse2(
         items=response_items_pydantic , 
-        has_more=has_more,
-        next_cursor=next_cursor
+        has_more=page["has_more"],
+        next_cursor=page["next_cursor"],
+        prev_cursor=page["prev_cursor"]
     )
 
 def convert_get_journey_response_to_pydantic(
     db: Session, 
     items: List[Posts]
 ):
+    # 이미지는 게시물 전체에 대해 한번에 조회
+    images_by_post = get_images_by_image_ids(db, [item.post_id for item in items])
+
     response_items = []
     
     for item in items:
@@ -261,22 +318,40 @@ def convert_get_journey_response_to_pydantic(
         pydantic_item = get_journey_response_items.from_orm(item)
         
         # 수동으로 각 필드 업데이트
-        image_items = get_images(db, item.post_id)
-        pydantic_item.images = image_items  # 하드코딩된 값 설정
+        pydantic_item.images = images_by_post.get(item.post_id, [])
         
         response_items.append(pydantic_item)
         
     return response_items
 
+def kst_range_to_utc(start: datetime, end: datetime):
+    """
+    * method:   kst_range_to_utc
+    * purpose:  KST 기준 [start, end) 구간을 created_at(UTC, naive) 비교용 구간으로 변환
+    """
+    kst = timezone('Asia/Seoul')
+    return (
+        kst.localize(start).astimezone(utc).replace(tzinfo=None),
+        kst.localize(end).astimezone(utc).replace(tzinfo=None),
+    )
+
 def get_journey(
     db: Session, 
     viewer_id: str,
     inqr_date: str
 ): 
+    try:
+        day_start = datetime.strptime(inqr_date, '%Y%m%d')
+    except ValueError:
+        raise_error(ErrorCode.INVALID_DATE)
+
+    # (uid, created_at) 인덱스 범위 조회가 가능하도록 반열린 구간으로 필터
+    range_start, range_end = kst_range_to_utc(day_start, day_start + timedelta(days=1))
+
     query = db.query(Posts)
     query = query.filter(Posts.uid == viewer_id)
-    query = query.filter(func.to_char(Posts.created_at, 'YYYYMMDD') == inqr_date)
-    response_items = query.order_by(asc(Posts.created_at))
+    query = query.filter(Posts.created_at >= range_start, Posts.created_at < range_end)
+    response_items = query.order_by(asc(Posts.created_at)).all()
 
 
     response_items_pydantic = convert_get_journey_response_to_pydantic(db, response_items)
@@ -285,41 +360,82 @@ def get_journey(
         items = response_items_pydantic
     )
 
+def get_journey_calendar(
+    db: Session, 
+    viewer_id: str,
+    yyyymm: str
+): 
+    """
+    * method:   get_journey_calendar
+    * purpose:  한 달 동안의 일자별(KST) 게시물 수와 첫 썸네일을 하나의 집계 쿼리로 조회
+    """
+    try:
+        month_start = datetime.strptime(yyyymm, '%Y%m')
+    except ValueError:
+        raise_error(ErrorCode.INVALID_DATE)
+
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    range_start, range_end = kst_range_to_utc(month_start, next_month_start)
+
+    kst_day = func.date(func.timezone('Asia/Seoul', func.timezone('UTC', Posts.created_at))).label("day")
+    # 그날 가장 먼저 작성된 게시물의 첫 이미지
+    thumbnail_url = type_coerce(
+        func.array_agg(aggregate_order_by(File.file_url, Posts.created_at.asc(), Images.file_id.asc()))
+        .filter(File.file_url.isnot(None)),
+        ARRAY(Text)
+    )[1].label("thumbnail_url")
+
+    results = (
+        db.query(kst_day, func.count(func.distinct(Posts.post_id)).label("post_cnt"), thumbnail_url)
+        .select_from(Posts)
+        .outerjoin(Images, Images.image_id == Posts.post_id)
+        .outerjoin(File, and_(File.file_id == Images.file_id, File.status == FILE_STATUS_COMPLETED))
+        .filter(Posts.uid == viewer_id)
+        .filter(Posts.created_at >= range_start, Posts.created_at < range_end)
+        .group_by(kst_day)
+        .order_by(kst_day)
+        .all()
+    )
+
+    return get_journey_calendar_response(
+        yyyymm=yyyymm,
+        items=[
+            get_journey_calendar_response_items(
+                date=day.strftime('%Y%m%d'),
+                post_cnt=post_cnt,
+                thumbnail_url=thumbnail_url
+            )
+            for day, post_cnt, thumbnail_url in results
+        ]
+    )
+
 
 def delete_post_by_id(db: Session, post: Posts):
+    publish_invalidation(db, "post", [post.post_id])
+    invalidate_feed_posts(db, [post.post_id])
     db.delete(post)
     db.commit()
 
 def get_post_top(db: Session):
-    subquery = (
-        db.query(
-            cast(Images.image_id, Text).label("image_id"),
-            func.min(cast(Images.file_id, Text)).label("first_file_id")  # file_id를 Text로 캐스팅
-        )
-        .group_by(Images.image_id)
-        .subquery()
-    )
-
-    subquery2 = (
-        db.query(
-            User.uid, User.user_name, File.file_url.label("profile_image_url")
-        )
-        .outerjoin(File, User.profile_image == File.file_id)
-        .subquery()
-    )
+    # community_top_posts 머티리얼라이즈드 뷰에서 조회 (갱신은 community_service 백그라운드 작업)
+    result = db.execute(text(
+        "SELECT post_id, uid, user_name, profile_image_url, title, content, file_name, file_url"
+        " FROM community_top_posts"
+        " ORDER BY created_at DESC"
+    )).all()
 
-    # 조인 쿼리 작성 (select_from을 사용하여 명시적으로 조인 순서 지정)
-    result = (
-        db.query(Posts, subquery2.c.user_name, subquery2.c.profile_image_url, File.file_name, File.file_url)
-        .select_from(Posts)  # 조인을 시작할 기준 테이블을 명시적으로 설정
-        .join(Images, cast(Images.image_id, Text) == cast(Posts.post_id, Text))  # Posts와 Images 조인
-        .join(subquery, subquery.c.image_id == cast(Images.image_id, Text))  # 서브쿼리와 Images 조인 (타입 캐스팅)
-        .join(subquery2, subquery2.c.uid == Posts.uid)
-        .join(File, subquery.c.first_file_id == cast(File.file_id, Text))  # 서브쿼리와 File 조인
-        .order_by(Posts.created_at.desc())
-        .limit(10)  # 상위 10개의 게시물만 가져오기
-    ).all()
-    
     if result:
         return result
-    return None
\ No newline at end of file
+    return None
+
+
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+create_post_async = async_service(create_post)
+get_post_by_id_async = async_service(get_post_by_id)
+get_post_by_id2_async = async_service(get_post_by_id2)
+update_post_by_id_async = async_service(update_post_by_id)
+get_paginated_posts_async = async_service(get_paginated_posts)
+get_paginated_posts2_async = async_service(get_paginated_posts2)
+get_journey_async = async_service(get_journey)
+get_journey_calendar_async = async_service(get_journey_calendar)
+delete_post_by_id_async = async_service(delete_post_by_id)
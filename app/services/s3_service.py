@@ -1,35 +1,242 @@
 # services/s3_service.py
 
-import boto3
-from botocore.exceptions import NoCredentialsError
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, BinaryIO, Optional
 from core.config import settings
-from botocore.config import Config
 
 from fastapi import UploadFile
 
-s3_client = boto3.client(
-    's3',
-    aws_access_key_id=settings.aws_access_key_id,
-    aws_secret_access_key=settings.aws_secret_access_key,
-    region_name=settings.aws_region,
-    config=Config(signature_version='s3v4')
-)
+_s3_client = None
+_s3_client_lock = threading.Lock()
+_transfer_config = None
+_upload_executor: Optional[ThreadPoolExecutor] = None
 
-def upload_file_to_s3(file: UploadFile, filename: str) -> str:
+def get_s3_client():
+    """
+    * method:   get_s3_client
+    * purpose:  boto3 S3 클라이언트를 최초 사용 시점에 생성 (boto3 import/클라이언트 생성 비용을 기동 시간에서 제외)
+                클라이언트는 스레드 안전하므로 모든 업로드 스레드가 하나의 커넥션 풀을 공유
+    """
+    global _s3_client, _transfer_config
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                import boto3
+                from boto3.s3.transfer import TransferConfig
+                from botocore.config import Config
+
+                _transfer_config = TransferConfig(
+                    multipart_threshold=settings.S3_MULTIPART_THRESHOLD,
+                    multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE,
+                    max_concurrency=settings.S3_MAX_CONCURRENCY,
+                    use_threads=True,
+                )
+                # 스트리밍(seek 불가) 업로드 시 메모리에 보관하는 파트 수 (업로드당 최대 chunksize x 이 값, 기본 10)
+                _transfer_config.max_in_memory_upload_chunks = settings.S3_MAX_CONCURRENCY * 2
+                _s3_client = boto3.client(
+                    's3',
+                    aws_access_key_id=settings.aws_access_key_id,
+                    aws_secret_access_key=settings.aws_secret_access_key,
+                    region_name=settings.aws_region,
+                    endpoint_url=settings.aws_s3_endpoint_url or None,  # 로컬 S3 호환 서버 (테스트용)
+                    config=Config(
+                        signature_version='s3v4',
+                        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                        retries={"max_attempts": 3, "mode": "standard"},
+                    )
+                )
+    return _s3_client
+
+def get_upload_executor() -> ThreadPoolExecutor:
+    # 업로드 전용 스레드 풀 (워커별 동시 업로드 수 제한, 이벤트 루프를 막지 않음)
+    global _upload_executor
+    if _upload_executor is None:
+        with _s3_client_lock:
+            if _upload_executor is None:
+                _upload_executor = ThreadPoolExecutor(max_workers=settings.S3_UPLOAD_WORKERS, thread_name_prefix="s3-upload")
+    return _upload_executor
+
+def shutdown_upload_executor():
+    global _upload_executor
+    if _upload_executor is not None:
+        _upload_executor.shutdown(wait=True)
+        _upload_executor = None
+
+def get_file_url(filename: str) -> str:
+    if settings.aws_s3_endpoint_url:
+        return f"{settings.aws_s3_endpoint_url.rstrip('/')}/{settings.aws_bucket_name}/{filename}"
+    return f"https://{settings.aws_bucket_name}.s3.{settings.aws_region}.amazonaws.com/{filename}"
+
+def upload_fileobj_to_s3(fileobj: BinaryIO, filename: str, content_type: Optional[str]) -> str:
+    """
+    * method:   upload_fileobj_to_s3
+    * purpose:  파일 객체를 S3 에 업로드 (블로킹, 업로드 스레드에서 호출)
+                multipart_threshold 를 넘으면 multipart_chunksize 단위로 max_concurrency 개씩 병렬 업로드
+    """
+    from botocore.exceptions import NoCredentialsError
+
+    extra_args = {
+        # "ServerSideEncryption": "aws:kms",
+        # "SSEKMSKeyId": "arn:aws:kms:ap-southeast-2:730335501238:key/9b8265d9-c9c7-4713-b0f5-9dc7db69c1cf",
+        "ACL": "public-read",
+        "ServerSideEncryption": "AES256"
+    }
+    if content_type:
+        extra_args["ContentType"] = content_type
+
+    client = get_s3_client()
     try:
-        s3_client.upload_fileobj(
-            file.file,
-            settings.aws_bucket_name,
-            filename,
-            ExtraArgs={
-                "ContentType": file.content_type,
-                # "ServerSideEncryption": "aws:kms",
-                # "SSEKMSKeyId": "arn:aws:kms:ap-southeast-2:730335501238:key/9b8265d9-c9c7-4713-b0f5-9dc7db69c1cf",
-                "ACL": "public-read",
-                "ServerSideEncryption": "AES256"
-            }
-        )
-        file_url = f"https://{settings.aws_bucket_name}.s3.{settings.aws_region}.amazonaws.com/{filename}"
-        return file_url
+        client.upload_fileobj(fileobj, settings.aws_bucket_name, filename, ExtraArgs=extra_args, Config=_transfer_config)
+        return get_file_url(filename)
     except NoCredentialsError:
         raise Exception("Credentials not available")
+
+def upload_file_to_s3(file: UploadFile, filename: str) -> str:
+    return upload_fileobj_to_s3(file.file, filename, file.content_type)
+
+async def upload_file_to_s3_async(file: UploadFile, filename: str) -> str:
+    # multipart 업로드 파일을 업로드 스레드에서 S3 로 전송
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_upload_executor(), upload_file_to_s3, file, filename)
+
+def create_presigned_upload(filename: str, content_type: str, max_bytes: int) -> dict:
+    """
+    * method:   create_presigned_upload
+    * purpose:  클라이언트가 S3 에 직접 업로드할 presigned POST 발급 (서명만 하므로 네트워크 호출 없음)
+                파일 크기(1 ~ max_bytes)와 Content-Type 은 S3 가 업로드 시 검증
+    """
+    fields = {
+        "Content-Type": content_type,
+        "acl": "public-read",
+        "x-amz-server-side-encryption": "AES256",
+    }
+    conditions = [{name: value} for name, value in fields.items()]
+    conditions.append(["content-length-range", 1, max_bytes])
+
+    return get_s3_client().generate_presigned_post(
+        settings.aws_bucket_name,
+        filename,
+        Fields=fields,
+        Conditions=conditions,
+        ExpiresIn=settings.S3_PRESIGNED_EXPIRES,
+    )
+
+async def create_presigned_upload_async(filename: str, content_type: str, max_bytes: int) -> dict:
+    # 최초 호출 시 boto3 import/클라이언트 생성이 이벤트 루프를 막지 않도록 업로드 스레드에서 실행
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_upload_executor(), create_presigned_upload, filename, content_type, max_bytes)
+
+def head_s3_object(filename: str) -> Optional[dict]:
+    # 업로드된 객체 정보 (ContentLength, ContentType), 없으면 None
+    from botocore.exceptions import ClientError
+
+    try:
+        return get_s3_client().head_object(Bucket=settings.aws_bucket_name, Key=filename)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+
+async def head_s3_object_async(filename: str) -> Optional[dict]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_upload_executor(), head_s3_object, filename)
+
+class UploadPipe:
+    """
+    요청 본문 청크(이벤트 루프) → boto3 업로드 스레드로 전달하는 파일 객체
+    - 아직 읽히지 않은 청크는 max_chunks 개까지만 보관 (업로드가 느리면 본문 수신을 대기시켜 메모리 사용량 제한)
+    - 디스크에 임시 파일을 만들지 않음
+    """
+    _EOF = object()
+    _ABORT = object()
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_chunks: int):
+        self._loop = loop
+        self._chunks = queue.Queue()
+        self._slots = asyncio.Semaphore(max_chunks)
+        self._max_chunks = max_chunks
+        self._buffer = bytearray()
+        self._eof = False
+        self.bytes_written = 0
+
+    # 이벤트 루프 쪽
+    async def write(self, chunk: bytes):
+        await self._slots.acquire()
+        self._chunks.put(chunk)
+        self.bytes_written += len(chunk)
+
+    def close(self, abort: bool = False):
+        self._chunks.put(self._ABORT if abort else self._EOF)
+
+    def _release_slot(self):
+        self._loop.call_soon_threadsafe(self._slots.release)
+
+    def release_writer(self):
+        # 업로드 스레드가 실패한 경우 대기 중인 write 를 깨움
+        for _ in range(self._max_chunks):
+            self._release_slot()
+
+    # 업로드 스레드 쪽 (boto3 가 호출)
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size is None or size < 0 or len(self._buffer) < size):
+            chunk = self._chunks.get()
+            if chunk is self._ABORT:
+                raise IOError("Upload stream aborted")
+            if chunk is self._EOF:
+                self._eof = True
+                break
+            self._release_slot()
+            self._buffer.extend(chunk)
+
+        if size is None or size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+def _upload_from_pipe(pipe: UploadPipe, filename: str, content_type: Optional[str]) -> str:
+    try:
+        return upload_fileobj_to_s3(pipe, filename, content_type)
+    except BaseException:
+        pipe.release_writer()
+        raise
+
+async def stream_to_s3(chunks: AsyncIterator[bytes], filename: str, content_type: Optional[str], max_bytes: int) -> Optional[str]:
+    """
+    * method:   stream_to_s3
+    * purpose:  요청 본문을 받는 대로 S3 에 업로드 (파일 전체를 메모리/디스크에 두지 않음)
+                max_bytes 를 넘으면 업로드를 중단하고 None 반환 (multipart 업로드는 boto3 가 취소)
+    """
+    loop = asyncio.get_running_loop()
+    pipe = UploadPipe(loop, settings.S3_STREAM_MAX_CHUNKS)
+    upload = loop.run_in_executor(get_upload_executor(), _upload_from_pipe, pipe, filename, content_type)
+
+    try:
+        async for chunk in chunks:
+            if upload.done():
+                break  # 업로드 실패 (아래에서 예외 전달)
+            if pipe.bytes_written + len(chunk) > max_bytes:
+                pipe.close(abort=True)
+                try:
+                    await upload
+                except Exception:
+                    pass
+                return None
+            if chunk:
+                await pipe.write(chunk)
+    except BaseException:
+        # 클라이언트 연결 끊김 등: 잘린 파일이 저장되지 않도록 업로드 취소
+        pipe.close(abort=True)
+        try:
+            await upload
+        except Exception:
+            pass
+        raise
+
+    pipe.close()
+    return await upload
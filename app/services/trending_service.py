@@ -0,0 +1,129 @@
+# services/trending_service.py
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from db.session import session_scope
+from models.posts import Posts
+
+logger = logging.getLogger(__name__)
+
+# 조회 구간별 (구간 길이, 반감기) 초 단위
+TRENDING_WINDOWS: Dict[str, Tuple[int, int]] = {
+    "1h": (3600, 30 * 60),
+    "24h": (24 * 3600, 6 * 3600),
+    "7d": (7 * 24 * 3600, 48 * 3600),
+}
+
+class TrendingEngine:
+    """
+    게시물 인기 점수 엔진
+    - 최대 구간(7d) 안의 후보 게시물(좋아요/댓글 수/작성 시각)을 NumPy 배열로 보관
+    - 좋아요/댓글 이벤트는 배열의 해당 위치만 증감 (O(1))
+    - 조회 시 후보 전체를 벡터 연산으로 재계산
+      score = (1 + like_weight * 좋아요 + comment_weight * 댓글) * 2^(-경과시간 / 반감기)
+    """
+    def __init__(self, like_weight: float, comment_weight: float):
+        self.like_weight = like_weight
+        self.comment_weight = comment_weight
+        self._lock = threading.Lock()
+        # NumPy 배열은 최초 적재 시 생성 (numpy import 를 기동 시간에서 제외)
+        self._post_ids = None
+        self._created_ts = None
+        self._likes = None
+        self._comments = None
+        self._index: Dict[str, int] = {}
+        self.loaded_at = 0.0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded_at > 0
+
+    def load(self, db: Session):
+        """
+        * method:   load
+        * purpose:  최대 구간 안의 공개 게시물을 후보로 다시 적재
+        """
+        import numpy as np
+
+        max_window = max(window for window, _ in TRENDING_WINDOWS.values())
+        since = datetime.utcnow() - timedelta(seconds=max_window)
+
+        rows = (
+            db.query(Posts.post_id, Posts.created_at, Posts.post_likes, Posts.comment_cnt)
+            .filter(Posts.created_at >= since)
+            .filter(Posts.is_deleted == 0)
+            .filter(Posts.visibility == 'public')
+            .all()
+        )
+
+        post_ids = np.array([row.post_id for row in rows], dtype=object)
+        # created_at 은 UTC naive 이므로 datetime64 변환 값이 곧 epoch 초
+        created_ts = np.array([row.created_at for row in rows], dtype="datetime64[ms]").astype(np.float64) / 1000.0
+        likes = np.array([row.post_likes for row in rows], dtype=np.float64)
+        comments = np.array([row.comment_cnt for row in rows], dtype=np.float64)
+
+        with self._lock:
+            self._post_ids = post_ids
+            self._created_ts = created_ts
+            self._likes = likes
+            self._comments = comments
+            self._index = {post_id: position for position, post_id in enumerate(post_ids)}
+            self.loaded_at = time.time()
+
+    def record(self, post_id: str, likes: int = 0, comments: int = 0):
+        # 좋아요/댓글 이벤트 반영 (후보에 없는 게시물은 다음 적재 때 반영)
+        with self._lock:
+            position = self._index.get(post_id)
+            if position is None:
+                return
+            if likes:
+                self._likes[position] = max(self._likes[position] + likes, 0)
+            if comments:
+                self._comments[position] = max(self._comments[position] + comments, 0)
+
+    def top(self, window: str, limit: int) -> List[Tuple[str, float]]:
+        """
+        * method:   top
+        * purpose:  구간 안의 후보를 벡터 연산으로 점수화하여 상위 limit 개 (post_id, score) 반환
+        """
+        import numpy as np
+
+        window_seconds, half_life = TRENDING_WINDOWS[window]
+        now = time.time()
+
+        with self._lock:
+            if self._created_ts is None:
+                return []
+            age = now - self._created_ts
+            candidates = np.flatnonzero(age <= window_seconds)
+            if candidates.size == 0:
+                return []
+
+            engagement = 1.0 + self.like_weight * self._likes[candidates] + self.comment_weight * self._comments[candidates]
+            scores = engagement * np.exp2(-np.maximum(age[candidates], 0.0) / half_life)
+            post_ids = self._post_ids[candidates]
+
+        # 전체 정렬 대신 argpartition 으로 상위 limit 개만 선택 후 정렬
+        if scores.size > limit:
+            top_positions = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top_positions = np.arange(scores.size)
+        top_positions = top_positions[np.argsort(-scores[top_positions], kind="stable")]
+
+        return [(post_ids[position], float(scores[position])) for position in top_positions]
+
+trending_engine = TrendingEngine(
+    like_weight=settings.TRENDING_LIKE_WEIGHT,
+    comment_weight=settings.TRENDING_COMMENT_WEIGHT
+)
+
+def reload_trending_job():
+    with session_scope() as db:
+        trending_engine.load(db)
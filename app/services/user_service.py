@@ -1,35 +1,120 @@
+from sqlalchemy import and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.config import settings
+from db.notify import publish_invalidation
+from db.session import async_service
+from db.replica import primary_session
 from models.user import User
 from models.pets import Pet
 from models.file import File
+from services.file_service import FILE_STATUS_COMPLETED, ensure_files_completed
 from schemas.user_schema import UserCreate, UserProfileUpdate, UserResponse, UserResponseWithFile
 from schemas.pet_schema import PetResponse, PetResponseWithFile
-from utils.hashing import Hash
-from utils.nickname import getNickname
+from utils.hashing import Hash, password_hasher
+from utils.nickname import generate_nickname, get_nickname_candidates
+from utils.error_code import ErrorCode, raise_error
+from utils.cache import register_cache
+from services.feedCache_service import invalidate_feed_user
+from utils.dataloader import Deferred, get_loader
+from services.image_service import load_file
+from typing import Dict, List, Optional, Tuple
 
-async def create_user(db: Session, user: UserCreate):
-    hashed_password = Hash.get_password_hash(user.password)
-    nickname = await getNickname()
-    
-    db_user = User(uid=user.uid, user_name=nickname, email=user.email, password=hashed_password)
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    return db_user
+# 사용자 프로필 캐시 (uid -> UserResponseWithFile)
+user_profile_cache = register_cache("user", settings.ENTITY_CACHE_TTL, settings.ENTITY_CACHE_MAX_SIZE)
+
+USER_NAME_UNIQUE_INDEX = "ix_users_user_name"
+
+def is_user_name_conflict(error: IntegrityError) -> bool:
+    return USER_NAME_UNIQUE_INDEX in str(error.orig)
+
+def pick_available_nickname(db: Session, candidates: List[str]) -> str:
+    """
+    * method:   pick_available_nickname
+    * purpose:  닉네임 후보 중 사용 중이지 않은 첫 번째 값 (후보 전체를 한번에 조회)
+                모두 사용 중이면 숫자 자리수를 늘린 새 후보로 재시도, NICKNAME_PICK_ATTEMPTS 번 모두 실패하면 503
+    """
+    for attempt in range(settings.NICKNAME_PICK_ATTEMPTS):
+        taken = {user_name for user_name, in db.query(User.user_name).filter(User.user_name.in_(candidates)).all()}
+        for nickname in candidates:
+            if nickname not in taken:
+                return nickname
+        candidates = [generate_nickname(suffix_digits=4 + attempt) for _ in candidates]
+    raise_error(ErrorCode.NICKNAME_UNAVAILABLE)
+
+def create_user(db: Session, user: UserCreate, nickname_candidates: List[str], hashed_password: str):
+    for _ in range(settings.NICKNAME_PICK_ATTEMPTS):
+        nickname = pick_available_nickname(db, nickname_candidates)
+        db_user = User(uid=user.uid, user_name=nickname, email=user.email, password=hashed_password)
+        try:
+            with db.begin_nested():
+                db.add(db_user)
+        except IntegrityError as error:
+            if not is_user_name_conflict(error):
+                raise
+            # 중복 확인 후 다른 가입 요청이 같은 닉네임을 먼저 저장함 (unique 인덱스) → 새 후보로 재시도
+            nickname_candidates = get_nickname_candidates(len(nickname_candidates))
+            continue
+        db.commit()
+        db.refresh(db_user)
+        return db_user
+    raise_error(ErrorCode.NICKNAME_UNAVAILABLE)
+
+def batch_load_users(db: Session, uids: List[str]) -> Dict[str, User]:
+    """
+    * method:   batch_load_users
+    * purpose:  DataLoader 배치 함수. 사용자를 한번에 조회하고 프로필 이미지 파일 조회를 같은 tick 에 예약
+    """
+    users = {user.uid: user for user in db.query(User).filter(User.uid.in_(uids)).all()}
+    for user in users.values():
+        if user.profile_image is not None:
+            load_file(db, user.profile_image)
+    return users
+
+def load_user(db: Session, uid: str) -> Deferred:
+    return get_loader(db, batch_load_users).load(uid)
 
 def get_user_by_uid(db: Session, uid: str):
-    return db.query(User).filter(User.uid == uid).first()
+    return load_user(db, uid).get()
+
+def get_profile_image_url(db: Session, user: User) -> Optional[str]:
+    if user.profile_image is None:
+        return None
+    file = load_file(db, user.profile_image).get()
+    return file.file_url if file else None
+
+def get_users_with_profile_by_uids(db: Session, uids: List[str]) -> Dict[str, Tuple[User, Optional[str]]]:
+    """
+    * method:   get_users_with_profile_by_uids
+    * purpose:  여러 사용자와 프로필 이미지 URL을 한번에 조회 (User 1회 + File 1회, 요청 내 중복 조회 없음)
+    """
+    deferreds = [load_user(db, uid) for uid in set(uids)]
+
+    users_by_uid = {}
+    for deferred in deferreds:
+        user = deferred.get()
+        if user:
+            users_by_uid[user.uid] = (user, get_profile_image_url(db, user))
+    return users_by_uid
 
 def get_user_and_file_info(db: Session, uid: str):
+    # 프로필 변경 시 update_user_profile_by_uid 에서 모든 워커의 캐시를 무효화
+    return user_profile_cache.get_or_load(uid, lambda: load_user_and_file_info_from_primary(db, uid))
+
+def load_user_and_file_info_from_primary(db: Session, uid: str):
+    # 캐시에는 복제 지연으로 쓰기 이전 값이 TTL 동안 남지 않도록 primary 에서 조회한 값만 저장
+    with primary_session(db) as primary:
+        return query_user_and_file_info(primary, uid)
+
+def query_user_and_file_info(db: Session, uid: str):
     result = (
         db.query(User, File.file_name, File.file_url)
-        .outerjoin(File, User.profile_image == File.file_id)
+        .outerjoin(File, and_(User.profile_image == File.file_id, File.status == FILE_STATUS_COMPLETED))
         .filter(User.uid == uid)
         .first()
     )
 
-    print(result)
-
     if result:
         user, file_name, file_url = result
         # User와 File 정보를 통합한 딕셔너리 생성
@@ -64,22 +149,39 @@ def authenticate_user(db: Session, email: str, password: str):
         return None
     return user
 
+def update_password_hash(db: Session, uid: str, hashed_password: str):
+    """
+    * method:   update_password_hash
+    * purpose:  로그인 성공 시 이전 방식(SHA-256)의 비밀번호 해시를 새 해시로 교체
+    """
+    db.query(User).filter(User.uid == uid).update({User.password: hashed_password}, synchronize_session=False)
+    db.commit()
+
 def update_user_profile_by_uid(db: Session, user: User, profile_update: UserProfileUpdate):
     if profile_update.profile_intro is not None:
         user.profile_intro = profile_update.profile_intro
     if profile_update.profile_image is not None:
+        ensure_files_completed(db, [profile_update.profile_image])
         user.profile_image = profile_update.profile_image
     if profile_update.user_name is not None:
         user.user_name = profile_update.user_name
-    
-    db.commit()
+
+    publish_invalidation(db, "user", [user.uid])
+    invalidate_feed_user(db, user.uid)
+    try:
+        db.commit()
+    except IntegrityError as error:
+        db.rollback()
+        if is_user_name_conflict(error):
+            raise_error(ErrorCode.NICKNAME_TAKEN)
+        raise
     db.refresh(user)
     return user
 
 def get_pets_by_user_id(db: Session, uid: str):
     results = (
         db.query(Pet, File.file_name, File.file_url)
-        .outerjoin(File, Pet.pet_img_id == File.file_id)
+        .outerjoin(File, and_(Pet.pet_img_id == File.file_id, File.status == FILE_STATUS_COMPLETED))
         .filter(Pet.uid == uid)
         .all()
     )
@@ -109,4 +211,20 @@ def get_pets_by_user_id(db: Session, uid: str):
             # UserResponse 모델로 반환
             pet_list.append(PetResponseWithFile(**pet_dict))
         return pet_list
-    return None
\ No newline at end of file
+    return None
+
+
+# 비동기 버전 (AsyncSession, 라우트에서 사용)
+async def create_user_async(db: AsyncSession, user: UserCreate):
+    # 닉네임 후보는 네트워크 대기 없이 준비 (미리 받아 둔 풀 / 로컬 생성), 비밀번호 해시는 해시 전용 스레드 풀에서 먼저 처리
+    nickname_candidates = get_nickname_candidates(settings.NICKNAME_CANDIDATES)
+    hashed_password = await password_hasher.hash(user.password)
+    return await db.run_sync(lambda sync_db: create_user(sync_db, user, nickname_candidates, hashed_password))
+
+get_user_by_uid_async = async_service(get_user_by_uid)
+get_user_and_file_info_async = async_service(get_user_and_file_info)
+get_user_exists_by_uid_async = async_service(get_user_exists_by_uid)
+get_user_by_email_async = async_service(get_user_by_email)
+update_password_hash_async = async_service(update_password_hash)
+update_user_profile_by_uid_async = async_service(update_user_profile_by_uid)
+get_pets_by_user_id_async = async_service(get_pets_by_user_id)
@@ -0,0 +1,72 @@
+# startup_benchmark.py
+# 사용법 (app 디렉토리에서 실행): python startup_benchmark.py [--runs 10] [--top 15]
+#
+# 새 프로세스에서 워커 콜드 스타트 시간을 측정
+# - import: `import main` (모듈 로딩 + 앱 생성)
+# - lifespan: lifespan 시작 훅 (백그라운드 작업 시작 등) 완료까지
+# 마지막으로 -X importtime 기준 import 비용이 큰 모듈 목록을 출력
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MEASURE_SCRIPT = """
+import asyncio, json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def run_lifespan():
+    async with main.app.router.lifespan_context(main.app):
+        return time.perf_counter()
+
+ready = asyncio.run(run_lifespan())
+print(json.dumps({"import_ms": (imported - started) * 1000, "lifespan_ms": (ready - imported) * 1000}))
+"""
+
+def measure_once() -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT],
+        cwd=APP_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def slowest_imports(top: int):
+    # -X importtime 출력: "import time: self [us] | cumulative | imported package"
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=APP_DIR, capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # 헤더 행
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+
+def summarize(values):
+    return f"min {min(values):7.1f} ms | median {statistics.median(values):7.1f} ms | max {max(values):7.1f} ms"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure worker cold start time")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+    args = parser.parse_args()
+
+    results = [measure_once() for _ in range(args.runs)]
+    print(f"runs: {args.runs}")
+    print(f"import   {summarize([result['import_ms'] for result in results])}")
+    print(f"lifespan {summarize([result['lifespan_ms'] for result in results])}")
+    print(f"total    {summarize([result['import_ms'] + result['lifespan_ms'] for result in results])}")
+
+    print("\nslowest modules (self time, -X importtime):")
+    for cumulative_us, self_us, name in slowest_imports(args.top):
+        print(f"  {self_us / 1000:7.1f} ms  (cumulative {cumulative_us / 1000:7.1f} ms)  {name}")
@@ -0,0 +1,96 @@
+# tests/conftest.py
+# 공통 fixture (마이그레이션 적용된 DB 필요, S3 는 로컬 moto 서버 사용)
+
+import socket
+import pytest
+from sqlalchemy import text
+from core.config import settings
+from db.session import session_scope
+from services import s3_service
+from utils.jwt import create_access_token
+
+TEST_BUCKET = "cuddle-test"
+TEST_UID = "pytest_user"
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def reset_s3_client():
+    # 설정 변경(엔드포인트, multipart 크기 등)이 반영되도록 S3 클라이언트를 다시 생성
+    s3_service._s3_client = None
+    s3_service._transfer_config = None
+
+@pytest.fixture(scope="session")
+def s3_server():
+    """
+    로컬 S3 호환 서버 (moto) 를 띄우고 AWS_S3_ENDPOINT_URL 설정을 해당 서버로 변경
+    """
+    from moto.server import ThreadedMotoServer
+
+    port = _free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+
+    names = ["aws_s3_endpoint_url", "aws_access_key_id", "aws_secret_access_key", "aws_region", "aws_bucket_name"]
+    original = {name: getattr(settings, name) for name in names}
+    settings.aws_s3_endpoint_url = f"http://127.0.0.1:{port}"
+    settings.aws_access_key_id = "test"
+    settings.aws_secret_access_key = "test"
+    settings.aws_region = "us-east-1"
+    settings.aws_bucket_name = TEST_BUCKET
+    reset_s3_client()
+    s3_service.get_s3_client().create_bucket(Bucket=TEST_BUCKET)
+
+    yield s3_service.get_s3_client()
+
+    for name, value in original.items():
+        setattr(settings, name, value)
+    reset_s3_client()
+    server.stop()
+
+@pytest.fixture
+def s3(s3_server):
+    # 테스트마다 빈 버킷에서 시작
+    yield s3_server
+    for obj in s3_server.list_objects_v2(Bucket=TEST_BUCKET).get("Contents", []):
+        s3_server.delete_object(Bucket=TEST_BUCKET, Key=obj["Key"])
+    for upload in s3_server.list_multipart_uploads(Bucket=TEST_BUCKET).get("Uploads", []):
+        s3_server.abort_multipart_upload(Bucket=TEST_BUCKET, Key=upload["Key"], UploadId=upload["UploadId"])
+
+def list_keys(s3) -> list:
+    return [obj["Key"] for obj in s3.list_objects_v2(Bucket=TEST_BUCKET).get("Contents", [])]
+
+def list_multipart_uploads(s3) -> list:
+    return s3.list_multipart_uploads(Bucket=TEST_BUCKET).get("Uploads", [])
+
+@pytest.fixture
+def test_user():
+    # 파일 업로더 (테스트 후 업로드한 파일 정보와 함께 삭제)
+    with session_scope() as db:
+        db.execute(text(
+            "INSERT INTO users (uid, user_name, email, password, status, created_at, updated_at)"
+            " VALUES (:uid, :uid, :email, 'x', 1, now(), now()) ON CONFLICT (uid) DO NOTHING"
+        ), {"uid": TEST_UID, "email": f"{TEST_UID}@example.com"})
+        db.commit()
+    yield TEST_UID
+    with session_scope() as db:
+        db.execute(text("UPDATE users SET profile_image = NULL WHERE uid = :uid"), {"uid": TEST_UID})
+        db.execute(text("DELETE FROM file WHERE uid = :uid"), {"uid": TEST_UID})
+        db.execute(text("DELETE FROM users WHERE uid = :uid"), {"uid": TEST_UID})
+        db.commit()
+
+@pytest.fixture
+def auth_headers(test_user):
+    # 테스트 사용자의 액세스 토큰 (uid 를 받는 라우트는 토큰의 사용자와 일치해야 함)
+    return {"Authorization": f"Bearer {create_access_token({'sub': test_user})}"}
+
+@pytest.fixture(scope="session")
+def client():
+    # 하나의 이벤트 루프에서 lifespan 포함 실행 (asyncpg 커넥션 풀은 생성된 루프에서만 사용 가능)
+    from fastapi.testclient import TestClient
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
@@ -0,0 +1,105 @@
+# tests/test_file_presigned.py
+# presigned POST 직접 업로드 (/file/upload-url → S3 POST → /file/complete) 테스트 - 로컬 moto S3 사용
+
+import httpx
+import pytest
+from sqlalchemy import text
+from core.config import settings
+from db.session import session_scope
+from services.file_service import FILE_STATUS_COMPLETED, FILE_STATUS_PENDING
+from tests.conftest import TEST_BUCKET, list_keys
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"a" * 2048
+
+def request_upload_url(client, headers: dict, uid: str, size: int = len(PNG), content_type: str = "image/png") -> dict:
+    response = client.post("/file/upload-url", headers=headers, json={
+        "uid": uid, "file_name": "cat.png", "content_type": content_type, "size": size,
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def post_to_s3(upload: dict, data: bytes, content_type: str) -> httpx.Response:
+    # 클라이언트가 S3 에 직접 업로드 (API 서버를 거치지 않음)
+    fields = dict(upload["fields"], **{"Content-Type": content_type})
+    return httpx.post(upload["upload_url"], data=fields, files={"file": ("cat.png", data, content_type)})
+
+def get_file_status(file_id: int) -> int:
+    with session_scope() as db:
+        return db.execute(text("SELECT status FROM file WHERE file_id = :file_id"), {"file_id": file_id}).scalar()
+
+def assert_rejected(client, s3, headers: dict, uid: str, upload: dict, s3_response: httpx.Response, status_code: int):
+    # AWS S3 는 presigned POST 조건(content-length-range, Content-Type)을 어기면 업로드 자체를 403 으로 거절하고,
+    # 조건을 검사하지 않는 S3 호환 서버(moto 등)는 저장하므로 /file/complete 가 status_code 로 거절해야 함
+    if s3_response.status_code >= 400:
+        assert s3_response.status_code == 403, s3_response.text
+        assert list_keys(s3) == []
+        complete_status = 409  # 객체가 없으므로 업로드 미완료
+    else:
+        assert len(list_keys(s3)) == 1
+        complete_status = status_code
+    response = client.post("/file/complete", headers=headers, json={"uid": uid, "file_id": upload["file_id"]})
+    assert response.status_code == complete_status, response.text
+    assert get_file_status(upload["file_id"]) == FILE_STATUS_PENDING
+
+def test_presigned_upload_flow(client, s3, test_user, auth_headers):
+    upload = request_upload_url(client, auth_headers, test_user)
+    assert upload["expires_in"] == settings.S3_PRESIGNED_EXPIRES
+    assert upload["fields"]["Content-Type"] == "image/png"
+    assert get_file_status(upload["file_id"]) == FILE_STATUS_PENDING
+
+    # 업로드 전에는 완료 처리 불가
+    response = client.post("/file/complete", headers=auth_headers, json={"uid": test_user, "file_id": upload["file_id"]})
+    assert response.status_code == 409
+
+    assert post_to_s3(upload, PNG, "image/png").status_code in (200, 201, 204)
+    (key,) = list_keys(s3)
+    assert s3.get_object(Bucket=TEST_BUCKET, Key=key)["Body"].read() == PNG
+
+    response = client.post("/file/complete", headers=auth_headers, json={"uid": test_user, "file_id": upload["file_id"]})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"file_id": upload["file_id"], "file_url": upload["file_url"]}
+    assert get_file_status(upload["file_id"]) == FILE_STATUS_COMPLETED
+
+    # 다시 호출해도 같은 결과
+    assert client.post("/file/complete", headers=auth_headers, json={"uid": test_user, "file_id": upload["file_id"]}).status_code == 200
+
+def test_upload_url_rejects_invalid_request(client, s3, test_user, auth_headers):
+    response = client.post("/file/upload-url", headers=auth_headers, json={
+        "uid": test_user, "file_name": "cat.exe", "content_type": "application/x-msdownload", "size": 10,
+    })
+    assert response.status_code == 400
+    response = client.post("/file/upload-url", headers=auth_headers, json={
+        "uid": test_user, "file_name": "cat.png", "content_type": "image/png", "size": settings.FILE_MAX_UPLOAD_BYTES + 1,
+    })
+    assert response.status_code == 413
+
+def test_complete_rejects_oversized_upload(client, s3, test_user, auth_headers):
+    # 신고한 크기보다 큰 파일 (AWS S3 는 content-length-range 조건으로 업로드 자체를 거절)
+    upload = request_upload_url(client, auth_headers, test_user, size=100)
+    assert_rejected(client, s3, auth_headers, test_user, upload, post_to_s3(upload, PNG, "image/png"), 413)
+
+def test_complete_rejects_wrong_content_type(client, s3, test_user, auth_headers):
+    upload = request_upload_url(client, auth_headers, test_user)
+    assert_rejected(client, s3, auth_headers, test_user, upload, post_to_s3(upload, PNG, "text/html"), 400)
+
+def test_complete_rejects_other_user(client, s3, test_user, auth_headers):
+    upload = request_upload_url(client, auth_headers, test_user)
+    # 토큰의 사용자와 다른 uid
+    response = client.post("/file/complete", headers=auth_headers, json={"uid": "someone_else", "file_id": upload["file_id"]})
+    assert response.status_code == 403
+    # 토큰 없이 호출
+    response = client.post("/file/complete", json={"uid": test_user, "file_id": upload["file_id"]})
+    assert response.status_code == 401
+
+@pytest.mark.parametrize("completed", [False, True], ids=["pending", "completed"])
+def test_only_completed_files_can_be_attached(client, s3, test_user, auth_headers, completed):
+    upload = request_upload_url(client, auth_headers, test_user)
+    if completed:
+        post_to_s3(upload, PNG, "image/png")
+        assert client.post("/file/complete", headers=auth_headers, json={"uid": test_user, "file_id": upload["file_id"]}).status_code == 200
+
+    response = client.patch(f"/users/profile/{test_user}", headers=auth_headers, json={"profile_image": upload["file_id"]})
+    assert response.status_code == (200 if completed else 409), response.text
+    with session_scope() as db:
+        profile_image = db.execute(text("SELECT profile_image FROM users WHERE uid = :uid"), {"uid": test_user}).scalar()
+    assert profile_image == (upload["file_id"] if completed else None)
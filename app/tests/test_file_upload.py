@@ -0,0 +1,106 @@
+# tests/test_file_upload.py
+# 서버 경유 업로드 (multipart /file/upload, 스트리밍 /file/upload/stream) 테스트 - 로컬 moto S3 사용
+
+import asyncio
+import pytest
+from sqlalchemy import text
+from starlette.requests import ClientDisconnect
+from core.config import settings
+from db.session import session_scope
+from services.s3_service import stream_to_s3
+from tests.conftest import TEST_BUCKET, list_keys, list_multipart_uploads, reset_s3_client
+
+MB = 1024 * 1024
+
+def chunked(data: bytes, size: int = 64 * 1024):
+    # Content-Length 없이 (Transfer-Encoding: chunked) 전송
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+def get_file_row(file_id: int):
+    with session_scope() as db:
+        return db.execute(text("SELECT file_name, file_url, uid, status FROM file WHERE file_id = :file_id"), {"file_id": file_id}).one()
+
+@pytest.fixture
+def small_multipart(monkeypatch):
+    # multipart 업로드 경로를 작은 파일로 검사 (S3 최소 파트 크기 5MB)
+    monkeypatch.setattr(settings, "S3_MULTIPART_THRESHOLD", 5 * MB)
+    monkeypatch.setattr(settings, "S3_MULTIPART_CHUNKSIZE", 5 * MB)
+    reset_s3_client()
+    yield
+    monkeypatch.undo()
+    reset_s3_client()
+
+def test_multipart_form_upload(client, s3, test_user, auth_headers):
+    data = b"\x89PNG" + b"a" * 1000
+    response = client.post(f"/file/upload?uid={test_user}", headers=auth_headers, files={"file": ("cat.png", data, "image/png")})
+    assert response.status_code == 200, response.text
+
+    (key,) = list_keys(s3)
+    assert key.startswith("uploads/") and key.endswith("/cat.png")
+    obj = s3.get_object(Bucket=TEST_BUCKET, Key=key)
+    assert obj["Body"].read() == data
+    assert obj["ContentType"] == "image/png"
+
+    file_name, file_url, uid, status = get_file_row(response.json()["file_id"])
+    assert (file_name, uid, status) == ("cat.png", test_user, 1)
+    assert file_url == response.json()["file_url"] and file_url.endswith(key)
+
+def test_multipart_form_upload_too_large(client, s3, test_user, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "FILE_MAX_UPLOAD_BYTES", 1000)
+    response = client.post(f"/file/upload?uid={test_user}", headers=auth_headers, files={"file": ("cat.png", b"a" * 1001, "image/png")})
+    assert response.status_code == 413
+    assert list_keys(s3) == []
+
+def test_stream_upload(client, s3, test_user, auth_headers, small_multipart):
+    data = bytes(range(256)) * (12 * MB // 256)  # multipart (5MB 파트 3개)
+    response = client.put(
+        f"/file/upload/stream?uid={test_user}&filename=dog.jpg",
+        content=chunked(data),
+        headers=dict(auth_headers, **{"content-type": "image/jpeg"}),
+    )
+    assert response.status_code == 200, response.text
+
+    (key,) = list_keys(s3)
+    obj = s3.get_object(Bucket=TEST_BUCKET, Key=key)
+    assert obj["Body"].read() == data
+    assert obj["ContentType"] == "image/jpeg"
+    assert list_multipart_uploads(s3) == []
+    assert get_file_row(response.json()["file_id"]).file_name == "dog.jpg"
+
+def test_stream_upload_rejects_declared_length(client, s3, test_user, auth_headers, monkeypatch):
+    monkeypatch.setattr(settings, "FILE_MAX_UPLOAD_BYTES", 1000)
+    response = client.put(
+        f"/file/upload/stream?uid={test_user}&filename=big.jpg",
+        content=b"a" * 1001,
+        headers=dict(auth_headers, **{"content-type": "image/jpeg"}),
+    )
+    assert response.status_code == 413
+    assert list_keys(s3) == []
+
+def test_stream_upload_aborts_over_limit(client, s3, test_user, auth_headers, small_multipart, monkeypatch):
+    # Content-Length 가 없으면 받은 크기로 판단, 한도를 넘는 순간 진행 중인 multipart 업로드를 취소
+    monkeypatch.setattr(settings, "FILE_MAX_UPLOAD_BYTES", 11 * MB)
+    response = client.put(
+        f"/file/upload/stream?uid={test_user}&filename=big.jpg",
+        content=chunked(b"a" * 12 * MB),
+        headers=dict(auth_headers, **{"content-type": "image/jpeg"}),
+    )
+    assert response.status_code == 413
+    assert list_keys(s3) == []
+    assert list_multipart_uploads(s3) == []
+    with session_scope() as db:
+        assert db.execute(text("SELECT count(*) FROM file WHERE uid = :uid"), {"uid": test_user}).scalar() == 0
+
+@pytest.mark.parametrize("sent_mb", [1, 11], ids=["single-part", "multipart"])
+def test_stream_client_disconnect(s3, small_multipart, sent_mb):
+    # 업로드 도중 클라이언트 연결이 끊기면 잘린 파일이 저장되지 않아야 함
+    async def body():
+        for chunk in chunked(b"a" * sent_mb * MB):
+            yield chunk
+        raise ClientDisconnect()
+
+    with pytest.raises(ClientDisconnect):
+        asyncio.run(stream_to_s3(body(), "uploads/disconnect/cut.jpg", "image/jpeg", 50 * MB))
+    assert list_keys(s3) == []
+    assert list_multipart_uploads(s3) == []
@@ -0,0 +1,39 @@
+# tests/test_nickname.py
+# 가입 시 닉네임 선택 (중복 후보 재시도, 저장 시 unique 인덱스 충돌 재시도, 재시도 소진 시 503)
+
+import re
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+from db.session import session_scope
+from schemas.user_schema import UserCreate
+from services import user_service
+
+NEW_UID = "pytest_signup"
+
+@pytest.fixture
+def new_user(test_user):
+    yield UserCreate(uid=NEW_UID, email=f"{NEW_UID}@example.com", password="password1234")
+    with session_scope() as db:
+        db.execute(text("DELETE FROM users WHERE uid = :uid"), {"uid": NEW_UID})
+        db.commit()
+
+def test_pick_widens_suffix_when_all_taken(test_user):
+    with session_scope() as db:
+        nickname = user_service.pick_available_nickname(db, [test_user, test_user])
+    assert nickname != test_user
+    assert re.search(r"[^0-9][0-9]{4}$", nickname)
+
+def test_pick_raises_when_attempts_exhausted(test_user, monkeypatch):
+    monkeypatch.setattr(user_service, "generate_nickname", lambda suffix_digits=3: test_user)
+    with session_scope() as db, pytest.raises(HTTPException) as error:
+        user_service.pick_available_nickname(db, [test_user])
+    assert error.value.status_code == 503
+
+def test_create_user_retries_on_unique_conflict(test_user, new_user, monkeypatch):
+    # 중복 확인 이후 다른 요청이 같은 닉네임을 먼저 저장한 경우 (첫 선택은 이미 사용 중인 닉네임)
+    picks = iter([test_user, "pytest_signup_nick"])
+    monkeypatch.setattr(user_service, "pick_available_nickname", lambda db, candidates: next(picks))
+    with session_scope() as db:
+        user = user_service.create_user(db, new_user, ["unused"], "hashed")
+        assert user.user_name == "pytest_signup_nick"
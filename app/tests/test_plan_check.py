@@ -0,0 +1,19 @@
+# tests/test_plan_check.py
+# 서비스 조회 SQL 의 실행 계획 검사 (db/plan_check.py 를 pytest 로 실행, 마이그레이션 적용된 DB 필요)
+# 시드 데이터 크기: PLAN_CHECK_SCALE (기본 1.0 = 게시물 10만 건)
+
+import os
+import pytest
+from db.plan_check import CHECKS, seeded_session, get_check_params, run_check, format_failure
+
+@pytest.fixture(scope="module")
+def plan_db():
+    with seeded_session(float(os.getenv("PLAN_CHECK_SCALE", "1.0"))) as db:
+        yield db, get_check_params(db)
+
+@pytest.mark.parametrize("name, run", CHECKS, ids=[name for name, _ in CHECKS])
+def test_no_seq_scan(plan_db, name, run):
+    db, params = plan_db
+    count, failures, error = run_check(db, lambda: run(db, params))
+    assert error is None, f"{name}: {type(error).__name__}: {error}"
+    assert not failures, "\n".join(format_failure(statement, seq_scans) for statement, seq_scans in failures)
@@ -0,0 +1,24 @@
+# tests/test_route_auth.py
+# uid 를 받는 쓰기/피드 라우트는 액세스 토큰이 필요하고, 요청의 uid 가 토큰의 사용자와 같아야 함
+
+import pytest
+
+OTHER_UID = "someone_else"
+
+ROUTES = [
+    ("post", "/posts/", {"json": {"uid": OTHER_UID, "title": "t", "content": "c"}}),
+    ("post", "/postLikes/", {"json": {"post_id": "p1", "uid": OTHER_UID}}),
+    ("delete", f"/postLikes/p1/{OTHER_UID}", {}),
+    ("post", "/postComments/p1", {"json": {"uid": OTHER_UID, "post_id": "p1", "message": "c"}}),
+    ("get", f"/posts/getAllPosts/{OTHER_UID}", {}),
+    ("get", f"/posts/userPosts/{OTHER_UID}/{OTHER_UID}", {}),
+    ("get", f"/posts/{OTHER_UID}/calendar/202401", {}),
+    ("patch", f"/users/profile/{OTHER_UID}", {"json": {}}),
+]
+
+@pytest.mark.parametrize("method,path,kwargs", ROUTES, ids=[f"{m} {p}" for m, p, _ in ROUTES])
+def test_route_requires_matching_user(client, test_user, auth_headers, method, path, kwargs):
+    assert getattr(client, method)(path, **kwargs).status_code == 401
+    response = getattr(client, method)(path, headers=auth_headers, **kwargs)
+    assert response.status_code == 403, response.text
+    assert response.json()["detail"]["error_code"] == "FORBIDDEN_USER"
@@ -0,0 +1,162 @@
+# utils/cache.py
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+_MISSING = object()
+
+def approx_size(value: Any, depth: int = 3) -> int:
+    """
+    값이 차지하는 대략적인 메모리 크기 (bytes). 컨테이너/모델 필드는 depth 단계까지만 합산
+    """
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        size += sum(approx_size(k, depth - 1) + approx_size(v, depth - 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(approx_size(item, depth - 1) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += approx_size(vars(value), depth - 1)
+    return size
+
+class TTLCache:
+    """
+    프로세스 내 TTL + LRU 캐시
+    - max_size 초과 시 가장 오래 사용되지 않은 항목부터 제거 (eviction)
+    - ttl 이 지난 항목은 조회 시 제거 (expiration)
+    - invalidate 는 다른 워커/호스트의 변경 알림(db/notify.py)에서도 호출됨
+    - 조회(load) 도중 같은 키가 무효화되면 조회 결과를 저장하지 않음 (키별 무효화 시점과 generation 비교)
+      다른 키의 무효화는 저장에 영향 없음
+    """
+    def __init__(self, name: str, ttl: float, max_size: int):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, expires_at, size)
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self.generation = 0  # invalidate/clear 마다 증가 (조회 시작 시점 표시)
+        # 최근 무효화된 키 -> 무효화 시점의 generation (최대 개수를 넘으면 오래된 것부터 제거하고 _floor 로 대체)
+        self._invalidated: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._max_invalidated = max(max_size * 2, 1024)
+        self._floor = 0  # 이 generation 이전에 시작한 조회는 무효화 여부를 알 수 없으므로 저장하지 않음
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        if not self.enabled:
+            return
+        size = approx_size(value)
+        with self._lock:
+            if generation is not None and self.invalidated_since([key], generation):
+                return  # 조회 시작 이후 무효화됨 (오래된 값일 수 있음)
+            if key in self._items:
+                self._remove(key)
+            self._items[key] = (value, time.monotonic() + self.ttl, size)
+            self._bytes += size
+            while len(self._items) > self.max_size:
+                self._remove(next(iter(self._items)))
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        * method:   get_or_load
+        * purpose:  캐시에 없으면 load() 결과를 저장 후 반환 (None 은 저장하지 않음)
+        """
+        generation = self.generation
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = load()
+        if value is not None:
+            self.set(key, value, generation)
+        return value
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._mark_invalidated(key)
+            if key in self._items:
+                self._remove(key)
+                self.invalidations += 1
+
+    def invalidated_since(self, keys: Iterable[Hashable], generation: int) -> bool:
+        # generation 시점 이후 keys 중 하나라도 무효화되었는지
+        with self._lock:
+            if generation < self._floor:
+                return True
+            return any(self._invalidated.get(key, -1) > generation for key in keys)
+
+    def _mark_invalidated(self, key: Hashable):
+        self.generation += 1
+        self._invalidated[key] = self.generation
+        self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self._max_invalidated:
+            _, generation = self._invalidated.popitem(last=False)
+            self._floor = max(self._floor, generation)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._floor = self.generation
+            self._invalidated.clear()
+            self.invalidations += len(self._items)
+            self._items.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable):
+        _, _, size = self._items.pop(key)
+        self._bytes -= size
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._items),
+                "max_size": self.max_size,
+                "ttl_sec": self.ttl,
+                "approx_bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+# 이름별 캐시 목록 (지표 조회 / 변경 알림 처리용)
+caches: Dict[str, TTLCache] = {}
+
+def register_cache(name: str, ttl: float, max_size: int, cache_class: type = TTLCache) -> TTLCache:
+    cache = caches[name] = cache_class(name, ttl, max_size)
+    return cache
+
+def get_cache(name: str) -> Optional[TTLCache]:
+    return caches.get(name)
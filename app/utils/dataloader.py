@@ -0,0 +1,102 @@
+# utils/dataloader.py
+# 요청(세션) 단위 DataLoader
+# - load(key) 로 조회를 예약하고, 처음 get() 하는 시점에 세션의 모든 로더에 예약된 키를
+#   엔티티 종류별 IN (...) 쿼리 1회로 일괄 조회 (한 tick)
+# - 조회 결과는 세션이 커밋/롤백될 때까지 키별로 메모이즈
+# - 로더는 Session.info 에 보관되므로 요청마다 새 세션을 쓰는 한 요청 단위로 유지됨
+#   (AsyncSession 의 경우 run_sync 호출 간에도 같은 sync_session 을 공유)
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_LOADERS_KEY = "dataloaders"
+
+BatchFn = Callable[[Session, List[Hashable]], Dict[Hashable, Any]]
+
+class Deferred:
+    """
+    예약된 조회 결과. get() 시 아직 조회되지 않았으면 세션의 예약된 조회를 모두 실행
+    """
+    __slots__ = ("loader", "key")
+
+    def __init__(self, loader: "DataLoader", key: Hashable):
+        self.loader = loader
+        self.key = key
+
+    def get(self):
+        return self.loader.get(self.key)
+
+class DataLoader:
+    def __init__(self, db: Session, batch_fn: BatchFn, default: Any = None):
+        self.db = db
+        self.batch_fn = batch_fn
+        self.default = default
+        self._cache: Dict[Hashable, Any] = {}
+        self._pending: Dict[Hashable, None] = {}  # 예약 순서 유지
+
+    def load(self, key: Hashable) -> Deferred:
+        if key not in self._cache:
+            self._pending[key] = None
+        return Deferred(self, key)
+
+    def load_many(self, keys: Iterable[Hashable]) -> List[Deferred]:
+        return [self.load(key) for key in keys]
+
+    def get(self, key: Hashable):
+        if key not in self._cache:
+            self._pending[key] = None
+            dispatch(self.db)
+        return self._cache.get(key, self.default)
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        deferreds = self.load_many(keys)
+        return {deferred.key: deferred.get() for deferred in deferreds}
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def dispatch(self):
+        keys = [key for key in self._pending if key not in self._cache]
+        self._pending.clear()
+        if not keys:
+            return
+        results = self.batch_fn(self.db, keys)
+        for key in keys:
+            self._cache[key] = results.get(key, self.default)
+
+    def clear(self):
+        self._cache.clear()
+
+def get_loader(db: Session, batch_fn: BatchFn, default: Any = None) -> DataLoader:
+    """
+    * method:   get_loader
+    * purpose:  세션에 batch_fn 별로 하나씩 생성된 DataLoader 반환
+    """
+    loaders = db.info.setdefault(_LOADERS_KEY, {})
+    loader = loaders.get(batch_fn)
+    if loader is None:
+        loader = loaders[batch_fn] = DataLoader(db, batch_fn, default)
+    return loader
+
+def dispatch(db: Session):
+    """
+    * method:   dispatch
+    * purpose:  세션의 모든 로더에 예약된 키를 로더별 1회씩 조회
+                (batch_fn 안에서 다른 로더에 새로 예약된 키도 같은 tick 에서 처리)
+    """
+    loaders = db.info.get(_LOADERS_KEY, {})
+    while True:
+        pending = [loader for loader in list(loaders.values()) if loader.has_pending]
+        if not pending:
+            return
+        for loader in pending:
+            loader.dispatch()
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def clear_loaders(session: Session):
+    # 쓰기 이후에는 메모이즈된 값이 달라질 수 있으므로 비움 (예약된 키는 유지)
+    for loader in session.info.get(_LOADERS_KEY, {}).values():
+        loader.clear()
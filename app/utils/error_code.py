@@ -7,6 +7,16 @@ class ErrorCode(Enum):
         "ALREADY_EXISTS",
         "존재하는 계정입니다.",
     )
+    NICKNAME_TAKEN = (
+        status.HTTP_409_CONFLICT,
+        "NICKNAME_TAKEN",
+        "이미 사용 중인 닉네임입니다.",
+    )
+    NICKNAME_UNAVAILABLE = (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "NICKNAME_UNAVAILABLE",
+        "사용할 수 있는 닉네임을 만들지 못했습니다. 잠시 후 다시 시도해 주세요.",
+    )
     INVALID_LENGTH = (
         status.HTTP_400_BAD_REQUEST,
         "INVALID_LENGTH",
@@ -17,6 +27,56 @@ class ErrorCode(Enum):
         "USER_NOT_FOUND",
         "User not found.",
     )
+    FORBIDDEN_USER = (
+        status.HTTP_403_FORBIDDEN,
+        "FORBIDDEN_USER",
+        "다른 사용자의 데이터는 변경하거나 조회할 수 없습니다.",
+    )
+    POST_NOT_FOUND = (
+        status.HTTP_404_NOT_FOUND,
+        "POST_NOT_FOUND",
+        "Post not found.",
+    )
+    INVALID_CURSOR = (
+        status.HTTP_400_BAD_REQUEST,
+        "INVALID_CURSOR",
+        "유효하지 않은 커서입니다.",
+    )
+    INVALID_DATE = (
+        status.HTTP_400_BAD_REQUEST,
+        "INVALID_DATE",
+        "날짜 형식이 올바르지 않습니다.",
+    )
+    INVALID_DIRECTION = (
+        status.HTTP_400_BAD_REQUEST,
+        "INVALID_DIRECTION",
+        "direction은 after 또는 before 이어야 합니다.",
+    )
+    FILE_TOO_LARGE = (
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        "FILE_TOO_LARGE",
+        "업로드할 수 있는 파일 크기를 초과했습니다.",
+    )
+    FILE_NOT_FOUND = (
+        status.HTTP_404_NOT_FOUND,
+        "FILE_NOT_FOUND",
+        "File not found.",
+    )
+    INVALID_CONTENT_TYPE = (
+        status.HTTP_400_BAD_REQUEST,
+        "INVALID_CONTENT_TYPE",
+        "업로드할 수 없는 파일 형식입니다.",
+    )
+    UPLOAD_NOT_COMPLETED = (
+        status.HTTP_409_CONFLICT,
+        "UPLOAD_NOT_COMPLETED",
+        "파일 업로드가 완료되지 않았습니다.",
+    )
+    SERVER_BUSY = (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "SERVER_BUSY",
+        "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요.",
+    )
 
     def __new__(cls, status_code: int, error_code: str, msg: str):
         obj = object.__new__(cls)
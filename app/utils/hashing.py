@@ -1,10 +1,145 @@
-import hashlib
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+from passlib.context import CryptContext
+from core.config import settings
+from utils.error_code import ErrorCode, raise_error
+from utils.metrics import Histogram
+
+# 신규 해시는 argon2id, 기존 단일 SHA-256(hex) 해시는 검증만 하고 로그인 성공 시 argon2id 로 재해시
+pwd_context = CryptContext(
+    schemes=["argon2", "hex_sha256"],
+    deprecated=["hex_sha256"],
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=1,
+)
+
+_dummy_hash: Optional[str] = None
 
 class Hash:
+    @staticmethod
+    def get_dummy_hash() -> str:
+        # 존재하지 않는 사용자 로그인 시 검증할 해시 (현재 argon2 비용과 동일, 최초 사용 시 1회 생성)
+        global _dummy_hash
+        if _dummy_hash is None:
+            _dummy_hash = pwd_context.hash("dummy-password-for-unknown-user")
+        return _dummy_hash
+
+    @staticmethod
+    def verify_dummy(plain_password: str) -> bool:
+        pwd_context.verify(plain_password, Hash.get_dummy_hash())
+        return False
+
     @staticmethod
     def get_password_hash(password: str) -> str:
-        return hashlib.sha256(password.encode()).hexdigest()
+        return pwd_context.hash(password)
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return hashlib.sha256(plain_password.encode()).hexdigest() == hashed_password
\ No newline at end of file
+        return pwd_context.verify(plain_password, hashed_password)
+
+    @staticmethod
+    def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        # (일치 여부, 재해시가 필요한 경우 새 해시)
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+
+class PasswordHasher:
+    """
+    비밀번호 해시/검증 전용 스레드 풀 (워커 프로세스별)
+    - argon2 계산은 GIL 을 놓고 실행되므로 이벤트 루프(피드 등 다른 요청 처리)를 막지 않음
+    - 동시에 실행되는 해시는 workers 개로 제한하고, 대기 중인 요청이 max_pending 개를 넘거나
+      queue_timeout 초 안에 차례가 오지 않으면 503 (로그인이 몰려도 대기열/메모리가 무한히 늘지 않음)
+    """
+    def __init__(self, workers: int, max_pending: int, queue_timeout: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait = Histogram()  # 요청 시점부터 스레드에서 실행 시작까지
+        self.hash_time = Histogram()   # 해시/검증 실행 시간
+        self._executor = None
+        self._semaphore = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 워커 프로세스의 이벤트 루프 안에서 생성 (preload 시 fork 이전에 만들지 않음)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.workers)
+        return self._semaphore
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def run(self, func: Callable, *args):
+        requested = time.perf_counter()
+        semaphore = self._get_semaphore()
+        if self.waiting >= self.max_pending:
+            self.rejected += 1
+            raise_error(ErrorCode.SERVER_BUSY)
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise_error(ErrorCode.SERVER_BUSY)
+        finally:
+            self.waiting -= 1
+
+        def call():
+            started = time.perf_counter()
+            self.queue_wait.observe((started - requested) * 1000)
+            try:
+                return func(*args)
+            finally:
+                self.hash_time.observe((time.perf_counter() - started) * 1000)
+
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        return await self.run(Hash.get_password_hash, password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return await self.run(Hash.verify_and_update, plain_password, hashed_password)
+
+    async def verify_dummy(self, plain_password: str) -> Tuple[bool, Optional[str]]:
+        # 없는 사용자도 실제 검증과 같은 시간이 걸리도록 (응답 시간으로 아이디 존재 여부를 알 수 없게 함)
+        await self.run(Hash.verify_dummy, plain_password)
+        return False, None
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._semaphore = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "queue_timeout_sec": self.queue_timeout,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.snapshot(),
+            "hash_time": self.hash_time.snapshot(),
+        }
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS,
+    settings.PASSWORD_HASH_MAX_PENDING,
+    settings.PASSWORD_HASH_QUEUE_TIMEOUT,
+)
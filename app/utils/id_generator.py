@@ -0,0 +1,72 @@
+# utils/id_generator.py
+
+import os
+import threading
+import time
+from datetime import datetime
+from pytz import timezone
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+KST = timezone('Asia/Seoul')
+
+class SnowflakeIdGenerator:
+    """
+    DB 조회 없이 시간순으로 정렬되는 고유 ID 생성기 (Snowflake 방식의 10진 문자열)
+
+    형식: YYYYMMDDHHMMSS(KST) + mmm(밀리초) + 워커ID(5자리) + 시퀀스(3자리) = 25자리
+    - 기존 post_id(YYYYMMDDHHMMSS + 4자리 순번)와 앞 14자리 형식이 같으므로
+      문자열 정렬(post_id 역순 = 최신순) 및 커서 비교가 그대로 유지됨
+    - 같은 밀리초 안에서는 시퀀스를 증가시키고, 999를 넘으면 다음 밀리초를 미리 사용
+    - 시계가 뒤로 가더라도 마지막으로 사용한 밀리초 이후 값만 발급하여 순서/유일성 유지
+    """
+    MAX_SEQUENCE = 999
+
+    def __init__(self, worker_id: int):
+        if not 0 <= worker_id <= 99999:
+            raise ValueError("worker_id must be between 0 and 99999")
+        self.worker_id = worker_id
+        self.pid = os.getpid()
+        self._last_ms = -1
+        self._sequence = 0
+        self._lock = threading.Lock()  # DB 락이 아닌 프로세스 내 카운터 보호용
+
+    def _next_ms_and_sequence(self):
+        now_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            else:
+                self._sequence += 1
+                if self._sequence > self.MAX_SEQUENCE:
+                    self._last_ms += 1
+                    self._sequence = 0
+            return self._last_ms, self._sequence
+
+    def next_id(self) -> str:
+        ms, sequence = self._next_ms_and_sequence()
+        str_date = datetime.fromtimestamp(ms // 1000, KST).strftime('%Y%m%d%H%M%S')
+        return f"{str_date}{ms % 1000:03d}{self.worker_id:05d}{sequence:03d}"
+
+def lease_worker_id(db: Session) -> int:
+    """
+    * method:   lease_worker_id
+    * purpose:  DB 시퀀스(id_worker_seq, 0~99999 순환)에서 프로세스별 워커ID 발급
+                호스트/컨테이너/pid 와 무관하게 동시에 실행 중인 프로세스끼리 겹치지 않음
+                (한 프로세스가 살아 있는 동안 다른 프로세스가 10만 번 기동되어야 재사용됨)
+    """
+    return db.execute(text("SELECT nextval('id_worker_seq')")).scalar()
+
+_generator = None
+_generator_lock = threading.Lock()
+
+def next_post_id(db: Session) -> str:
+    global _generator
+
+    # fork 된 워커 프로세스마다 별도의 워커ID/시퀀스를 사용 (프로세스당 최초 1회만 DB 조회)
+    if _generator is None or _generator.pid != os.getpid():
+        with _generator_lock:
+            if _generator is None or _generator.pid != os.getpid():
+                _generator = SnowflakeIdGenerator(lease_worker_id(db))
+    return _generator.next_id()
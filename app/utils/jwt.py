@@ -1,7 +1,27 @@
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+from jose import jwt, JWTError, ExpiredSignatureError
 from core.config import settings
 from fastapi import HTTPException, status
+from utils.cache import register_cache
+
+# HS256 서명 키를 미리 넣어 둔 HMAC 객체 (검증 시 copy() 하여 키 패딩/해시 초기화 비용 생략)
+_hs256_signer = (
+    hmac.new(settings.SECRET_KEY.encode(), digestmod=hashlib.sha256)
+    if settings.SECRET_KEY and settings.ALGORITHM == "HS256" else None
+)
+
+# 토큰 종류 (type 클레임). 리프레시 토큰을 액세스 토큰으로 사용하는 것을 막음
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+# 검증된 액세스 토큰 캐시 (sha256(token) -> (uid, exp)), 토큰 만료 시각까지만 사용
+verified_token_cache = register_cache("jwt", settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60, settings.JWT_CACHE_MAX_SIZE)
 
 # 액세스 토큰 생성 함수
 def create_access_token(data: dict, expires_delta: timedelta = None):
@@ -10,7 +30,7 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=30)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "type": ACCESS_TOKEN_TYPE})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -21,10 +41,51 @@ def create_refresh_token(data: dict, expires_delta: timedelta = None):
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(days=7)  # 리프레시 토큰은 더 긴 만료 기간을 가짐
-    to_encode.update({"exp": expire})
+    # 같은 사용자가 같은 초에 발급받아도 토큰(해시)이 겹치지 않도록 고유 ID 추가
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(16), "type": REFRESH_TOKEN_TYPE})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+def decode_token(token: str) -> dict:
+    """
+    * method:   decode_token
+    * purpose:  토큰 서명 및 만료(exp) 검증 후 payload 반환. HS256 은 표준 라이브러리 hmac 으로 직접 검증
+                (그 외 알고리즘은 python-jose 사용), 실패 시 JWTError
+    """
+    if _hs256_signer is None:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    try:
+        signing_input, _, signature = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+        header = json.loads(_b64decode(header_segment))
+        if header.get("alg") != "HS256":
+            raise JWTError("The specified alg value is not allowed")
+
+        signer = _hs256_signer.copy()
+        signer.update(signing_input.encode())
+        if not hmac.compare_digest(signer.digest(), _b64decode(signature)):
+            raise JWTError("Signature verification failed.")
+
+        payload = json.loads(_b64decode(payload_segment))
+        if not isinstance(payload, dict):
+            raise JWTError("Invalid payload")
+        exp = payload.get("exp")
+        if exp is not None and float(exp) <= time.time():
+            raise ExpiredSignatureError("Signature has expired.")
+    except (ValueError, TypeError, AttributeError) as e:
+        raise JWTError(f"Invalid token: {e}")
+    return payload
+
+def token_type(payload: dict) -> str:
+    # type 클레임 추가 이전에 발급된 토큰은 jti 유무로 구분 (리프레시 토큰에만 jti 가 있음)
+    if "type" in payload:
+        return payload["type"]
+    return REFRESH_TOKEN_TYPE if "jti" in payload else ACCESS_TOKEN_TYPE
+
 # 액세스 토큰 확인 및 사용자 정보 가져오기 함수
 def verify_access_token(token: str):
     credentials_exception = HTTPException(
@@ -32,11 +93,24 @@ def verify_access_token(token: str):
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+    # 이미 검증한 토큰은 만료 시각만 확인 (워커별로 토큰당 서명 검증 1회)
+    key = hashlib.sha256(token.encode()).digest()
+    cached = verified_token_cache.get(key)
+    if cached is not None:
+        uid, exp = cached
+        if exp is None or exp > time.time():
+            return uid
+        verified_token_cache.invalidate(key)
+        raise credentials_exception
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         uid: str = payload.get("sub")
-        if uid is None:
+        if uid is None or token_type(payload) != ACCESS_TOKEN_TYPE:
             raise credentials_exception
+        exp = payload.get("exp")
+        verified_token_cache.set(key, (uid, float(exp) if exp is not None else None))
         return uid
     except JWTError:
         raise credentials_exception
@@ -49,9 +123,9 @@ def verify_refresh_token(token: str):
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         uid: str = payload.get("sub")
-        if uid is None:
+        if uid is None or token_type(payload) != REFRESH_TOKEN_TYPE:
             raise credentials_exception
         return uid
     except JWTError:
@@ -0,0 +1,58 @@
+# utils/metrics.py
+
+import bisect
+import threading
+from typing import Optional, Sequence
+
+# 기본 지연시간 버킷 (ms)
+DEFAULT_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+class Histogram:
+    """
+    고정 버킷 지연시간 히스토그램 (ms 단위, 스레드 안전)
+    버킷은 누적이 아닌 구간별 카운트이며 마지막 버킷(+Inf)은 상한 초과 값
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float):
+        index = bisect.bisect_left(self.buckets, value_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value_ms
+            if value_ms > self._max:
+                self._max = value_ms
+
+    def percentile(self, q: float) -> Optional[float]:
+        # 버킷 상한 기준 근사값 (+Inf 버킷이면 관측 최대값)
+        with self._lock:
+            counts, total, maximum = list(self._counts), self._count, self._max
+        if total == 0:
+            return None
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else maximum
+        return maximum
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts, total, total_sum, maximum = list(self._counts), self._count, self._sum, self._max
+        labels = [f"le_{bound}" for bound in self.buckets] + ["le_inf"]
+        return {
+            "count": total,
+            "avg_ms": round(total_sum / total, 3) if total else None,
+            "max_ms": round(maximum, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": dict(zip(labels, counts)),
+        }
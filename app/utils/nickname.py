@@ -1,19 +1,103 @@
-import httpx
 import asyncio
+import logging
 import random
+from collections import deque
+from typing import List, Optional
+from core.config import settings
+from utils.nickname_words import ADJECTIVES, NOUNS
 
-async def request(client: httpx.AsyncClient):
-    response = await client.post("https://www.rivestsoft.com/nickname/getRandomNickname.ajax")
-    return response
+logger = logging.getLogger(__name__)
 
-async def getNickname():
-    async with httpx.AsyncClient() as client:
-        
-        req = [request(client)]
-        result = await asyncio.gather(*req)
+_random = random.SystemRandom()
 
-        res_dict = result[0].json()
+def generate_nickname(suffix_digits: int = 3) -> str:
+    """
+    * method:   generate_nickname
+    * purpose:  번들된 단어 목록으로 닉네임 생성 (네트워크 사용 없음), suffix_digits 자리 숫자를 붙임
+    """
+    suffix = _random.randint(10 ** (suffix_digits - 1), 10 ** suffix_digits - 1)
+    return _random.choice(ADJECTIVES) + _random.choice(NOUNS) + str(suffix)
 
-        randN = random.randint(100, 999)
+class NicknamePool:
+    """
+    외부 닉네임 API 결과를 미리 받아 두는 풀 (워커별, url 이 설정된 경우에만 사용)
+    - 가입 요청은 풀에서 꺼내기만 하고 네트워크를 기다리지 않음 (풀이 비어 있으면 로컬 생성)
+    - 풀이 절반 이하로 줄면 백그라운드 작업이 공유 클라이언트(커넥션 재사용, 타임아웃)로 채움
+    """
+    def __init__(self, url: str, size: int, timeout: float):
+        self.url = url
+        self.size = size
+        self.timeout = timeout
+        self.fetched = 0
+        self.failures = 0
+        self.served = 0
+        self.fallbacks = 0
+        self._names = deque(maxlen=max(size, 1))
+        self._client = None
 
-        return res_dict['data'] + str(randN)
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url) and self.size > 0
+
+    def take(self) -> Optional[str]:
+        if not self._names:
+            self.fallbacks += 1
+            return None
+        self.served += 1
+        return self._names.popleft()
+
+    async def _fetch(self) -> str:
+        response = await self._client.post(self.url)
+        response.raise_for_status()
+        return response.json()["data"] + str(_random.randint(100, 999))
+
+    async def refill(self):
+        if not self.enabled or len(self._names) > self.size // 2:
+            return
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=httpx.Limits(max_connections=4))
+
+        results = await asyncio.gather(
+            *[self._fetch() for _ in range(self.size - len(self._names))], return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        for result in results:
+            if not isinstance(result, Exception) and len(result) <= 50:  # users.user_name 길이
+                self._names.append(result)
+                self.fetched += 1
+        if errors:
+            self.failures += len(errors)
+            logger.warning(f"Nickname prefetch failed ({len(errors)}/{len(results)}): {errors[0]!r}")
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "size": len(self._names),
+            "max_size": self.size,
+            "fetched": self.fetched,
+            "failures": self.failures,
+            "served": self.served,
+            "fallbacks": self.fallbacks,
+        }
+
+nickname_pool = NicknamePool(settings.NICKNAME_PREFETCH_URL, settings.NICKNAME_PREFETCH_SIZE, settings.NICKNAME_PREFETCH_TIMEOUT)
+
+def get_nickname_candidates(count: int) -> List[str]:
+    """
+    * method:   get_nickname_candidates
+    * purpose:  닉네임 후보 count 개 (첫 후보는 미리 받아 둔 풀에서, 나머지는 로컬 생성). 중복 확인은 user_service 에서 일괄 처리
+    """
+    names = []
+    if nickname_pool.enabled:
+        name = nickname_pool.take()
+        if name is not None:
+            names.append(name)
+    while len(names) < count:
+        names.append(generate_nickname())
+    return names
@@ -0,0 +1,18 @@
+# utils/nickname_words.py
+# 닉네임 생성용 단어 목록 (형용사 + 명사 + 숫자 3자리, 예: 포근한고양이123)
+
+ADJECTIVES = (
+    "포근한", "다정한", "용감한", "씩씩한", "상냥한", "느긋한", "부지런한", "명랑한", "수줍은", "당당한",
+    "졸린", "배고픈", "신나는", "행복한", "반짝이는", "말랑한", "보송한", "폭신한", "따뜻한", "시원한",
+    "귀여운", "똑똑한", "엉뚱한", "호기심많은", "잠꾸러기", "재빠른", "느릿한", "튼튼한", "작은", "커다란",
+    "동그란", "하얀", "까만", "노란", "분홍빛", "푸른", "초록빛", "달콤한", "고소한", "새침한",
+    "순한", "착한", "조용한", "수다스러운", "꿈꾸는", "노래하는", "춤추는", "산책하는", "뒹구는", "웃는",
+)
+
+NOUNS = (
+    "고양이", "강아지", "토끼", "햄스터", "고슴도치", "앵무새", "거북이", "다람쥐", "펭귄", "수달",
+    "판다", "여우", "곰돌이", "병아리", "오리", "부엉이", "돌고래", "코알라", "알파카", "라쿤",
+    "치즈냥", "고등어", "삼색이", "턱시도", "시바견", "푸들", "말티즈", "리트리버", "웰시코기", "비숑",
+    "꼬리", "발바닥", "젤리", "솜뭉치", "털뭉치", "꾹꾹이", "쫄보", "먹보", "뚱이", "콩이",
+    "구름", "별빛", "햇살", "단풍", "눈송이", "도토리", "복숭아", "감자", "고구마", "당근",
+)
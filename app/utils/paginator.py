@@ -1,105 +1,194 @@
-from typing import Generic, TypeVar, List, Optional
-from pydantic import BaseModel
+import base64
+import hashlib
+import hmac
+import json
+from datetime import date, datetime
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import and_, or_, tuple_
 from sqlalchemy.orm import Query
-import logging
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from core.config import settings
+from utils.error_code import ErrorCode, raise_error
 
 # 제네릭 타입 변수 정의
 ModelT = TypeVar("ModelT")  # 모델 타입을 제네릭하게 정의하기 위한 타입 변수
-FilterT = TypeVar("FilterT")  # 필터 타입을 제네릭하게 정의하기 위한 타입 변수
+
+DIRECTION_AFTER = "after"  # 정렬 순서 기준 다음 페이지
+DIRECTION_BEFORE = "before"  # 정렬 순서 기준 이전 페이지
 
 # 페이지네이션 결과를 담는 클래스 정의
-class Page(BaseModel):
-    model_name: str  # 모델의 이름을 저장하는 필드
-    items: List[dict]  # 직렬화된 결과 아이템 리스트
-    has_more: bool  # 다음 페이지 존재 여부
-    next_cursor: Optional[str]  # 다음 페이지를 조회하기 위한 커서 값 (없으면 None)
-
-# 페이지네이터 클래스 정의
-class Paginator(Generic[ModelT, FilterT]):
-    def __init__(self, model, query: Query):
+class Page(Generic[ModelT]):
+    def __init__(self, items: List[ModelT], has_more: bool, next_cursor: Optional[str], prev_cursor: Optional[str], depth: int = 0):
+        self.items = items  # 현재 페이지의 ORM 객체 리스트 (항상 정렬 순서대로)
+        self.has_more = has_more  # 요청한 방향으로 다음 페이지 존재 여부
+        self.next_cursor = next_cursor  # 다음 페이지를 조회하기 위한 커서 값 (없으면 None)
+        self.prev_cursor = prev_cursor  # 이전 페이지를 조회하기 위한 커서 값 (없으면 None)
+        self.depth = depth  # 첫 페이지로부터의 페이지 깊이 (첫 페이지 0)
+
+# 커서 값 직렬화 (datetime 등 JSON 비호환 타입 처리)
+def _dump_value(value: Any):
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    return value
+
+def _load_value(value: Any):
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$d" in value:
+            return date.fromisoformat(value["$d"])
+    return value
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(settings.SECRET_KEY.encode(), payload, hashlib.sha256).digest()[:16]
+
+def encode_cursor(sorts: Sequence[str], values: Sequence[Any], extra: Optional[dict] = None) -> str:
+    """
+    * method:   encode_cursor
+    * purpose:  정렬 키 값을 서명된 base64 커서 문자열로 변환 (클라이언트에는 불투명한 값)
+    """
+    body = {"s": ",".join(sorts), "v": [_dump_value(value) for value in values]}
+    if extra:
+        body.update(extra)
+    payload = json.dumps(body, separators=(",", ":")).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+def decode_cursor(cursor: str, sorts: Sequence[str]) -> dict:
+    """
+    * method:   decode_cursor
+    * purpose:  커서 서명 및 정렬 키를 검증하고 payload 반환. 잘못된 커서는 400 에러
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        if not hmac.compare_digest(_sign(payload), _b64decode(encoded_signature)):
+            raise ValueError("invalid cursor signature")
+        body = json.loads(payload)
+        if body.get("s") != ",".join(sorts) or len(body.get("v", [])) != len(sorts):
+            raise ValueError("cursor does not match sort keys")
+        body["v"] = [_load_value(value) for value in body["v"]]
+        return body
+    except (ValueError, TypeError, KeyError):
+        raise_error(ErrorCode.INVALID_CURSOR)
+
+def page_depth(body: Optional[dict], direction: str) -> int:
+    """
+    * method:   page_depth
+    * purpose:  요청한 페이지의 깊이 (커서에는 커서를 만든 페이지의 깊이 "p" 가 기록됨, 첫 페이지 0)
+    """
+    if not body:
+        return 0
+    depth = body.get("p", 0)
+    return depth + 1 if direction == DIRECTION_AFTER else max(depth - 1, 0)
+
+# 키셋(seek) 페이지네이터 클래스 정의
+class KeysetPaginator(Generic[ModelT]):
+    """
+    정렬 키 값 기준으로 WHERE 조건을 만들어 다음/이전 페이지를 조회
+    OFFSET을 사용하지 않으므로 페이지 깊이와 관계없이 (정렬 키 인덱스가 있을 때) 비용이 일정함
+    sorts 예시: ["-created_at", "-post_id"]  ('-' 는 내림차순, 마지막 키는 유일해야 함)
+    """
+    def __init__(self, model, query: Query, sorts: Sequence[str]):
+        if not sorts:
+            raise ValueError("KeysetPaginator requires at least one sort key")
         self.model = model  # 모델 클래스 설정
         self._query = query  # 주 쿼리 설정
+        self.sorts = list(sorts)
+        self._keys = [
+            (sort.lstrip("-"), getattr(model, sort.lstrip("-")), sort.startswith("-"))
+            for sort in self.sorts
+        ]
 
     # 페이지네이션 결과를 가져오는 메서드 정의
     def get_paginated_result(
         self,
         *,
         cursor: Optional[str] = None,  # 커서 값, 기본값은 None
-        filters: Optional[List[FilterT]] = None,  # 필터 리스트, 기본값은 None
-        sorts: Optional[List[str]] = None,  # 정렬 조건 리스트, 기본값은 None
         limit: int = 10,  # 한 번에 가져올 데이터의 수 제한, 기본값은 10
-        direction: str = "after"  # 페이지네이션 방향, 기본값은 "after"
-    ) -> Page:
-        logger.info(f"Type of limit at the beginning: {type(limit)}, value: {limit}")
-        primary_key_column = list(self.model.__mapper__.primary_key)[0]  # 첫 번째 기본 키 컬럼 가져오기
-        
-        # 정렬 조건이 있는 경우 쿼리에 정렬 적용
-        if sorts:
-            self._query = self.sort(sorts, self._query)
-
-        # 커서가 있는 경우 이후 또는 이전 데이터를 가져오기 위한 쿼리 설정
-        if cursor:
-            if direction == "after":
-                self._query = self._query.filter(self.model.primary_key_column > cursor)
-            else:
-                self._query = self._query.filter(self.model.primary_key_column < cursor)
-
-        # 필터가 있는 경우 필터를 쿼리에 적용
-        if filters:
-            for filter_ in filters:
-                self._query = self.skim_through(filter_=filter_)
+        direction: str = DIRECTION_AFTER  # 페이지네이션 방향, 기본값은 "after"
+    ) -> Page[ModelT]:
+        if direction not in (DIRECTION_AFTER, DIRECTION_BEFORE):
+            raise_error(ErrorCode.INVALID_DIRECTION)
+
+        forward = direction == DIRECTION_AFTER
+        query = self._query
+
+        # 커서가 있는 경우 커서 위치 이후(또는 이전) 데이터만 조회
+        body = decode_cursor(cursor, self.sorts) if cursor else None
+        if body:
+            query = query.filter(self._seek_filter(body["v"], forward))
+        depth = page_depth(body, direction)
 
+        # 정렬 적용 (이전 페이지 조회 시 역순으로 조회 후 뒤집음)
+        query = query.order_by(None).order_by(*self._order_by(forward))
 
         # limit + 1을 설정하여 다음 페이지의 존재 여부를 확인할 수 있게 함
-        items = self._query.limit(int(limit) + 1).all()
+        items = query.limit(int(limit) + 1).all()
         has_more = len(items) > limit
-
-        # 필요한 만큼의 데이터만 반환
         response_items = items[:limit]
-        next_cursor = response_items[-1].id if has_more else None
+        if not forward:
+            response_items.reverse()
+
+        first_cursor = self.cursor_for(response_items[0], depth) if response_items else None
+        last_cursor = self.cursor_for(response_items[-1], depth) if response_items else None
+
+        if forward:
+            next_cursor = last_cursor if has_more else None
+            prev_cursor = first_cursor if cursor else None
+        else:
+            next_cursor = last_cursor
+            prev_cursor = first_cursor if has_more else None
 
-        # 페이지 객체 생성하여 반환
         return Page(
-            model_name=self.model.__name__,
-            items=[item.__dict__ for item in response_items],  # 직렬화 가능한 데이터로 변환
+            items=response_items,
             has_more=has_more,
             next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            depth=depth,
         )
 
-    # 필터를 쿼리에 적용하는 메서드
-    def skim_through(self, filter_: FilterT, query: Optional[Query] = None) -> Query:
-        query = query or self._query  # 쿼리가 주어지지 않은 경우 기본 쿼리를 사용
-        return query.filter(filter_)
+    def cursor_for(self, item: ModelT, depth: Optional[int] = None) -> str:
+        extra = {"p": depth} if depth else None
+        return encode_cursor(self.sorts, [getattr(item, name) for name, _, _ in self._keys], extra)
+
+    # 정렬 조건 (방향에 따라 반전)
+    def _order_by(self, forward: bool):
+        return [
+            column.desc() if descending == forward else column.asc()
+            for _, column, descending in self._keys
+        ]
+
+    # 커서 위치 조건
+    def _seek_filter(self, values: List[Any], forward: bool):
+        columns = [column for _, column, _ in self._keys]
+        less_than = [descending == forward for _, _, descending in self._keys]
+
+        # 모든 키의 정렬 방향이 같으면 행 값 비교 (복합 인덱스 범위 스캔 가능)
+        if all(less_than):
+            return tuple_(*columns) < tuple_(*values)
+        if not any(less_than):
+            return tuple_(*columns) > tuple_(*values)
 
-    # 정렬 조건을 쿼리에 적용하는 메서드
-    def sort(self, sorts: List[str], query: Query) -> Query:
-        for sort in sorts:
-            if sort.startswith("-"):
-                query = query.order_by(getattr(self.model, sort[1:]).desc())  # 내림차순 정렬 적용
-            else:
-                query = query.order_by(getattr(self.model, sort).asc())  # 오름차순 정렬 적용
-        return query
+        # 정렬 방향이 섞여 있으면 (k1 > v1) OR (k1 = v1 AND k2 < v2) ... 형태로 전개
+        conditions = []
+        for index, column in enumerate(columns):
+            equals = [columns[i] == values[i] for i in range(index)]
+            compare = column < values[index] if less_than[index] else column > values[index]
+            conditions.append(and_(*equals, compare))
+        return or_(*conditions)
 
 # 사용 예시
-# from models import YourModel
-# from sqlalchemy.orm import session
-# query = session.query(YourModel)
-# paginator = Paginator(YourModel, query)
-# paginated_result = paginator.get_paginated_result(cursor="some_cursor", filters=[YourModel.some_field == 'value'], sorts=["-created_at"])
-
-# 새로운 페이지네이션 함수를 호출하는 라우트 예시
-# from fastapi import APIRouter, Depends
-# from sqlalchemy.orm import Session
-# from services.post_service import get_paginated_posts
-# router = APIRouter()
-# @router.get("/posts")
-# def get_posts_endpoint(cursor: Optional[str] = None, limit: int = 10, db: Session = Depends(get_db)):
-#     result = get_paginated_posts(db=db, cursor=cursor, limit=limit)
-#     return {
-#         "items": result["items"],
-#         "has_more": result["has_more"],
-#         "next_cursor": result["next_cursor"]
-#     }
+# from models.posts import Posts
+# query = db.query(Posts).filter(Posts.uid == uid)
+# paginator = KeysetPaginator(Posts, query, sorts=["-created_at", "-post_id"])
+# page = paginator.get_paginated_result(cursor=cursor, limit=10, direction="after")
+# page.items, page.has_more, page.next_cursor, page.prev_cursor
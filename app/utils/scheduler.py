@@ -0,0 +1,63 @@
+# utils/scheduler.py
+
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class PeriodicTask:
+    """
+    일정 간격(초)으로 실행되는 백그라운드 작업
+    동기 함수는 스레드에서, 코루틴 함수는 이벤트 루프에서 실행
+    """
+    def __init__(self, name: str, interval: float, func: Callable):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self):
+        if asyncio.iscoroutinefunction(self.func):
+            await self.func()
+        else:
+            # python 3.8 호환 (asyncio.to_thread 미지원)
+            await asyncio.get_running_loop().run_in_executor(None, self.func)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(f"Periodic task failed: {self.name}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+_tasks: List[PeriodicTask] = []
+
+def register_periodic(name: str, interval: float, func: Callable) -> PeriodicTask:
+    task = PeriodicTask(name, interval, func)
+    _tasks.append(task)
+    return task
+
+def start_periodic_tasks():
+    for task in _tasks:
+        task.start()
+
+async def stop_periodic_tasks():
+    for task in _tasks:
+        await task.stop()